@@ -0,0 +1,316 @@
+# Path: ffbPlayerDraftingApp/backend/backtest.py
+
+"""
+Backtesting and calibration of the blend weights against realized seasons.
+
+A backtest season pairs a preseason run (its players_with_ppg.json and
+weekly_scores.json, i.e. the projections and the prior season's history as
+they were before the draft) with that season's stored weekly scores, the
+"actuals" (see store_season). The stats and VOR scoring is replayed as of the
+preseason for many (weight_projection, weight_last_year, top_game_count)
+settings at once and scored against what actually happened:
+
+- spearman: rank correlation between the board's VOR and the realized VOR
+  of the players with an ADP;
+- drafted_points: realized season points of the players a league would
+  start (teams x starters), taken from the top of the board.
+
+Player boosts and mimics are opinions about the coming season and are left
+out; the league's positional penalties and weekly-floor weight are applied as
+on the real board.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from pydantic import ValidationError
+
+from backend.data_sources import historical
+from backend.logging_config import log, quiet_logs
+from backend.settings import LeagueConfig, settings
+from backend.storage.file_store import load_json, save_json
+from backend.transforms.adjustments import PlayerAdjustments
+from backend.transforms.compute_ppg import WEEKLY_QUANTILES, WeeklyScoreMatrix
+from backend.transforms.compute_vor import compute_vor
+from backend.transforms.resolve_identity import PlayerIdentityResolver
+from backend.transforms.scoring import score_players
+
+METRICS = ("spearman", "drafted_points")
+# Each search round evaluates a GRID_SIZE x GRID_SIZE grid of weights.
+GRID_SIZE = 21
+SEARCH_ROUNDS = 4
+WEIGHT_RANGE = (0.0, 1.0)
+
+
+def season_path(season: int) -> Path:
+    return settings.DATA_DIR / "seasons" / f"{season}_weekly.json"
+
+
+def store_season(season: int) -> Path:
+    """Scrapes a completed season's weekly scores and stores them as actuals."""
+    records = historical.fetch_weekly_records(season)
+    path = season_path(season)
+    save_json(path, records.to_dict(orient="records"))
+    return path
+
+
+@dataclass
+class BacktestSeason:
+    """One preseason board and what its players went on to score."""
+
+    label: str
+    players: pd.DataFrame
+    projected_ppg: np.ndarray
+    history: WeeklyScoreMatrix | None
+    top_n_avg: np.ndarray
+    floor_ppg: np.ndarray | None
+    on_board: np.ndarray
+    actual_points: np.ndarray
+
+
+def load_backtest_season(run_date: str, season: int) -> BacktestSeason:
+    """
+    Loads a preseason run and resolves the season's actual scores onto its
+    players. Players who never appear in the season scored 0 points.
+    """
+    run_dir = settings.DATA_DIR / run_date
+    players = pd.DataFrame(load_json(run_dir / "players_with_ppg.json"))
+    weekly_path = run_dir / "weekly_scores.json"
+    history = (
+        WeeklyScoreMatrix.from_score_lists(load_json(weekly_path))
+        if weekly_path.exists()
+        else None
+    )
+    if history is None:
+        log.warning(
+            "No weekly_scores.json for this run; top_game_count cannot be calibrated.",
+            extra={"run": run_date},
+        )
+
+    actuals = pd.DataFrame(load_json(season_path(season)))
+    resolver = PlayerIdentityResolver(players)
+    ids = resolver.resolve(
+        actuals["slug"].tolist(),
+        teams=actuals["team"].tolist(),
+        positions=actuals["position"].tolist(),
+        source_name=f"season-{season}",
+    )
+    season_points = [
+        sum(s for s in scores if s is not None) for scores in actuals["scores"]
+    ]
+    return BacktestSeason(
+        label=f"{run_date} -> {season}",
+        players=players,
+        projected_ppg=players["projected_ppg"].to_numpy(
+            dtype=np.float64, na_value=np.nan
+        ),
+        history=history,
+        top_n_avg=players["top_n_avg"].to_numpy(dtype=np.float64, na_value=np.nan),
+        floor_ppg=history.quantile(WEEKLY_QUANTILES["p10"]) if history else None,
+        on_board=players["adp"].notna().to_numpy(),
+        actual_points=resolver.align(ids, season_points, fill=0.0),
+    )
+
+
+def _average_ranks(values: np.ndarray) -> np.ndarray:
+    return pd.Series(values).rank(method="average").to_numpy()
+
+
+class Backtest:
+    """The backtest seasons compiled against one league config."""
+
+    def __init__(self, seasons: list[BacktestSeason], cfg: LeagueConfig):
+        self.seasons = seasons
+        self.cfg = cfg
+        starters = sum(cfg.roster.model_dump().values())
+        self._compiled = []
+        for season in seasons:
+            positions = season.players["position"]
+            penalties = PlayerAdjustments(
+                season.players["slug"], positions, cfg, apply_penalties=True
+            )
+            codes, uniques = pd.factorize(positions)
+            actual_vor, _ = compute_vor(
+                season.actual_points / cfg.games_divisor,
+                positions.to_numpy(dtype=object),
+                cfg.roster,
+                cfg.teams,
+            )
+            board_ranks = _average_ranks(actual_vor[season.on_board])
+            self._compiled.append(
+                {
+                    "positions": positions.to_numpy(dtype=object),
+                    "codes": codes,
+                    "n_positions": len(uniques),
+                    "penalty": penalties.penalty_multiplier,
+                    "centered_actual_ranks": board_ranks - board_ranks.mean(),
+                    "board_points": season.actual_points[season.on_board],
+                    "drafted": min(cfg.teams * starters, int(season.on_board.sum())),
+                }
+            )
+
+    @property
+    def weeks(self) -> int:
+        """Weeks of history every season has (0 if any lacks weekly_scores.json)."""
+        return min(
+            (s.history.scores.shape[1] if s.history else 0 for s in self.seasons),
+            default=0,
+        )
+
+    def evaluate(
+        self,
+        weight_projection: np.ndarray,
+        weight_last_year: np.ndarray,
+        top_game_count: int,
+    ) -> dict[str, np.ndarray]:
+        """
+        Scores a batch of weight settings under one top_game_count.
+
+        Args:
+            weight_projection / weight_last_year: One value per setting.
+            top_game_count: Games in the historical top-N average.
+
+        Returns:
+            Metric name -> one value per setting, averaged over the seasons.
+        """
+        weight_projection = np.asarray(weight_projection, dtype=np.float64)[:, None]
+        weight_last_year = np.asarray(weight_last_year, dtype=np.float64)[:, None]
+        totals = {metric: np.zeros(len(weight_projection)) for metric in METRICS}
+        for season, compiled in zip(self.seasons, self._compiled):
+            if season.history is not None:
+                top_n_avg = season.history.top_n_avg(
+                    top_game_count, self.cfg.min_historical_score
+                )
+                top_n_avg = np.where(top_n_avg == 0.0, np.nan, top_n_avg)
+            else:
+                top_n_avg = season.top_n_avg
+            scores = score_players(
+                season.projected_ppg,
+                top_n_avg,
+                compiled["codes"],
+                compiled["n_positions"],
+                weight_projection,
+                weight_last_year,
+                season.floor_ppg,
+                self.cfg.weight_floor,
+            ).score
+            vor, _ = compute_vor(
+                scores, compiled["positions"], self.cfg.roster, self.cfg.teams
+            )
+            board_vor = (vor * compiled["penalty"])[:, season.on_board]
+
+            # Spearman: Pearson correlation of the board's ranks with the
+            # realized ranks (ties in the realized VOR get average ranks).
+            order = np.argsort(-board_vor, axis=1, kind="stable")
+            ranks = np.empty_like(order, dtype=np.float64)
+            np.put_along_axis(
+                ranks, order, np.arange(order.shape[1], 0, -1, dtype=np.float64), axis=1
+            )
+            centered = ranks - ranks.mean(axis=1, keepdims=True)
+            actual = compiled["centered_actual_ranks"]
+            totals["spearman"] += (centered @ actual) / (
+                np.linalg.norm(centered, axis=1) * np.linalg.norm(actual)
+            )
+            drafted = order[:, : compiled["drafted"]]
+            totals["drafted_points"] += compiled["board_points"][drafted].sum(axis=1)
+        return {metric: total / len(self.seasons) for metric, total in totals.items()}
+
+    def calibrate(
+        self, metric: str, grid_size: int = GRID_SIZE, rounds: int = SEARCH_ROUNDS
+    ) -> dict:
+        """
+        Finds the settings that maximize a metric. The first round evaluates a
+        weight grid for every top_game_count; each later round zooms the grid
+        in around the best weights so far, one grid cell on either side.
+
+        Returns:
+            The recommended values, their metric and the number of settings
+            evaluated.
+        """
+        counts = range(1, self.weeks + 1) if self.weeks else [self.cfg.top_game_count]
+        low, high = np.full(2, WEIGHT_RANGE[0]), np.full(2, WEIGHT_RANGE[1])
+        best = None
+        evaluations = 0
+        for round_number in range(rounds):
+            axes = [np.linspace(low[i], high[i], grid_size) for i in range(2)]
+            grid_wp, grid_wl = (a.ravel() for a in np.meshgrid(*axes, indexing="ij"))
+            round_counts = counts if round_number == 0 else [best["top_game_count"]]
+            for top_game_count in round_counts:
+                values = self.evaluate(grid_wp, grid_wl, top_game_count)[metric]
+                evaluations += len(values)
+                i = int(np.argmax(values))
+                if best is None or values[i] > best[metric]:
+                    best = {
+                        "weight_projection": float(grid_wp[i]),
+                        "weight_last_year": float(grid_wl[i]),
+                        "top_game_count": int(top_game_count),
+                        metric: float(values[i]),
+                    }
+            step = (high - low) / (grid_size - 1)
+            center = np.array([best["weight_projection"], best["weight_last_year"]])
+            low = np.clip(center - step, *WEIGHT_RANGE)
+            high = np.clip(center + step, *WEIGHT_RANGE)
+        return {**best, "evaluations": evaluations}
+
+
+def run_backtest(
+    runs: list[tuple[str, int]],
+    metric: str = "spearman",
+    config_paths: list[Path] | None = None,
+) -> dict[str, dict]:
+    """
+    Calibrates every league config against the backtest seasons, prints the
+    recommendations and saves them to calibration.json in the data directory.
+
+    Args:
+        runs: (preseason run date, season) pairs, e.g. ("2024-08-25", 2024).
+        metric: One of METRICS.
+        config_paths: League config files; defaults to every league_config*.json.
+    """
+    if metric not in METRICS:
+        raise ValueError(f"Unknown metric '{metric}'. Use one of {list(METRICS)}.")
+    if not runs:
+        raise ValueError("A backtest needs at least one --run DATE=SEASON.")
+    config_paths = config_paths or sorted(settings.BASE_DIR.glob("league_config*.json"))
+
+    with quiet_logs():
+        seasons = [load_backtest_season(date, season) for date, season in runs]
+        recommendations = {}
+        for path in config_paths:
+            try:
+                cfg = LeagueConfig(**load_json(path))
+            except ValidationError as e:
+                print(
+                    f"{path.name}: skipped, the config does not validate ({e.error_count()} errors)."
+                )
+                continue
+            backtest = Backtest(seasons, cfg)
+            current = backtest.evaluate(
+                [cfg.weight_projection], [cfg.weight_last_year], cfg.top_game_count
+            )
+            recommended = backtest.calibrate(metric)
+            recommendations[path.name] = {
+                "current": {
+                    "weight_projection": cfg.weight_projection,
+                    "weight_last_year": cfg.weight_last_year,
+                    "top_game_count": cfg.top_game_count,
+                    metric: float(current[metric][0]),
+                },
+                "recommended": recommended,
+            }
+
+    print(f"Backtest over {[s.label for s in seasons]}, metric: {metric}")
+    print(
+        f"{'league config':<30} {'':<12} {'w_proj':>7} {'w_last':>7} {'top_n':>6} {metric:>15}"
+    )
+    for name, result in recommendations.items():
+        for label, values in result.items():
+            print(
+                f"{name if label == 'current' else '':<30} {label:<12} "
+                f"{values['weight_projection']:>7.3f} {values['weight_last_year']:>7.3f} "
+                f"{values['top_game_count']:>6} {values[metric]:>15.4f}"
+            )
+    save_json(settings.DATA_DIR / "calibration.json", recommendations)
+    return recommendations
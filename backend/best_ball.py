@@ -0,0 +1,194 @@
+# Path: ffbPlayerDraftingApp/backend/best_ball.py
+
+"""
+Best-ball value: how many points a player would have added to a roster's
+optimal weekly lineups last season.
+
+In best ball the lineup is set after the fact: each week the roster's best
+scores fill the starting slots. With FLEX open to RB, WR and TE, the optimal
+lineup is greedy per week: each position's dedicated slots take its top
+scores, then FLEX takes the best of the leftovers. A missed week counts as
+zero points; an empty slot scores nothing.
+
+marginal_points evaluates every candidate at once. The roster's ranked top
+scores per position and week are computed once; a candidate only changes
+its own position's ranking, so each position's candidates are merged into
+that ranking as a (candidates, depth, weeks) array and the lineups are
+rescored together. best_ball_board runs it over the board for a run's
+weekly_scores.json, fast enough to rerun after every pick.
+
+Rookies have no weekly history and therefore no best-ball value here.
+"""
+
+import numpy as np
+import pandas as pd
+
+from backend.constants import FLEX_POSITIONS
+from backend.settings import RosterSettings, settings
+from backend.storage.file_store import load_json
+from backend.transforms.compute_ppg import load_weekly_scores
+
+# Positions with dedicated lineup slots, in RosterSettings order.
+LINEUP_POSITIONS = [pos for pos in RosterSettings.model_fields if pos != "FLEX"]
+
+
+def _ranked(scores: np.ndarray, depth: int) -> np.ndarray:
+    """The top `depth` scores per week in descending order, padded with -inf."""
+    missing = depth - scores.shape[-2]
+    if missing > 0:
+        padding = np.full((*scores.shape[:-2], missing, scores.shape[-1]), -np.inf)
+        scores = np.concatenate([scores, padding], axis=-2)
+    return -np.sort(-scores, axis=-2)[..., :depth, :]
+
+
+def _filled(slots: np.ndarray) -> np.ndarray:
+    """The points of a (..., slots, weeks) block of started scores; -inf is empty."""
+    return np.where(np.isfinite(slots), slots, 0.0).sum(axis=-2)
+
+
+def _depths(roster: RosterSettings) -> dict[str, int]:
+    """How many of a position's top scores can reach the lineup each week."""
+    return {
+        pos: getattr(roster, pos) + (roster.FLEX if pos in FLEX_POSITIONS else 0)
+        for pos in LINEUP_POSITIONS
+    }
+
+
+def _lineup_points(ranked: dict[str, np.ndarray], roster: RosterSettings) -> np.ndarray:
+    """Weekly points of the optimal lineup, given each position's ranked scores."""
+    total = 0.0
+    leftovers = []
+    for pos, top in ranked.items():
+        slots = getattr(roster, pos)
+        total = total + _filled(top[..., :slots, :])
+        if pos in FLEX_POSITIONS:
+            leftovers.append(top[..., slots:, :])
+    if roster.FLEX:
+        batch = np.broadcast_shapes(*(block.shape[:-2] for block in leftovers))
+        pool = np.concatenate(
+            [np.broadcast_to(block, batch + block.shape[-2:]) for block in leftovers],
+            axis=-2,
+        )
+        total = total + _filled(_ranked(pool, roster.FLEX))
+    return total
+
+
+def lineup_points(
+    weekly: np.ndarray, positions: np.ndarray, roster: RosterSettings
+) -> np.ndarray:
+    """
+    A roster's optimal best-ball points for each week.
+
+    Args:
+        weekly: The roster's (players, weeks) scores, NaN for missed weeks.
+        positions: Each player's position.
+        roster: Starting slots per position.
+
+    Returns:
+        A (weeks,) array of lineup points.
+    """
+    weekly = np.nan_to_num(weekly, nan=0.0)
+    depths = _depths(roster)
+    return _lineup_points(
+        {
+            pos: _ranked(weekly[positions == pos], depths[pos])
+            for pos in LINEUP_POSITIONS
+        },
+        roster,
+    )
+
+
+def marginal_points(
+    weekly: np.ndarray,
+    positions: np.ndarray,
+    roster: RosterSettings,
+    picks: np.ndarray,
+    candidates: np.ndarray,
+) -> np.ndarray:
+    """
+    The weekly points each candidate adds to a roster's optimal lineups.
+
+    Args:
+        weekly: The (players, weeks) scores of the whole pool, NaN for missed
+            weeks.
+        positions: Each pool player's position.
+        roster: Starting slots per position.
+        picks: Pool indices of the players already on the roster.
+        candidates: Pool indices of the players to evaluate.
+
+    Returns:
+        A (candidates, weeks) array: the lineup's points with the candidate
+        added minus its points without.
+    """
+    weekly = np.nan_to_num(weekly, nan=0.0)
+    depths = _depths(roster)
+    base = {
+        pos: _ranked(weekly[picks[positions[picks] == pos]], depths[pos])
+        for pos in LINEUP_POSITIONS
+    }
+    base_points = _lineup_points(base, roster)
+
+    gain = np.zeros((len(candidates), weekly.shape[1]))
+    for pos in LINEUP_POSITIONS:
+        group = positions[candidates] == pos
+        if not depths[pos] or not group.any():
+            continue
+        merged = np.concatenate(
+            [
+                np.broadcast_to(base[pos], (int(group.sum()), *base[pos].shape)),
+                weekly[candidates[group], None, :],
+            ],
+            axis=1,
+        )
+        gain[group] = (
+            _lineup_points({**base, pos: _ranked(merged, depths[pos])}, roster)
+            - base_points
+        )
+    return gain
+
+
+def best_ball_board(
+    date_str: str, picks: list[str], taken: list[str] | None = None
+) -> pd.DataFrame:
+    """
+    The board ranked by best-ball value for a roster.
+
+    Args:
+        date_str: The run whose players_with_ppg.json and weekly_scores.json
+            are used.
+        picks: Slugs of the players on the roster.
+        taken: Slugs of players drafted by other teams; they are not listed.
+
+    Returns:
+        One row per available board player: 'marginal_points' over last
+        season and 'lineup_rate', the share of weeks the player would have
+        improved the optimal lineup, sorted by marginal points.
+    """
+    data_dir = settings.DATA_DIR / date_str
+    players = pd.DataFrame(load_json(data_dir / "players_with_ppg.json"))
+    history = load_weekly_scores(data_dir, len(players))
+    unknown = sorted((set(picks) | set(taken or ())) - set(players["slug"]))
+    if unknown:
+        raise ValueError(f"Unknown player slugs: {', '.join(unknown)}.")
+
+    slugs = players["slug"]
+    pick_idx = np.flatnonzero(slugs.isin(picks).to_numpy())
+    available = players["adp"].notna() & ~slugs.isin(picks) & ~slugs.isin(taken or [])
+    candidate_idx = np.flatnonzero(available.to_numpy())
+    gain = marginal_points(
+        history.scores,
+        players["position"].to_numpy(dtype=object),
+        settings.league_config.roster,
+        pick_idx,
+        candidate_idx,
+    )
+
+    board = players.iloc[candidate_idx][
+        ["slug", "first_name", "last_name", "team", "position", "adp"]
+    ].assign(
+        marginal_points=gain.sum(axis=1).round(1),
+        lineup_rate=(gain > 0).mean(axis=1).round(3),
+    )
+    return board.sort_values(
+        ["marginal_points", "adp"], ascending=[False, True], kind="stable"
+    ).reset_index(drop=True)
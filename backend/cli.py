@@ -2,13 +2,16 @@
 
 """Command-Line Interface for the Fantasy Football Backend."""
 
+import datetime
 import sys
+from pathlib import Path
 
 import click
 
 # The import paths are now relative to the 'backend' directory, which is
 # the root of our application when running with `python -m backend.cli`.
 from backend.logging_config import log
+from backend.pipelines.bootstrap import DEFAULT_SAMPLES, run_bootstrap
 from backend.pipelines.clean import run_clean
 from backend.pipelines.enrich import run_enrich
 from backend.pipelines.ingest import run_ingest
@@ -23,12 +26,32 @@ from backend.pipelines.vor import run_vor
     default=None,
     help="The date for the run in 'YYYY-MM-DD' format. Defaults to today.",
 )
+@click.option(
+    "--engine",
+    type=click.Choice(["pandas", "polars"]),
+    default="pandas",
+    show_default=True,
+    help="Dataframe engine for the enrich, stats and VOR phases.",
+)
 @click.pass_context
-def cli(ctx, date):
+def cli(ctx, date, engine):
     """A CLI for the fantasy football data pipeline."""
     # The context object (ctx.obj) is a dictionary that we can use to pass
     # state (like the date) to subcommands.
-    ctx.obj = {"date": date}
+    ctx.obj = {"date": date, "engine": engine}
+
+
+def stage(ctx, name: str):
+    """The run function of a phase for the selected engine."""
+    if ctx.obj["engine"] == "polars":
+        try:
+            from backend.pipelines import polars_engine
+        except ImportError as e:
+            raise click.UsageError(
+                f"The polars engine needs the 'polars' package ({e})."
+            ) from e
+        return getattr(polars_engine, f"run_{name}")
+    return {"enrich": run_enrich, "stats": run_stats, "vor": run_vor}[name]
 
 
 @cli.command()
@@ -61,7 +84,7 @@ def enrich(ctx):
     """Phase 3: Enrich players with ADP and projection data."""
     log.info("CLI: Running enrich phase.")
     try:
-        run_enrich(date_str=ctx.obj["date"])
+        stage(ctx, "enrich")(date_str=ctx.obj["date"])
     except Exception:
         log.exception("CLI: Enrich phase failed.")
         sys.exit(1)
@@ -73,7 +96,7 @@ def stats(ctx):
     """Phase 4: Calculate the composite 'expected_ppg' score."""
     log.info("CLI: Running stats phase.")
     try:
-        run_stats(date_str=ctx.obj["date"])
+        stage(ctx, "stats")(date_str=ctx.obj["date"])
     except Exception:
         log.exception("CLI: Stats phase failed.")
         sys.exit(1)
@@ -85,15 +108,501 @@ def vor(ctx):
     """Phase 5: Calculate VOR and produce the final ranked list."""
     log.info("CLI: Running VOR phase.")
     try:
-        run_vor(date_str=ctx.obj["date"])
+        stage(ctx, "vor")(date_str=ctx.obj["date"])
     except Exception:
         log.exception("CLI: VOR phase failed.")
         sys.exit(1)
 
 
+@cli.command()
+@click.option("--samples", type=int, default=DEFAULT_SAMPLES, show_default=True)
+@click.option("--seed", type=int, default=0, show_default=True)
+@click.pass_context
+def bootstrap(ctx, samples, seed):
+    """Optional phase: VOR and rank intervals by resampling weeks and projections."""
+    log.info("CLI: Running bootstrap phase.")
+    try:
+        run_bootstrap(date_str=ctx.obj["date"], samples=samples, seed=seed)
+    except Exception:
+        log.exception("CLI: Bootstrap phase failed.")
+        sys.exit(1)
+
+
+@cli.command("match-bench")
+@click.option(
+    "--pool-size",
+    "pool_sizes",
+    multiple=True,
+    type=int,
+    help="Synthetic pool size to benchmark. Repeat for several sizes.",
+)
+@click.pass_context
+def match_bench(ctx, pool_sizes):
+    """Score the player-name matchers for accuracy and throughput."""
+    from backend.match_harness import DEFAULT_POOL_SIZES, run_match_harness
+
+    log.info("CLI: Running match harness.")
+    try:
+        run_match_harness(
+            date_str=ctx.obj["date"], pool_sizes=pool_sizes or DEFAULT_POOL_SIZES
+        )
+    except Exception:
+        log.exception("CLI: Match harness failed.")
+        sys.exit(1)
+
+
+@cli.command()
+@click.option(
+    "--param",
+    "params",
+    multiple=True,
+    metavar="NAME=VALUES",
+    help=(
+        "A parameter and its values: '0.7', '0.5,0.6,0.8' or start:stop:count "
+        "('0.5:1.0:6'). NAME is weight_projection, weight_last_year, "
+        "boost_small/medium/large/max or penalty_<POSITION>. Repeatable."
+    ),
+)
+@click.option(
+    "--samples",
+    type=int,
+    default=None,
+    help="Draw this many random settings within the ranges instead of the full grid.",
+)
+@click.option("--seed", type=int, default=0, show_default=True)
+@click.option("--top-n", type=int, default=24, show_default=True)
+@click.pass_context
+def sweep(ctx, params, samples, seed, top_n):
+    """Re-rank a run's players under many scoring settings at once."""
+    from backend.sweep import parse_grid, run_sweep
+
+    log.info("CLI: Running parameter sweep.")
+    try:
+        grids = {}
+        for param in params:
+            name, _, values = param.partition("=")
+            grids[name.strip()] = parse_grid(values)
+        run_sweep(
+            date_str=ctx.obj["date"] or datetime.date.today().isoformat(),
+            grids=grids,
+            samples=samples,
+            seed=seed,
+            top_n=top_n,
+        )
+    except Exception:
+        log.exception("CLI: Parameter sweep failed.")
+        sys.exit(1)
+
+
+def _parse_starters(specs: tuple[str, ...]) -> dict[str, str]:
+    """Splits repeated POSITION=VALUES options into a dict."""
+    starters = {}
+    for spec in specs:
+        pos, _, values = spec.partition("=")
+        starters[pos.strip().upper()] = values
+    return starters
+
+
+@cli.command("league-shapes")
+@click.option(
+    "--teams",
+    "teams_spec",
+    default=None,
+    help="Team counts: '12', '10,12,14' or start:stop:count ('8:14:4').",
+)
+@click.option(
+    "--starters",
+    "starter_specs",
+    multiple=True,
+    metavar="POSITION=VALUES",
+    help="Starter counts for a roster position, e.g. WR=2,3 or FLEX=0:2:3. Repeatable.",
+)
+@click.pass_context
+def league_shapes(ctx, teams_spec, starter_specs):
+    """Precompute VOR and rank for a grid of league shapes."""
+    from backend.league_shapes import parse_counts, run_league_shapes
+
+    log.info("CLI: Building league-shape cube.")
+    try:
+        run_league_shapes(
+            date_str=ctx.obj["date"] or datetime.date.today().isoformat(),
+            teams=parse_counts(teams_spec) if teams_spec else None,
+            starters={
+                pos: parse_counts(values)
+                for pos, values in _parse_starters(starter_specs).items()
+            },
+        )
+    except Exception:
+        log.exception("CLI: League-shape cube failed.")
+        sys.exit(1)
+
+
+@cli.command()
+@click.option("--teams", type=int, default=None, help="Team count (default: config).")
+@click.option(
+    "--starters",
+    "starter_specs",
+    multiple=True,
+    metavar="POSITION=COUNT",
+    help="Starters for a roster position, e.g. WR=3. Repeatable.",
+)
+@click.option("--top", type=int, default=25, show_default=True)
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Also write the shape's board here, in players_final.json's format.",
+)
+@click.pass_context
+def shape(ctx, teams, starter_specs, top, output):
+    """Show the board for one league shape from the league-shape cube."""
+    from backend.league_shapes import query_shape
+    from backend.storage.file_store import save_json
+
+    try:
+        starters = {
+            pos: int(count) for pos, count in _parse_starters(starter_specs).items()
+        }
+        board = query_shape(
+            ctx.obj["date"] or datetime.date.today().isoformat(), teams, starters
+        )
+        print(
+            f"{'rank':>4} {'player':<28} {'pos':<4} {'team':<4} {'adp':>6} {'vor':>7}"
+        )
+        for player in board[:top]:
+            print(
+                f"{player['id']:>4} {player['name']:<28} {player['position']:<4} "
+                f"{player['team'] or '':<4} {player['adp']:>6} {player['vor']:>7}"
+            )
+        if output:
+            save_json(output, board)
+    except Exception:
+        log.exception("CLI: League-shape query failed.")
+        sys.exit(1)
+
+
 @cli.command()
 @click.pass_context
-def all(ctx):
+def correlations(ctx):
+    """Build the weekly score correlation matrix of the board."""
+    from backend.correlations import run_correlations
+
+    log.info("CLI: Building weekly correlation matrix.")
+    try:
+        run_correlations(ctx.obj["date"] or datetime.date.today().isoformat())
+    except Exception:
+        log.exception("CLI: Weekly correlation matrix failed.")
+        sys.exit(1)
+
+
+@cli.command()
+@click.option(
+    "--player",
+    "slugs",
+    multiple=True,
+    required=True,
+    help="A player slug. Once: their most correlated players; repeated: a roster.",
+)
+@click.option("--top", type=int, default=5, show_default=True)
+@click.option("--all-teams", is_flag=True, help="Also list players on other teams.")
+@click.pass_context
+def correlated(ctx, slugs, top, all_teams):
+    """Query the weekly correlation matrix: stacks for one player, or a roster."""
+    from backend.correlations import CorrelationMatrix
+
+    try:
+        matrix = CorrelationMatrix.load(
+            ctx.obj["date"] or datetime.date.today().isoformat()
+        )
+        if len(slugs) == 1:
+            rows = matrix.most_correlated(
+                slugs[0], top=top, teammates_only=not all_teams
+            )
+            print(f"{'player':<28} {'pos':<4} {'team':<4} {'corr':>6} {'weeks':>6}")
+            for row in rows.itertuples():
+                print(
+                    f"{row.name:<28} {row.position:<4} {row.team:<4} "
+                    f"{row.corr:>6.3f} {row.shared_weeks:>6}"
+                )
+            return
+        roster = matrix.roster_correlation(list(slugs))
+        for pair in roster["pairs"][:top]:
+            print(f"{' + '.join(pair['players']):<50} {pair['corr']:>6.3f}")
+        mean = roster["mean_correlation"]
+        print(f"Mean pairwise correlation: {'n/a' if mean is None else f'{mean:.3f}'}")
+        print(
+            f"Weekly std of the combined score: {roster['combined_std']:.2f} "
+            f"(independent: {roster['independent_std']:.2f})"
+        )
+    except Exception:
+        log.exception("CLI: Correlation query failed.")
+        sys.exit(1)
+
+
+@cli.command("best-ball")
+@click.option(
+    "--pick",
+    "picks",
+    multiple=True,
+    metavar="SLUG",
+    help="A player on your roster. Repeatable.",
+)
+@click.option(
+    "--taken",
+    multiple=True,
+    metavar="SLUG",
+    help="A player drafted by another team. Repeatable.",
+)
+@click.option("--top", type=int, default=25, show_default=True)
+@click.pass_context
+def best_ball(ctx, picks, taken, top):
+    """Rank the board by the best-ball points each player adds to your roster."""
+    from backend.best_ball import best_ball_board
+
+    try:
+        board = best_ball_board(
+            ctx.obj["date"] or datetime.date.today().isoformat(),
+            list(picks),
+            list(taken),
+        )
+        print(
+            f"{'player':<28} {'pos':<4} {'team':<4} {'adp':>6} {'points':>7} {'weeks':>6}"
+        )
+        for player in board.head(top).itertuples():
+            print(
+                f"{player.first_name + ' ' + player.last_name:<28} "
+                f"{player.position:<4} {player.team or '':<4} {player.adp:>6} "
+                f"{player.marginal_points:>7} {player.lineup_rate:>6.0%}"
+            )
+    except Exception:
+        log.exception("CLI: Best-ball ranking failed.")
+        sys.exit(1)
+
+
+@cli.command("simulate-draft")
+@click.option("--slot", type=int, required=True, help="Your 1-based draft slot.")
+@click.option(
+    "--sims",
+    type=int,
+    default=20_000,
+    show_default=True,
+    help="Snake drafts to simulate.",
+)
+@click.option(
+    "--rounds",
+    type=int,
+    default=None,
+    help="Rounds in the draft. Defaults to the roster's starting slots.",
+)
+@click.option("--seed", type=int, default=0, show_default=True)
+@click.option("--top", type=int, default=40, show_default=True)
+@click.pass_context
+def simulate_draft(ctx, slot, sims, rounds, seed, top):
+    """Estimate how likely each player is to be available at your picks."""
+    from backend.draft_sim import run_draft_simulation
+
+    try:
+        board = run_draft_simulation(
+            ctx.obj["date"] or datetime.date.today().isoformat(),
+            slot,
+            sims,
+            rounds,
+            seed,
+        )
+        pick_columns = [c for c in board.columns if c.startswith("pick_")][:4]
+        print(
+            f"{'player':<28} {'pos':<4} {'adp':>6} "
+            + " ".join(f"{c:>8}" for c in pick_columns)
+        )
+        for _, player in board.sort_values("adp").head(top).iterrows():
+            print(
+                f"{player['name']:<28} {player['position']:<4} {player['adp']:>6} "
+                + " ".join(f"{player[c]:>8.0%}" for c in pick_columns)
+            )
+    except Exception:
+        log.exception("CLI: Draft simulation failed.")
+        sys.exit(1)
+
+
+@cli.command()
+@click.option("--slot", type=int, required=True, help="Your 1-based draft slot.")
+@click.option(
+    "--rounds",
+    type=int,
+    default=None,
+    help="Rounds in the draft. Defaults to the roster's starting slots.",
+)
+@click.option("--alternates", type=int, default=3, show_default=True)
+@click.option(
+    "--simulated",
+    is_flag=True,
+    help="Use simulate-draft's availability instead of the ADP model.",
+)
+@click.pass_context
+def plan(ctx, slot, rounds, alternates, simulated):
+    """Plan which position to take in each round from your draft slot."""
+    from backend.draft_plan import BENCH_WEIGHT, draft_plan
+
+    try:
+        plans = draft_plan(
+            ctx.obj["date"] or datetime.date.today().isoformat(),
+            slot,
+            rounds,
+            alternates,
+            simulated,
+        )
+        total, best = plans[0]
+        print(f"{'round':>5} {'pick':>5} {'pos':<4} {'role':<8} {'exp vor':>8}  target")
+        for row in best.itertuples():
+            print(
+                f"{row.round:>5} {row.pick:>5} {row.position:<4} {row.role:<8} "
+                f"{row.expected_vor:>8.2f}  {row.target or ''}"
+            )
+        print(f"Plan value (bench at {BENCH_WEIGHT:.0%}): {total:.2f}")
+        for i, (value, alternate) in enumerate(plans[1:], start=1):
+            print(
+                f"Alternate {i} ({value - total:+.2f}): "
+                + "-".join(alternate["position"])
+            )
+    except Exception:
+        log.exception("CLI: Draft planning failed.")
+        sys.exit(1)
+
+
+@cli.command("live-draft")
+@click.option(
+    "--pick",
+    "picks",
+    multiple=True,
+    metavar="SLUG",
+    help="A player already drafted, by anyone, in pick order. Repeatable.",
+)
+@click.option("--top", type=int, default=20, show_default=True)
+@click.pass_context
+def live_draft(ctx, picks, top):
+    """Track VOR live during a draft, as replacement levels move with each pick.
+
+    After the --pick players, reads one command per line from stdin: a
+    drafted player's slug, 'undo' or 'quit'.
+    """
+    from backend.live_vor import load_live_draft
+
+    try:
+        engine, players = load_live_draft(
+            ctx.obj["date"] or datetime.date.today().isoformat()
+        )
+    except Exception:
+        log.exception("CLI: Loading the live draft failed.")
+        sys.exit(1)
+    index = {slug: i for i, slug in enumerate(players["slug"])}
+    names = (players["first_name"] + " " + players["last_name"]).tolist()
+
+    def show():
+        levels = " ".join(f"{pos} {level:.2f}" for pos, level in engine.levels.items())
+        print(f"After {len(engine.history)} picks. Replacement levels: {levels}")
+        print(f"{'player':<28} {'pos':<4} {'adp':>6} {'vor':>7}")
+        for i, vor in engine.best_available(top):
+            print(
+                f"{names[i]:<28} {players['position'].iat[i]:<4} "
+                f"{players['adp'].iat[i]:>6} {vor:>7.2f}"
+            )
+
+    def draft(slug):
+        if slug not in index:
+            print(f"Unknown player slug: {slug}.")
+        elif not engine.remaining[index[slug]]:
+            print(f"{slug} has already been drafted.")
+        else:
+            engine.pick(index[slug])
+            return True
+        return False
+
+    for slug in picks:
+        draft(slug)
+    show()
+    print("Enter a drafted player's slug, 'undo' or 'quit'.")
+    for line in click.get_text_stream("stdin"):
+        command = line.strip()
+        if command == "quit":
+            break
+        if command == "undo":
+            if not engine.history:
+                print("No pick to undo.")
+                continue
+            print(f"Undid {players['slug'].iat[engine.undo()]}.")
+            show()
+        elif command and draft(command):
+            show()
+
+
+@cli.command("fetch-season")
+@click.option(
+    "--season", type=int, required=True, help="A completed season, e.g. 2024."
+)
+def fetch_season(season):
+    """Store a completed season's weekly scores as backtest actuals."""
+    from backend.backtest import store_season
+
+    log.info("CLI: Fetching season weekly scores.", extra={"season": season})
+    try:
+        path = store_season(season)
+        log.info("CLI: Season stored.", extra={"path": str(path)})
+    except Exception:
+        log.exception("CLI: Fetching the season failed.")
+        sys.exit(1)
+
+
+@cli.command()
+@click.option(
+    "--run",
+    "runs",
+    multiple=True,
+    required=True,
+    metavar="DATE=SEASON",
+    help=(
+        "A preseason run directory and the season it preceded, "
+        "e.g. 2024-08-25=2024. Repeatable."
+    ),
+)
+@click.option(
+    "--metric",
+    type=click.Choice(["spearman", "drafted_points"]),
+    default="spearman",
+    show_default=True,
+)
+@click.option(
+    "--config",
+    "config_paths",
+    multiple=True,
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="League config to calibrate (default: every league_config*.json). Repeatable.",
+)
+def backtest(runs, metric, config_paths):
+    """Calibrate the blend weights against realized seasons."""
+    from backend.backtest import run_backtest
+
+    log.info("CLI: Running backtest.")
+    try:
+        pairs = []
+        for run in runs:
+            date, _, season = run.partition("=")
+            pairs.append((date.strip(), int(season)))
+        run_backtest(pairs, metric=metric, config_paths=list(config_paths) or None)
+    except Exception:
+        log.exception("CLI: Backtest failed.")
+        sys.exit(1)
+
+
+@cli.command()
+@click.option(
+    "--bootstrap",
+    "bootstrap_samples",
+    type=int,
+    default=0,
+    help="Also run the bootstrap phase with this many samples.",
+)
+@click.pass_context
+def all(ctx, bootstrap_samples):
     """Run all pipeline phases in sequence: Ingest -> Clean -> Enrich -> Stats -> VOR."""
     log.info("CLI: Running all pipeline phases.")
     date = ctx.obj["date"]
@@ -105,13 +614,17 @@ def all(ctx):
         run_clean(date_str=date)
 
         log.info("--- Phase 3: Enrich ---")
-        run_enrich(date_str=date)
+        stage(ctx, "enrich")(date_str=date)
 
         log.info("--- Phase 4: Stats ---")
-        run_stats(date_str=date)
+        stage(ctx, "stats")(date_str=date)
 
         log.info("--- Phase 5: VOR ---")
-        run_vor(date_str=date)
+        stage(ctx, "vor")(date_str=date)
+
+        if bootstrap_samples:
+            log.info("--- Bootstrap ---")
+            run_bootstrap(date_str=date, samples=bootstrap_samples)
 
         log.info("CLI: All phases completed successfully.")
 
@@ -5,3 +5,35 @@
 # This file is intentionally sparse. Most configuration is handled by
 # settings.py loading league_config.json. This is a placeholder for any
 # truly universal constants that might arise.
+
+# External sources label team defenses "DST"; Sleeper (our canonical source) uses "DEF".
+SOURCE_POSITION_ALIASES = {"DST": "DEF", "D/ST": "DEF", "PK": "K"}
+
+
+def canonical_position(position: str | None) -> str | None:
+    """Maps a source-specific position label onto Sleeper's vocabulary."""
+    if not isinstance(position, str) or not position:
+        return None  # Also covers NaN from DataFrame columns.
+    position = position.upper()
+    return SOURCE_POSITION_ALIASES.get(position, position)
+
+
+# Team codes as printed by external sources, including free agents.
+NFL_TEAM_CODES = frozenset(
+    {
+        "ARI", "ATL", "BAL", "BUF", "CAR", "CHI", "CIN", "CLE",
+        "DAL", "DEN", "DET", "GB", "HOU", "IND", "JAC", "JAX",
+        "KC", "LAC", "LAR", "LV", "MIA", "MIN", "NE", "NO",
+        "NYG", "NYJ", "PHI", "PIT", "SEA", "SF", "TB", "TEN",
+        "WAS", "WSH", "FA",
+    }
+)  # fmt: skip
+
+# Generational suffixes, lower-case and without punctuation.
+NAME_SUFFIXES = ("jr", "sr", "ii", "iii", "iv", "v")
+
+# Sleeper positions that can fill a FLEX roster spot.
+FLEX_POSITIONS = ("RB", "WR", "TE")
+
+# Sleeper's fantasy positions.
+POSITIONS = ("QB", "RB", "WR", "TE", "K", "DEF")
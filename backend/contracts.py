@@ -0,0 +1,188 @@
+# Path: ffbPlayerDraftingApp/backend/contracts.py
+
+"""
+Declarative frame contracts checked at pipeline stage boundaries.
+
+Each stage states which columns it needs, their kind, whether they may be
+null and what range their values must fall in. A contract is checked with
+whole-column operations (one null mask, one dtype inference and one range
+comparison per column), so it costs about a millisecond per thousand players
+and stays enabled in production runs, unlike validating every row through
+PlayerEnriched/PlayerWithPPG. Set CONTRACTS_ENABLED=false to skip the checks.
+"""
+
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel
+
+from backend.constants import POSITIONS
+from backend.logging_config import log
+from backend.settings import settings
+
+# How many offending rows a violation message lists.
+MAX_REPORTED_ROWS = 5
+
+
+class ContractViolation(ValueError):
+    """Raised when a frame does not satisfy its stage contract."""
+
+
+class ColumnSpec(BaseModel):
+    """The rules for one column."""
+
+    name: str
+    kind: Literal["string", "float", "int"]
+    nullable: bool = True
+    min_value: float | None = None
+    max_value: float | None = None
+    allowed: tuple[str, ...] | None = None
+
+
+class FrameContract(BaseModel):
+    """The columns a stage requires of a player frame."""
+
+    name: str
+    columns: list[ColumnSpec]
+
+    def extend(self, name: str, columns: list[ColumnSpec]) -> "FrameContract":
+        """A contract for a later stage: these columns plus the new ones."""
+        return FrameContract(name=name, columns=[*self.columns, *columns])
+
+    def check(self, df: pd.DataFrame) -> None:
+        """
+        Checks every column of the contract and raises one ContractViolation
+        listing all problems, each naming the column and the offending rows.
+        """
+        if not settings.CONTRACTS_ENABLED:
+            return
+        problems = []
+        for spec in self.columns:
+            if spec.name not in df.columns:
+                problems.append(f"missing required column '{spec.name}'")
+                continue
+            problems.extend(_check_column(df, spec))
+        if problems:
+            message = f"Frame contract '{self.name}' violated: " + "; ".join(problems)
+            log.error(message, extra={"contract": self.name, "rows": len(df)})
+            raise ContractViolation(message)
+
+
+def _describe_rows(df: pd.DataFrame, bad: np.ndarray) -> str:
+    """'3 rows (12 'josh-allen', 40 'bo-nix', 41)' for a boolean mask of bad rows."""
+    positions = np.flatnonzero(bad)
+    labels = df["slug"] if "slug" in df else df.get("name")
+    shown = []
+    for pos in positions[:MAX_REPORTED_ROWS]:
+        label = labels.iloc[pos] if labels is not None else None
+        shown.append(f"{df.index[pos]} {label!r}" if label else f"{df.index[pos]}")
+    more = ", ..." if len(positions) > MAX_REPORTED_ROWS else ""
+    return f"{len(positions)} rows ({', '.join(shown)}{more})"
+
+
+def _check_column(df: pd.DataFrame, spec: ColumnSpec) -> list[str]:
+    column = df[spec.name]
+    missing = column.isna().to_numpy()
+    problems = []
+
+    if not spec.nullable and missing.any():
+        problems.append(
+            f"column '{spec.name}' has null values in {_describe_rows(df, missing)}"
+        )
+    if missing.all():
+        return problems
+
+    if spec.kind == "string":
+        inferred = pd.api.types.infer_dtype(column, skipna=True)
+        if inferred not in ("string", "empty"):
+            problems.append(
+                f"column '{spec.name}' should hold strings, found {inferred}"
+            )
+            return problems
+        if spec.allowed is not None:
+            bad = ~missing & ~column.isin(spec.allowed).to_numpy()
+            if bad.any():
+                problems.append(
+                    f"column '{spec.name}' has values outside {list(spec.allowed)} in "
+                    f"{_describe_rows(df, bad)}"
+                )
+        return problems
+
+    values = pd.to_numeric(column, errors="coerce").to_numpy(
+        dtype=np.float64, na_value=np.nan
+    )
+    not_numeric = ~missing & np.isnan(values)
+    if not_numeric.any():
+        problems.append(
+            f"column '{spec.name}' has non-numeric values in {_describe_rows(df, not_numeric)}"
+        )
+        return problems
+    present = ~missing
+    if spec.kind == "int":
+        fractional = present & (np.mod(values, 1) != 0)
+        if fractional.any():
+            problems.append(
+                f"column '{spec.name}' should hold integers, found fractions in "
+                f"{_describe_rows(df, fractional)}"
+            )
+    with np.errstate(invalid="ignore"):
+        out_of_range = present & (
+            (values < spec.min_value if spec.min_value is not None else False)
+            | (values > spec.max_value if spec.max_value is not None else False)
+            | np.isinf(values)
+        )
+    if out_of_range.any():
+        problems.append(
+            f"column '{spec.name}' has values outside [{spec.min_value}, {spec.max_value}] "
+            f"in {_describe_rows(df, out_of_range)}"
+        )
+    return problems
+
+
+# --- Stage Contracts ---
+# roster_players.json: the clean phase's output, the enrich phase's input.
+ROSTER_PLAYERS = FrameContract(
+    name="roster_players",
+    columns=[
+        ColumnSpec(name="player_id", kind="string", nullable=False),
+        ColumnSpec(name="first_name", kind="string", nullable=False),
+        ColumnSpec(name="last_name", kind="string", nullable=False),
+        ColumnSpec(name="position", kind="string", nullable=False, allowed=POSITIONS),
+        ColumnSpec(name="team", kind="string", nullable=False),
+    ],
+)
+
+# players_enriched.json: the enrich phase's output, the stats phase's input.
+ENRICHED_PLAYERS = ROSTER_PLAYERS.extend(
+    "players_enriched",
+    [
+        ColumnSpec(name="slug", kind="string", nullable=False),
+        ColumnSpec(name="adp", kind="float", min_value=0.0),
+        ColumnSpec(name="bye_week", kind="int", min_value=1, max_value=18),
+        ColumnSpec(name="projected_points", kind="float"),
+    ],
+)
+
+# players_with_ppg.json: the stats phase's output, the VOR phase's input.
+PLAYERS_WITH_PPG = ENRICHED_PLAYERS.extend(
+    "players_with_ppg",
+    [
+        ColumnSpec(name="top_n_avg", kind="float"),
+        ColumnSpec(name="expected_ppg", kind="float", nullable=False),
+    ],
+)
+
+# players_final.json: what the frontend reads.
+FINAL_PLAYERS = FrameContract(
+    name="players_final",
+    columns=[
+        ColumnSpec(name="id", kind="int", nullable=False, min_value=1),
+        ColumnSpec(name="name", kind="string", nullable=False),
+        ColumnSpec(name="position", kind="string", nullable=False, allowed=POSITIONS),
+        ColumnSpec(name="adp", kind="float", nullable=False, min_value=0.0),
+        ColumnSpec(name="vor", kind="float", nullable=False),
+        ColumnSpec(name="bye", kind="int", min_value=1, max_value=18),
+        ColumnSpec(name="ppg", kind="float", nullable=False),
+    ],
+)
@@ -0,0 +1,186 @@
+# Path: ffbPlayerDraftingApp/backend/correlations.py
+
+"""
+Weekly score covariance and correlation between players, for stacking.
+
+The matrix covers the board (players with an ADP) who played at least
+MIN_WEEKS weeks last season, from the weekly_scores.json the stats phase
+saves. Missing weeks are handled pairwise: each pair's covariance and
+correlation use only the weeks both players played, so every statistic is
+a masked matrix product over the (players, weeks) matrix rather than a loop
+over pairs. Pairs sharing fewer than MIN_SHARED_WEEKS weeks are NaN.
+
+Both matrices are symmetric, so correlations.npz stores only their upper
+triangles (correlation as float16, covariance as float32, shared weeks as
+uint8) with the player labels. CorrelationMatrix unpacks them on load and
+answers the queries: a player's most correlated teammates, or how
+correlated a set of picks is.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from backend.logging_config import log
+from backend.settings import settings
+from backend.storage.file_store import load_json
+from backend.transforms.compute_ppg import load_weekly_scores
+
+MATRIX_FILE = "correlations.npz"
+MIN_WEEKS = 4
+MIN_SHARED_WEEKS = 4
+
+
+def pairwise_moments(scores: np.ndarray) -> dict[str, np.ndarray]:
+    """
+    Covariance and correlation of every pair of rows over the weeks both
+    played (pairwise-complete observations).
+
+    Args:
+        scores: A (players, weeks) float array with NaN for missing weeks.
+
+    Returns:
+        'cov' and 'corr' (players, players) float64 and 'shared' (players,
+        players) week counts. Pairs with fewer than two shared weeks, or a
+        constant score over them, are NaN.
+    """
+    mask = (~np.isnan(scores)).astype(np.float64)
+    values = np.where(mask > 0, scores, 0.0)
+    shared = mask @ mask.T
+    # sum_x[i, j]: player i's total over the weeks shared with j.
+    sum_x = values @ mask.T
+    sum_xx = (values * values) @ mask.T
+    sum_xy = values @ values.T
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        co_moment = sum_xy - sum_x * sum_x.T / shared
+        cov = co_moment / (shared - 1)
+        spread_x = sum_xx - sum_x * sum_x / shared
+        corr = co_moment / np.sqrt(spread_x * spread_x.T)
+    too_few = shared < 2
+    cov[too_few] = np.nan
+    corr[too_few | ~np.isfinite(corr)] = np.nan
+    return {"cov": cov, "corr": np.clip(corr, -1.0, 1.0), "shared": shared}
+
+
+def run_correlations(date_str: str) -> Path:
+    """Builds the weekly correlation matrix of a dated run and saves it."""
+    data_dir = settings.DATA_DIR / date_str
+    log.info("Starting weekly correlation matrix.", extra={"date": date_str})
+    players = pd.DataFrame(load_json(data_dir / "players_with_ppg.json"))
+    history = load_weekly_scores(data_dir, len(players))
+
+    relevant = (players["adp"].notna() & (history.games_played >= MIN_WEEKS)).to_numpy()
+    moments = pairwise_moments(history.scores[relevant])
+    thin = moments["shared"] < MIN_SHARED_WEEKS
+    kept = players[relevant]
+    upper = np.triu_indices(len(kept))
+    output_path = data_dir / MATRIX_FILE
+    np.savez_compressed(
+        output_path,
+        slug=kept["slug"].to_numpy(dtype=str),
+        name=(kept["first_name"] + " " + kept["last_name"]).to_numpy(dtype=str),
+        position=kept["position"].to_numpy(dtype=str),
+        team=kept["team"].fillna("").to_numpy(dtype=str),
+        cov=np.where(thin, np.nan, moments["cov"])[upper].astype(np.float32),
+        corr=np.where(thin, np.nan, moments["corr"])[upper].astype(np.float16),
+        shared=moments["shared"][upper].astype(np.uint8),
+    )
+    log.info(
+        "Weekly correlation matrix saved.",
+        extra={"players": int(relevant.sum()), "path": str(output_path)},
+    )
+    return output_path
+
+
+@dataclass
+class CorrelationMatrix:
+    """A loaded correlations.npz."""
+
+    slug: np.ndarray
+    name: np.ndarray
+    position: np.ndarray
+    team: np.ndarray
+    cov: np.ndarray
+    corr: np.ndarray
+    shared: np.ndarray
+
+    @classmethod
+    def load(cls, date_str: str) -> "CorrelationMatrix":
+        with np.load(settings.DATA_DIR / date_str / MATRIX_FILE) as data:
+            labels = {name: data[name] for name in ("slug", "name", "position", "team")}
+            upper = np.triu_indices(len(labels["slug"]))
+            matrices = {}
+            for name, dtype in (
+                ("cov", np.float32),
+                ("corr", np.float32),
+                ("shared", np.uint8),
+            ):
+                square = np.empty((len(labels["slug"]),) * 2, dtype=dtype)
+                square[upper] = data[name]
+                square.T[upper] = data[name]
+                matrices[name] = square
+        return cls(**labels, **matrices)
+
+    def index_of(self, slug: str) -> int:
+        matches = np.flatnonzero(self.slug == slug)
+        if not len(matches):
+            raise ValueError(
+                f"'{slug}' is not in the correlation matrix (it covers players "
+                f"with an ADP and at least {MIN_WEEKS} weeks played)."
+            )
+        return int(matches[0])
+
+    def most_correlated(
+        self, slug: str, top: int = 5, teammates_only: bool = True
+    ) -> pd.DataFrame:
+        """
+        The players whose weekly scores move most with this player's, e.g.
+        the pass catchers to stack with a QB.
+        """
+        i = self.index_of(slug)
+        candidates = self.slug != slug
+        if teammates_only:
+            candidates &= self.team == self.team[i]
+        candidates &= ~np.isnan(self.corr[i])
+        order = np.flatnonzero(candidates)[np.argsort(-self.corr[i, candidates])]
+        return pd.DataFrame(
+            {
+                "slug": self.slug[order],
+                "name": self.name[order],
+                "position": self.position[order],
+                "team": self.team[order],
+                "corr": self.corr[i, order].round(3),
+                "shared_weeks": self.shared[i, order],
+            }
+        ).head(top)
+
+    def roster_correlation(self, slugs: list[str]) -> dict:
+        """
+        How correlated a set of picks is: the mean pairwise correlation, the
+        most correlated pairs and the spread of their combined weekly score
+        compared with the spread if they were independent.
+        """
+        idx = np.array([self.index_of(slug) for slug in slugs])
+        corr = self.corr[np.ix_(idx, idx)].astype(np.float64)
+        cov = np.nan_to_num(self.cov[np.ix_(idx, idx)].astype(np.float64))
+        upper = np.triu_indices(len(idx), k=1)
+        pairs = sorted(
+            (
+                (float(corr[a, b]), slugs[a], slugs[b])
+                for a, b in zip(*upper)
+                if not np.isnan(corr[a, b])
+            ),
+            reverse=True,
+        )
+        return {
+            "mean_correlation": float(np.nanmean(corr[upper])) if pairs else None,
+            "pairs": [
+                {"players": [first, second], "corr": round(value, 3)}
+                for value, first, second in pairs
+            ],
+            "combined_std": float(np.sqrt(max(cov.sum(), 0.0))),
+            "independent_std": float(np.sqrt(np.trace(cov))),
+        }
@@ -1,42 +1,31 @@
 # backend/data_sources/fantasypros.py (Consolidated & Consistent)
 import io
-import re
+import numpy as np
 import pandas as pd
 import requests
 
 # Local application imports
-try:
-    from backend.logging_config import log
-    from backend.settings import settings
-    from backend.utils import slugify
-except ImportError:
-    # This block is for standalone testing only
-    import logging
-
-    log = logging.getLogger(__name__)
-    logging.basicConfig(
-        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
-    )
-
-    class DummySettings:
-        class DummyLeagueConfig:
-            scoring = "HALF"
-
-        league_config = DummyLeagueConfig()
+from backend.constants import SOURCE_POSITION_ALIASES, canonical_position
+from backend.logging_config import log
+from backend.settings import settings
+from backend.transforms.fantasy_points import (
+    LOCAL_POSITIONS,
+    STATS,
+    fantasy_points,
+    scoring_weights,
+    source_stats,
+)
+from backend.transforms.names import clean_source_names, extract_team_codes
 
-    settings = DummySettings()
 
-    def slugify(text):
-        text = str(text).lower().strip()
-        text = re.sub(r"[^a-z0-9\s-]", "", text)
-        text = re.sub(r"[\s-]+", "-", text).strip("-")
-        return text
+ADP_COLUMNS = ["player_slug", "adp", "bye_week", "team", "position"]
 
 
 # --- ADP Scraper (Now with Dynamic URL) ---
-def fetch_adp() -> dict[str, tuple[float, int | None]]:
+def fetch_adp_records() -> pd.DataFrame:
     """
-    Scrapes FantasyPros ADP and returns ADP and Bye Week for each player.
+    Scrapes FantasyPros ADP and returns one row per player with ADP, Bye Week,
+    team and position, so matching can be partitioned by position and team.
     The URL is now dynamically chosen based on the scoring setting.
     """
     scoring_map = {
@@ -66,29 +55,39 @@ def fetch_adp() -> dict[str, tuple[float, int | None]]:
             raise ValueError("ADP table not found.")
         df = tables[0]
 
-        player_col, adp_col = "Player Team (Bye)", "AVG"
+        player_col, adp_col, pos_col = "Player Team (Bye)", "AVG", "POS"
         if player_col not in df.columns or adp_col not in df.columns:
             log.error(
                 f"Required ADP columns not found. Discovered: {df.columns.tolist()}"
             )
-            return {}
-
-        adp_map = {}
-        for _, row in df.iterrows():
-            player_info = row[player_col]
-            bye_match = re.search(r"\((\d+)\)", player_info)
-            bye_week = int(bye_match.group(1)) if bye_match else None
-            name_parts = player_info.split()
-            player_name = (
-                " ".join(name_parts[:-2])
-                if len(name_parts) > 2
-                else (name_parts[0] if name_parts else "")
-            )
-            if player_name:
-                adp_map[slugify(player_name)] = (float(row[adp_col]), bye_week)
+            return pd.DataFrame(columns=ADP_COLUMNS)
+
+        # "Ja'Marr Chase CIN (10)": pull out the bye, then split off the team code.
+        player_info = df[player_col].astype(str)
+        name_and_team = player_info.str.replace(r"\s*\(\d+\)\s*$", "", regex=True)
+        # POS reads like "WR12"; keep only the position label.
+        positions = (
+            df[pos_col].astype(str).str.replace(r"\d+$", "", regex=True).str.upper()
+            if pos_col in df.columns
+            else pd.Series(None, index=df.index, dtype=object)
+        )
+        records = pd.DataFrame(
+            {
+                "player_slug": clean_source_names(name_and_team),
+                "adp": pd.to_numeric(df[adp_col], errors="coerce"),
+                "bye_week": pd.to_numeric(
+                    player_info.str.extract(r"\((\d+)\)", expand=False),
+                    errors="coerce",
+                ),
+                "team": extract_team_codes(name_and_team),
+                "position": positions.replace(SOURCE_POSITION_ALIASES),
+            },
+            columns=ADP_COLUMNS,
+        )
+        records = records[(records["player_slug"] != "") & records["adp"].notna()]
 
-        log.info(f"Successfully parsed ADP and Bye Weeks for {len(adp_map)} players.")
-        return adp_map
+        log.info(f"Successfully parsed ADP and Bye Weeks for {len(records)} players.")
+        return records.reset_index(drop=True)
     except Exception as e:
         log.exception(
             "Failed to fetch or parse ADP/Bye Week data.", extra={"error": str(e)}
@@ -96,8 +95,27 @@ def fetch_adp() -> dict[str, tuple[float, int | None]]:
         raise
 
 
-# --- Projections Scraper (No changes needed here) ---
-def fetch_projections_by_position(position: str, scoring: str) -> pd.DataFrame:
+def fetch_adp() -> dict[str, tuple[float, int | None]]:
+    """
+    Scrapes FantasyPros ADP and returns ADP and Bye Week for each player slug.
+    """
+    records = fetch_adp_records()
+    return {
+        row.player_slug: (row.adp, None if pd.isna(row.bye_week) else int(row.bye_week))
+        for row in records.itertuples(index=False)
+    }
+
+
+# --- Projections Scraper ---
+def fetch_projections_by_position(
+    position: str, scoring: str, weights: np.ndarray | None = None
+) -> pd.DataFrame:
+    """
+    Scrapes one position's season projections with their raw stat columns.
+    Given a fantasy_points.scoring_weights matrix, 'projection_fpts' is scored
+    locally from the stats; otherwise, and for kickers and defenses, it is the
+    site's FPTS for `scoring`.
+    """
     url = f"https://www.fantasypros.com/nfl/projections/{position.lower()}.php?scoring={scoring.upper()}&week=0"
     log.info(f"Fetching projections for position '{position}' from {url}")
     try:
@@ -116,14 +134,24 @@ def fetch_projections_by_position(position: str, scoring: str) -> pd.DataFrame:
         if player_col not in df.columns or fpts_col not in df.columns:
             return pd.DataFrame()
 
-        df["player_slug"] = (
-            df[player_col]
-            .str.replace(r"\s+[A-Z]{2,3}$", "", regex=True)
-            .str.strip()
-            .apply(slugify)
-        )
+        stats = source_stats(df)
+        canonical = canonical_position(position)
+        if stats is not None:
+            df = pd.concat(
+                [df, pd.DataFrame(stats, columns=STATS, index=df.index)], axis=1
+            )
+            if weights is not None and canonical in LOCAL_POSITIONS:
+                df[fpts_col] = fantasy_points(
+                    stats, np.full(len(df), canonical, dtype=object), weights
+                )
+
+        # FantasyPros appends the team code ("Josh Allen BUF"); keep it for matching.
+        df["team"] = extract_team_codes(df[player_col])
+        df["position"] = canonical
+        df["player_slug"] = clean_source_names(df[player_col])
+        stat_columns = list(STATS) if stats is not None else []
         final_df = (
-            df[["player_slug", fpts_col]]
+            df[["player_slug", fpts_col, "team", "position", *stat_columns]]
             .copy()
             .rename(columns={fpts_col: "projection_fpts"})
         )
@@ -136,10 +164,38 @@ def fetch_projections_by_position(position: str, scoring: str) -> pd.DataFrame:
 
 def fetch_all_projections() -> pd.DataFrame:
     positions = ["QB", "RB", "WR", "TE", "K", "DST"]
-    scoring = settings.league_config.scoring
-    all_dfs = [fetch_projections_by_position(pos, scoring) for pos in positions]
+    cfg = settings.league_config
+    weights = scoring_weights(cfg.scoring, cfg.scoring_rules)
+    all_dfs = [
+        fetch_projections_by_position(pos, cfg.scoring, weights) for pos in positions
+    ]
     combined_df = pd.concat([df for df in all_dfs if not df.empty], ignore_index=True)
     log.info(
         f"Successfully combined projections. Total players/teams: {len(combined_df)}"
     )
     return combined_df
+
+
+def rescore_projections(records: pd.DataFrame, weights: np.ndarray) -> np.ndarray:
+    """
+    Scores saved projection stat lines (the enrich phase's
+    projection_stats.json) under a rule set, so any scoring costs no new
+    scrape.
+
+    Args:
+        records: Rows with 'position', 'projection_fpts' and 'stats' (a list in
+            fantasy_points.STATS order, or None).
+        weights: A fantasy_points.scoring_weights matrix.
+
+    Returns:
+        The projected points under the rule set. Rows without a stat line, and
+        kickers and defenses, keep their saved points.
+    """
+    missing = [np.nan] * len(STATS)
+    stats = np.array(
+        [missing if line is None else line for line in records["stats"]],
+        dtype=np.float64,
+    ).reshape(len(records), len(STATS))
+    local = fantasy_points(stats, records["position"].to_numpy(dtype=object), weights)
+    saved = records["projection_fpts"].to_numpy(dtype=np.float64)
+    return np.where(np.isnan(local), saved, local)
@@ -1,13 +1,22 @@
 # Path: ffbPlayerDraftingApp/backend/data_sources/historical.py
 
 import io
+import math
 import time
+import numpy as np
 import pandas as pd
 import requests
-import re
 
+from backend.constants import canonical_position
 from backend.logging_config import log
-from backend.utils import slugify
+from backend.settings import settings
+from backend.transforms.fantasy_points import (
+    STATS,
+    fantasy_points,
+    scoring_weights,
+    source_stats,
+)
+from backend.transforms.names import clean_source_names, extract_team_codes
 
 BASE_URL = "https://www.fantasypros.com/nfl/stats/{pos}.php?week={week}&scoring=HALF&range=week"
 POSITIONS = ["qb", "rb", "wr", "te", "k", "dst"]
@@ -17,45 +26,80 @@ HEADERS = {
 }
 
 
-def _parse_table(df: pd.DataFrame) -> dict[str, float]:
-    weekly_scores = {}
+def _parse_table(
+    df: pd.DataFrame,
+) -> dict[str, tuple[float, str | None, list[float] | None]]:
+    """Each player's site FPTS, team and raw stat line (None without stat columns)."""
     try:
         player_col_header = next(col for col in df.columns if "Player" in str(col))
         fpts_col_header = next(col for col in df.columns if "FPTS" in str(col))
     except StopIteration:
         return {}
 
-    for _, row in df.iterrows():
-        player_info_str = str(row[player_col_header]).strip()
+    player_info = df[player_col_header].astype(str).str.strip()
+    parsed = pd.DataFrame(
+        {
+            "slug": clean_source_names(player_info),
+            "team": extract_team_codes(player_info),
+            "score": pd.to_numeric(df[fpts_col_header], errors="coerce"),
+        }
+    )
+    stats = source_stats(df)
+    parsed["stats"] = list(stats) if stats is not None else None
+    parsed = parsed[(parsed["slug"] != "") & parsed["score"].notna()]
+    return {
+        slug: (score, team, None if line is None else line.tolist())
+        for slug, score, team, line in zip(
+            parsed["slug"], parsed["score"], parsed["team"], parsed["stats"]
+        )
+    }
 
-        clean_name = player_info_str.replace("*", "").replace("+", "").strip()
-        clean_name = re.sub(r"\s+[A-Z]{2,3}$", "", clean_name).strip()
-        player_slug = slugify(clean_name)
 
-        try:
-            score = float(row[fpts_col_header])
-            if player_slug:
-                weekly_scores[player_slug] = score
-        except (ValueError, TypeError):
-            continue
-    return weekly_scores
+def fetch_last_year_weekly_records() -> pd.DataFrame:
+    """Scrapes last season's weekly fantasy points (see fetch_weekly_records)."""
+    return fetch_weekly_records()
 
 
-def fetch_last_year_weekly_stats() -> dict[str, list[float]]:
-    log.info("Starting historical data scrape.")
-    all_player_scores: dict[str, list[float]] = {}
+def fetch_weekly_records(season: int | None = None) -> pd.DataFrame:
+    """
+    Scrapes one season's weekly stat lines and fantasy points for every
+    position.
+
+    Args:
+        season: The season's year, e.g. 2024. Defaults to the last completed
+                season, FantasyPros' default.
+
+    Returns:
+        One row per (player, position) with columns 'slug', 'position' (Sleeper
+        vocabulary), 'team' (the player's most recent team in the scrape),
+        'scores' (one entry per week of WEEKS, None for weeks the player did
+        not appear in that position's table) and 'stats' (the matching raw
+        stat lines in fantasy_points.STATS order). Scores follow the league
+        config's scoring; see rescore_weekly_records.
+    """
+    log.info("Starting historical data scrape.", extra={"season": season})
+    records = []
+    week_slots = {week: slot for slot, week in enumerate(WEEKS)}
     for pos in POSITIONS:
-        pos_scores: dict[str, list[float]] = {}
+        pos_scores: dict[str, list[float | None]] = {}
+        pos_stats: dict[str, list[list[float] | None]] = {}
+        pos_teams: dict[str, str | None] = {}
         for week in WEEKS:
             url = BASE_URL.format(pos=pos, week=week)
+            if season is not None:
+                url += f"&year={season}"
             try:
                 response = requests.get(url, headers=HEADERS, timeout=15)
                 response.raise_for_status()
                 tables = pd.read_html(io.StringIO(response.text))
                 if tables:
                     weekly_scores = _parse_table(tables[0])
-                    for slug, score in weekly_scores.items():
-                        pos_scores.setdefault(slug, []).append(score)
+                    for slug, (score, team, line) in weekly_scores.items():
+                        weeks = pos_scores.setdefault(slug, [None] * len(WEEKS))
+                        weeks[week_slots[week]] = score
+                        lines = pos_stats.setdefault(slug, [None] * len(WEEKS))
+                        lines[week_slots[week]] = line
+                        pos_teams[slug] = team or pos_teams.get(slug)
                 time.sleep(0.25)
             except Exception as e:
                 log.error(
@@ -63,9 +107,72 @@ def fetch_last_year_weekly_stats() -> dict[str, list[float]]:
                     extra={"error": str(e)},
                 )
 
+        position = canonical_position(pos)
         for slug, scores in pos_scores.items():
-            if slug not in all_player_scores:
-                all_player_scores[slug] = scores
+            records.append(
+                {
+                    "slug": slug,
+                    "position": position,
+                    "team": pos_teams.get(slug),
+                    "scores": scores,
+                    "stats": pos_stats[slug],
+                }
+            )
+
+    log.info(f"Finished scraping historical data for {len(records)} player records.")
+    records = pd.DataFrame(
+        records, columns=["slug", "position", "team", "scores", "stats"]
+    )
+    cfg = settings.league_config
+    records["scores"] = rescore_weekly_records(
+        records, scoring_weights(cfg.scoring, cfg.scoring_rules)
+    )
+    return records
+
+
+def rescore_weekly_records(
+    records: pd.DataFrame, weights: np.ndarray
+) -> list[list[float | None]]:
+    """
+    Scores fetch_weekly_records' stat lines under a rule set, so any scoring
+    costs no new scrape.
+
+    Args:
+        records: fetch_weekly_records' output.
+        weights: A fantasy_points.scoring_weights matrix.
+
+    Returns:
+        The 'scores' column under the rule set. Weeks without a stat line, and
+        kickers and defenses, keep the site's points.
+    """
+    missing = [np.nan] * len(STATS)
+    stats = np.array(
+        [
+            [missing if line is None else line for line in lines or [None] * len(WEEKS)]
+            for lines in records["stats"]
+        ],
+        dtype=np.float64,
+    ).reshape(len(records), len(WEEKS), len(STATS))
+    site = np.array(
+        [[np.nan if s is None else s for s in scores] for scores in records["scores"]],
+        dtype=np.float64,
+    ).reshape(len(records), len(WEEKS))
+    local = fantasy_points(stats, records["position"].to_numpy(dtype=object), weights)
+    scores = np.where(np.isnan(local), site, local)
+    return [[None if math.isnan(s) else s for s in row] for row in scores.tolist()]
+
+
+def fetch_last_year_weekly_stats() -> dict[str, list[float]]:
+    """
+    Slug-keyed view of fetch_last_year_weekly_records() listing only the weeks
+    each player played. A slug that appears under several positions keeps the
+    first position's scores.
+    """
+    records = fetch_last_year_weekly_records()
+    all_player_scores: dict[str, list[float]] = {}
+    for slug, scores in zip(records["slug"], records["scores"]):
+        if slug not in all_player_scores:
+            all_player_scores[slug] = [s for s in scores if s is not None]
 
     log.info(
         f"Finished scraping historical data for {len(all_player_scores)} unique players."
@@ -0,0 +1,306 @@
+# Path: ffbPlayerDraftingApp/backend/draft_plan.py
+
+"""
+Draft strategy planner: which position should I take in each round?
+
+A plan assigns a position to each of my picks. Its value is the expected VOR
+of the starting lineup it builds: the first picks at a position fill its
+starting slots, the next RB, WR or TE picks fill FLEX, and any further pick
+is bench depth worth BENCH_WEIGHT of its expected VOR.
+
+The expected VOR of taking a position at one of my picks is the expected
+value of the best player there still available, given how many of that
+position I already hold: with c earlier picks at a position, the pick is
+modelled as the (c + 1)-th best player left by the other teams. Each
+player's availability at each pick is either derived from ADP (the same
+normal draft-position model as draft_sim.py) or read from the simulator's
+draft_availability.json. Availabilities are treated as independent, so the
+(c + 1)-th best available is a Poisson-binomial order statistic. A player
+below replacement is worth nothing, since a replacement player is always
+available; VOR is clipped at zero.
+
+A plan's value only depends on how many of each position it holds at each
+pick, so the search is a dynamic program over roster counts rather than
+over pick sequences: every roster state is reached once per layer and keeps
+only its best few partial plans, which are enough to rank the best plans
+overall. States that can no longer fill every starting slot in the picks
+left, or that hold more players at a position than it can use, are pruned.
+"""
+
+import heapq
+import math
+
+import numpy as np
+import pandas as pd
+
+from backend.constants import FLEX_POSITIONS
+from backend.draft_sim import (
+    ADP_MIN_SD,
+    ADP_SPREAD,
+    DRAFT_POSITIONS,
+    NO_BENCH_POSITIONS,
+    my_picks,
+)
+from backend.logging_config import log
+from backend.settings import RosterSettings, settings
+from backend.storage.file_store import load_json
+
+# The share of a bench pick's expected VOR a plan is credited with.
+BENCH_WEIGHT = 0.25
+DEFAULT_ALTERNATES = 3
+
+# Chebyshev fit of erfc (Numerical Recipes' erfcc), fractional error < 1.2e-7.
+_ERFC_COEFFICIENTS = (
+    -1.26551223,
+    1.00002368,
+    0.37409196,
+    0.09678418,
+    -0.18628806,
+    0.27886807,
+    -1.13520398,
+    1.48851587,
+    -0.82215223,
+    0.17087277,
+)
+
+
+def _normal_cdf(x: np.ndarray) -> np.ndarray:
+    """The standard normal CDF, elementwise."""
+    z = np.abs(x) / math.sqrt(2.0)
+    t = 1.0 / (1.0 + 0.5 * z)
+    erfc = t * np.exp(np.polyval(_ERFC_COEFFICIENTS[::-1], t) - z * z)
+    return np.where(x >= 0, 1.0 - 0.5 * erfc, 0.5 * erfc)
+
+
+def availability_from_adp(adp: np.ndarray, picks: np.ndarray) -> np.ndarray:
+    """
+    The probability that each player is still available at each pick.
+
+    A player is available at overall pick p if their drawn draft position,
+    normal around their ADP, falls after pick p - 1. Players without an ADP
+    are always available.
+
+    Args:
+        adp: Each player's ADP.
+        picks: 1-based overall picks.
+
+    Returns:
+        A (picks, players) array of probabilities.
+    """
+    adp = np.asarray(adp, dtype=np.float64)
+    spread = np.maximum(ADP_SPREAD * adp, ADP_MIN_SD)
+    z = (adp[None, :] - (picks[:, None] - 0.5)) / spread[None, :]
+    return np.where(np.isnan(adp)[None, :], 1.0, _normal_cdf(np.nan_to_num(z)))
+
+
+def expected_pick_values(
+    vor: np.ndarray, availability: np.ndarray, depth: int
+) -> np.ndarray:
+    """
+    The expected VOR of the (c + 1)-th best available player at one position.
+
+    Args:
+        vor: The position's players' VOR.
+        availability: Their (picks, players) availability.
+        depth: The largest c needed, plus one.
+
+    Returns:
+        A (picks, depth) array; entry [k, c] is the expected VOR of the
+        (c + 1)-th best available player at pick k, zero if fewer remain.
+    """
+    order = np.argsort(-vor, kind="stable")
+    values = np.maximum(vor[order], 0.0)
+    available = availability[:, order]
+    # P(exactly c better players are available), per pick.
+    better = np.zeros((len(available), depth))
+    better[:, 0] = 1.0
+    expected = np.zeros((len(available), depth))
+    for value, p in zip(values, available.T):
+        expected += value * p[:, None] * better
+        better[:, 1:] = better[:, 1:] * (1.0 - p[:, None]) + better[:, :-1] * p[:, None]
+        better[:, 0] *= 1.0 - p
+    return expected
+
+
+class _RosterRules:
+    """What each additional player at a position is worth to a roster."""
+
+    def __init__(self, roster: RosterSettings, rounds: int):
+        self.starters = [getattr(roster, pos) for pos in DRAFT_POSITIONS]
+        self.flex = roster.FLEX
+        self.is_flex = [pos in FLEX_POSITIONS for pos in DRAFT_POSITIONS]
+        self.rounds = rounds
+        slots = sum(self.starters) + self.flex
+        if rounds < slots:
+            raise ValueError(
+                f"{rounds} rounds cannot fill the roster's {slots} starting slots."
+            )
+        bench = rounds - slots
+        # The most players a plan may hold at each position.
+        self.caps = [
+            starters
+            if pos in NO_BENCH_POSITIONS
+            else starters + (self.flex if flex else 0) + bench
+            for pos, starters, flex in zip(DRAFT_POSITIONS, self.starters, self.is_flex)
+        ]
+
+    def flex_used(self, counts: tuple) -> int:
+        surplus = sum(
+            max(c - s, 0) for c, s, f in zip(counts, self.starters, self.is_flex) if f
+        )
+        return min(surplus, self.flex)
+
+    def unfilled(self, counts: tuple) -> int:
+        """Starting slots, FLEX included, the roster has yet to fill."""
+        open_ = sum(max(s - c, 0) for c, s in zip(counts, self.starters))
+        return open_ + self.flex - self.flex_used(counts)
+
+    def role(self, counts: tuple, code: int) -> str:
+        """The slot the next player at position `code` would take."""
+        if counts[code] < self.starters[code]:
+            return "starter"
+        if self.is_flex[code] and self.flex_used(counts) < self.flex:
+            return "FLEX"
+        return "bench"
+
+
+def plan_draft(
+    values: list[np.ndarray],
+    roster: RosterSettings,
+    rounds: int,
+    alternates: int = DEFAULT_ALTERNATES,
+) -> list[tuple[float, tuple[int, ...]]]:
+    """
+    The best position-by-round plans.
+
+    Args:
+        values: Per DRAFT_POSITIONS entry, the (picks, depth) expected VOR
+            from expected_pick_values, with depth at least the position's cap.
+        roster: Starting slots per position.
+        rounds: My picks in the draft.
+        alternates: How many plans to return beyond the best one.
+
+    Returns:
+        Up to alternates + 1 (value, position codes per pick) pairs, best first.
+    """
+    rules = _RosterRules(roster, rounds)
+    keep = alternates + 1
+    layer = {tuple([0] * len(DRAFT_POSITIONS)): [(0.0, ())]}
+    for pick in range(rounds):
+        left = rounds - pick - 1
+        next_layer: dict[tuple, list] = {}
+        # Each roster state appears once per layer, so its moves are scored once.
+        for counts, plans in layer.items():
+            for code, count in enumerate(counts):
+                if count >= rules.caps[code]:
+                    continue
+                after = counts[:code] + (count + 1,) + counts[code + 1 :]
+                if rules.unfilled(after) > left:
+                    continue
+                value = values[code][pick, count]
+                if rules.role(counts, code) == "bench":
+                    value *= BENCH_WEIGHT
+                next_layer.setdefault(after, []).extend(
+                    (total + value, plan + (code,)) for total, plan in plans
+                )
+        layer = {
+            counts: heapq.nlargest(keep, plans) for counts, plans in next_layer.items()
+        }
+    return heapq.nlargest(keep, (plan for plans in layer.values() for plan in plans))
+
+
+def draft_plan(
+    date_str: str,
+    slot: int,
+    rounds: int | None = None,
+    alternates: int = DEFAULT_ALTERNATES,
+    simulated: bool = False,
+) -> list[tuple[float, pd.DataFrame]]:
+    """
+    Plans a run's draft from my slot.
+
+    Args:
+        date_str: The run whose players_final.json is the board.
+        slot: My 1-based draft slot.
+        rounds: Rounds in the draft; defaults to the roster's starting slots.
+        alternates: How many plans to return beyond the best one.
+        simulated: Read availability from draft_availability.json (see
+            `simulate-draft`) instead of deriving it from ADP.
+
+    Returns:
+        One (value, table) pair per plan, best first. The value is the
+        plan's expected lineup VOR, bench picks weighted by BENCH_WEIGHT; the
+        table has each of my picks' round, overall pick, position, role,
+        expected VOR and likeliest target.
+    """
+    data_dir = settings.DATA_DIR / date_str
+    cfg = settings.league_config
+    rounds = rounds or sum(cfg.roster.model_dump().values())
+    if not 1 <= slot <= cfg.teams:
+        raise ValueError(
+            f"The draft slot must be between 1 and {cfg.teams}, got {slot}."
+        )
+    picks = my_picks(slot, cfg.teams, rounds)
+    log.info(
+        "Starting draft planning.",
+        extra={"date": date_str, "slot": slot, "rounds": rounds},
+    )
+
+    if simulated:
+        board = pd.DataFrame(load_json(data_dir / "draft_availability.json"))
+        columns = [f"pick_{pick}" for pick in picks]
+        missing = [c for c in columns if c not in board.columns]
+        if missing:
+            raise ValueError(
+                f"draft_availability.json lacks {missing}; rerun simulate-draft "
+                f"with --slot {slot} --rounds {rounds}."
+            )
+        availability = board[columns].to_numpy(dtype=np.float64).T
+    else:
+        board = pd.DataFrame(load_json(data_dir / "players_final.json"))
+        availability = availability_from_adp(board["adp"].to_numpy(dtype=float), picks)
+
+    rules = _RosterRules(cfg.roster, rounds)
+    vor = board["vor"].to_numpy(dtype=np.float64)
+    positions = board["position"].to_numpy(dtype=object)
+    values = []
+    for pos, cap in zip(DRAFT_POSITIONS, rules.caps):
+        at_pos = positions == pos
+        values.append(
+            expected_pick_values(vor[at_pos], availability[:, at_pos], max(cap, 1))
+        )
+    plans = plan_draft(values, cfg.roster, rounds, alternates)
+
+    results = []
+    for total, codes in plans:
+        rows, counts = [], [0] * len(DRAFT_POSITIONS)
+        targeted = np.zeros(len(board), dtype=bool)
+        for k, code in enumerate(codes):
+            pos = DRAFT_POSITIONS[code]
+            # The best player at the position, not already this plan's target,
+            # more likely than not still there.
+            likely = np.flatnonzero(
+                (positions == pos) & (availability[k] >= 0.5) & ~targeted
+            )
+            target = None
+            if len(likely):
+                best = likely[vor[likely].argmax()]
+                targeted[best] = True
+                target = board["name"].iloc[best]
+            rows.append(
+                {
+                    "round": k + 1,
+                    "pick": int(picks[k]),
+                    "position": pos,
+                    "role": rules.role(tuple(counts), code),
+                    "expected_vor": round(float(values[code][k, counts[code]]), 2),
+                    "target": target,
+                }
+            )
+            counts[code] += 1
+        results.append((round(float(total), 2), pd.DataFrame(rows)))
+    log.info(
+        "Draft planning completed.",
+        extra={"plans": len(results), "best_value": results[0][0]},
+    )
+    return results
@@ -0,0 +1,284 @@
+# Path: ffbPlayerDraftingApp/backend/draft_sim.py
+
+"""
+Monte Carlo snake-draft simulator: how likely is each player to still be on
+the board at each of my picks?
+
+Each simulated draft draws every player's draft position once from a normal
+distribution centred on their ADP (wider for later picks). Opponents then
+take the available player with the earliest drawn position, adjusted for
+positional need from the league's RosterSettings:
+
+- a team that has filled a position's starting slots (FLEX included) pushes
+  further players there back one round per surplus player; a second kicker
+  or defense is never taken;
+- once a team has only as many picks left as open starting slots, it only
+  drafts positions that fill one.
+
+My own picks follow the board (players_final.json's VOR order) under the
+same positional rules. Drafts are simulated in batches: the picks are
+stepped through in order, but each pick is a few array operations over every
+draft of the batch. Each draft's players are queued per position in that
+draft's preference order, so a pick only compares the first available
+player of each position, and roster counts are a (drafts, teams, positions)
+array.
+
+The result, draft_availability.json, lists the board with the probability
+that each player is still available at each of my picks.
+"""
+
+import numpy as np
+import pandas as pd
+
+from backend.constants import FLEX_POSITIONS
+from backend.logging_config import log
+from backend.settings import RosterSettings, settings
+from backend.storage.file_store import load_json, save_json
+
+DEFAULT_SIMULATIONS = 20_000
+# Drafts per batch; bounds memory at a few (batch, players) arrays.
+BATCH_SIZE = 10_000
+# The standard deviation of a player's draft position: ADP_SPREAD x ADP, at
+# least ADP_MIN_SD picks.
+ADP_SPREAD = 0.15
+ADP_MIN_SD = 1.5
+# Positions nobody rosters beyond their starters.
+NO_BENCH_POSITIONS = ("K", "DEF")
+
+# Positions with dedicated starting slots, in RosterSettings order.
+DRAFT_POSITIONS = [pos for pos in RosterSettings.model_fields if pos != "FLEX"]
+
+
+def snake_order(teams: int, rounds: int) -> np.ndarray:
+    """The 0-based team on the clock at each overall pick."""
+    order = np.tile(np.arange(teams), (rounds, 1))
+    order[1::2] = order[1::2, ::-1]
+    return order.ravel()
+
+
+def my_picks(slot: int, teams: int, rounds: int) -> np.ndarray:
+    """The 1-based overall picks of draft slot `slot` (1-based)."""
+    return np.flatnonzero(snake_order(teams, rounds) == slot - 1) + 1
+
+
+class _PositionalNeed:
+    """Pick-score penalties from a team's roster counts, per draft."""
+
+    def __init__(self, roster: RosterSettings, teams: int, rounds: int):
+        self.starters = np.array([getattr(roster, pos) for pos in DRAFT_POSITIONS])
+        self.flex = roster.FLEX
+        self.is_flex = np.isin(DRAFT_POSITIONS, FLEX_POSITIONS)
+        self.no_bench = np.isin(DRAFT_POSITIONS, NO_BENCH_POSITIONS)
+        self.teams = teams
+        self.rounds = rounds
+
+    def __call__(self, counts: np.ndarray, picks_made: int) -> np.ndarray:
+        """
+        Args:
+            counts: The team's (drafts, positions) roster counts.
+            picks_made: How many picks the team has made.
+
+        Returns:
+            A (drafts, positions) penalty in picks, inf for excluded positions.
+        """
+        surplus = np.maximum(counts - self.starters, 0)
+        flex_open = np.maximum(self.flex - surplus[:, self.is_flex].sum(axis=1), 0)
+        # Starting slots still open to each position, FLEX included.
+        open_slots = np.maximum(self.starters - counts, 0) + np.where(
+            self.is_flex, flex_open[:, None], 0
+        )
+        penalty = np.where(open_slots > 0, 0.0, self.teams * (surplus + 1.0))
+        penalty[:, self.no_bench] = np.where(
+            open_slots[:, self.no_bench] > 0, 0.0, np.inf
+        )
+        unfilled = np.maximum(self.starters - counts, 0).sum(axis=1) + flex_open
+        must_fill = (self.rounds - picks_made) <= unfilled
+        penalty[must_fill[:, None] & (open_slots == 0)] = np.inf
+        return penalty
+
+
+class _PositionQueues:
+    """
+    Each position's players in one draft-batch's preference order, with a
+    pointer per draft to the first one still available.
+    """
+
+    def __init__(
+        self, preference: np.ndarray, codes: np.ndarray, n_positions: int, drafts: int
+    ):
+        """
+        Args:
+            preference: A (drafts, players) array of pick scores, lower first,
+                or a (players,) array shared by every draft.
+            codes: Each player's position code.
+            n_positions: The number of position codes.
+            drafts: The number of drafts in the batch.
+        """
+        self.preference = preference
+        self.queues = []
+        for code in range(n_positions):
+            players = np.flatnonzero(codes == code)
+            order = np.argsort(preference[..., players], axis=-1, kind="stable")
+            self.queues.append(np.atleast_2d(players[order]))
+        self.pointers = np.zeros((drafts, n_positions), dtype=np.int64)
+
+    def heads(self, drafts: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Each position's first available player and its score, per draft."""
+        players = np.full(self.pointers.shape, -1)
+        scores = np.full(self.pointers.shape, np.inf, dtype=np.float32)
+        for code, queue in enumerate(self.queues):
+            open_ = self.pointers[:, code] < queue.shape[1]
+            rows = drafts[open_] if queue.shape[0] > 1 else np.zeros(open_.sum(), int)
+            players[open_, code] = queue[rows, self.pointers[open_, code]]
+            scores[open_, code] = (
+                self.preference[drafts[open_], players[open_, code]]
+                if self.preference.ndim == 2
+                else self.preference[players[open_, code]]
+            )
+        return players, scores
+
+    def advance(self, available: np.ndarray, drafts: np.ndarray, codes: np.ndarray):
+        """Moves the pointers of the given positions past taken players."""
+        for code, queue in enumerate(self.queues):
+            moving = drafts[codes == code]
+            while len(moving):
+                pointer = self.pointers[moving, code]
+                open_ = pointer < queue.shape[1]
+                moving, pointer = moving[open_], pointer[open_]
+                rows = moving if queue.shape[0] > 1 else np.zeros(len(moving), int)
+                taken = ~available[moving, queue[rows, pointer]]
+                moving = moving[taken]
+                self.pointers[moving, code] += 1
+
+
+def simulate_availability(
+    adp: np.ndarray,
+    positions: np.ndarray,
+    roster: RosterSettings,
+    teams: int,
+    slot: int,
+    rounds: int,
+    simulations: int = DEFAULT_SIMULATIONS,
+    seed: int = 0,
+) -> np.ndarray:
+    """
+    The probability that each player is available at each of my picks.
+
+    The best player for a team is the best of each position's first
+    available player once that position's need penalty is added, so each
+    pick compares (drafts, positions) arrays rather than every player.
+
+    Args:
+        adp: Each board player's ADP, in board (my preference) order.
+        positions: Each board player's position.
+        roster: Starting slots per position.
+        teams: Teams in the league.
+        slot: My 1-based draft slot.
+        rounds: Rounds in the draft.
+        simulations: Drafts to simulate.
+        seed: Seed of the random draws.
+
+    Returns:
+        A (my picks, players) array of availability probabilities.
+    """
+    if not 1 <= slot <= teams:
+        raise ValueError(f"The draft slot must be between 1 and {teams}, got {slot}.")
+    if teams * rounds > len(adp):
+        raise ValueError(
+            f"{teams} teams x {rounds} rounds need {teams * rounds} players; "
+            f"the board has {len(adp)}."
+        )
+    rng = np.random.default_rng(seed)
+    n_players = len(adp)
+    n_positions = len(DRAFT_POSITIONS)
+    codes = np.array([DRAFT_POSITIONS.index(pos) for pos in positions])
+    order = snake_order(teams, rounds)
+    mine = order == slot - 1
+    need = _PositionalNeed(roster, teams, rounds)
+    spread = np.maximum(ADP_SPREAD * adp, ADP_MIN_SD).astype(np.float32)
+    board_rank = np.arange(n_players, dtype=np.float32)
+
+    available_at_my_picks = np.zeros((int(mine.sum()), n_players))
+    for start in range(0, simulations, BATCH_SIZE):
+        size = min(BATCH_SIZE, simulations - start)
+        drafts = np.arange(size)
+        drawn = adp.astype(np.float32) + spread * rng.standard_normal(
+            (size, n_players), dtype=np.float32
+        )
+        opponents = _PositionQueues(drawn, codes, n_positions, size)
+        board = _PositionQueues(board_rank, codes, n_positions, size)
+        available = np.ones((size, n_players), dtype=bool)
+        counts = np.zeros((size, teams, n_positions), dtype=np.int64)
+        my_pick = 0
+        for pick, team in enumerate(order):
+            if mine[pick]:
+                available_at_my_picks[my_pick] += available.sum(axis=0)
+                my_pick += 1
+            heads, head_scores = (board if mine[pick] else opponents).heads(drafts)
+            score = head_scores + need(counts[:, team], pick // teams)
+            # With no eligible player left, take the best available one.
+            stuck = np.isinf(score.min(axis=1))
+            score[stuck] = head_scores[stuck]
+            # Ties go to the player listed first on the board.
+            best = score.min(axis=1, keepdims=True)
+            tied = np.where(score == best, heads, n_players)
+            choice = tied.min(axis=1)
+            chosen_codes = codes[choice]
+            available[drafts, choice] = False
+            counts[drafts, team, chosen_codes] += 1
+            opponents.advance(available, drafts, chosen_codes)
+            board.advance(available, drafts, chosen_codes)
+    return available_at_my_picks / simulations
+
+
+def run_draft_simulation(
+    date_str: str,
+    slot: int,
+    simulations: int = DEFAULT_SIMULATIONS,
+    rounds: int | None = None,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """
+    Simulates a run's draft from my slot and saves draft_availability.json.
+
+    Args:
+        date_str: The run whose players_final.json is the board.
+        slot: My 1-based draft slot.
+        simulations: Drafts to simulate.
+        rounds: Rounds in the draft; defaults to the roster's starting slots.
+        seed: Seed of the random draws.
+
+    Returns:
+        The board with one 'pick_<overall pick>' availability column per pick
+        of mine.
+    """
+    data_dir = settings.DATA_DIR / date_str
+    cfg = settings.league_config
+    board = pd.DataFrame(load_json(data_dir / "players_final.json"))
+    rounds = rounds or sum(cfg.roster.model_dump().values())
+    log.info(
+        "Starting draft simulation.",
+        extra={"date": date_str, "slot": slot, "simulations": simulations},
+    )
+    availability = simulate_availability(
+        board["adp"].to_numpy(dtype=np.float64),
+        board["position"].to_numpy(dtype=object),
+        cfg.roster,
+        cfg.teams,
+        slot,
+        rounds,
+        simulations,
+        seed,
+    )
+    picks = my_picks(slot, cfg.teams, rounds)
+    output = board[["id", "name", "team", "position", "adp", "vor"]].copy()
+    for pick, row in zip(picks, availability):
+        output[f"pick_{pick}"] = row.round(3)
+
+    output_path = data_dir / "draft_availability.json"
+    save_json(output_path, output.replace({np.nan: None}).to_dict(orient="records"))
+    log.info(
+        "Draft simulation completed.",
+        extra={"path": str(output_path), "picks": picks.tolist()},
+    )
+    return output
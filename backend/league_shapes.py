@@ -0,0 +1,212 @@
+# Path: ffbPlayerDraftingApp/backend/league_shapes.py
+
+"""
+The league-shape cube: VOR and rank of every drafted player for a grid of
+team counts and starter counts, computed in one pass.
+
+Expected points do not depend on the league's shape; only the replacement
+levels do. compute_vor.shape_vor finds every shape's levels from one sort per
+position, so the whole grid costs little more than a single VOR phase. The
+cube is saved next to the run as league_shapes.json:
+
+- players: the board (players with an ADP) in players_final.json's fields,
+  without 'id' and 'vor';
+- shapes: each shape's teams, roster and replacement levels;
+- vor / rank: one row per shape, one column per board player.
+
+query_shape then reads a shape's board from the cube without recomputing it,
+in the same format as players_final.json.
+"""
+
+import itertools
+
+import numpy as np
+import pandas as pd
+
+from backend.logging_config import log
+from backend.settings import RosterSettings, settings
+from backend.storage.file_store import load_json, save_json
+from backend.sweep import parse_grid
+from backend.transforms.adjustments import PlayerAdjustments
+from backend.transforms.compute_vor import shape_vor
+
+CUBE_FILE = "league_shapes.json"
+# Refuse grids with more shapes than this; the cube grows by one row of VOR
+# and one of ranks per shape.
+MAX_SHAPES = 5_000
+# Shapes evaluated per batch; bounds memory at a few (batch, players) arrays.
+BATCH_SIZE = 500
+
+
+def parse_counts(spec: str) -> list[int]:
+    """Parses team or starter counts: '12', '10,12,14' or '8:14:4' (see parse_grid)."""
+    values = parse_grid(spec)
+    if not np.all(values == np.round(values)):
+        raise ValueError(f"Counts must be whole numbers, got '{spec}'.")
+    return [int(v) for v in values]
+
+
+def shape_key(teams: int, roster: dict[str, int]) -> str:
+    """A shape's lookup key, e.g. '12|QB1-RB2-WR3-TE1-FLEX1-K1-DEF1'."""
+    return f"{teams}|" + "-".join(
+        f"{pos}{roster[pos]}" for pos in RosterSettings.model_fields
+    )
+
+
+def build_shapes(
+    teams: list[int] | None = None, starters: dict[str, list[int]] | None = None
+) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+    """
+    Expands the team counts and starter grids into one row per shape. Roster
+    positions without a grid keep the league config's starter count.
+
+    Returns:
+        (teams per shape, roster position -> starters per shape)
+    """
+    cfg = settings.league_config
+    starters = starters or {}
+    unknown = set(starters) - set(RosterSettings.model_fields)
+    if unknown:
+        raise ValueError(
+            f"Unknown roster positions {sorted(unknown)}. "
+            f"Use {list(RosterSettings.model_fields)}."
+        )
+    grids = {"teams": teams or [cfg.teams]}
+    for pos, default in cfg.roster.model_dump().items():
+        grids[pos] = starters.get(pos) or [default]
+    for name, values in grids.items():
+        if any(v < (1 if name == "teams" else 0) for v in values):
+            raise ValueError(f"Invalid {name} values {values}.")
+
+    n_shapes = int(np.prod([len(values) for values in grids.values()]))
+    if n_shapes > MAX_SHAPES:
+        raise ValueError(
+            f"The grid has {n_shapes:,} shapes; the limit is {MAX_SHAPES:,}. "
+            "Use fewer values."
+        )
+    columns = np.array(list(itertools.product(*grids.values())), dtype=np.int64)
+    table = {name: columns[:, i] for i, name in enumerate(grids)}
+    return table.pop("teams"), table
+
+
+def run_league_shapes(
+    date_str: str,
+    teams: list[int] | None = None,
+    starters: dict[str, list[int]] | None = None,
+) -> dict:
+    """
+    Builds the league-shape cube for a dated run's players_with_ppg.json and
+    saves it as league_shapes.json.
+
+    Args:
+        date_str: The run's date directory.
+        teams: Team counts; defaults to the league config's.
+        starters: Roster position -> starter counts, e.g. {"WR": [2, 3]}.
+    """
+    data_dir = settings.DATA_DIR / date_str
+    log.info("Starting league-shape cube.", extra={"date": date_str})
+    df = pd.DataFrame(load_json(data_dir / "players_with_ppg.json"))
+    cfg = settings.league_config
+    shape_teams, shape_starters = build_shapes(teams, starters)
+
+    penalties = PlayerAdjustments(df["slug"], df["position"], cfg, apply_penalties=True)
+
+    # As in run_vor: levels from the un-penalized points, then the penalty,
+    # then only the players with an ADP are ranked.
+    points = df["expected_ppg"].to_numpy(dtype=np.float64, na_value=np.nan)
+    positions = df["position"].to_numpy(dtype=object)
+    on_board = df["adp"].notna().to_numpy()
+    board = df[on_board]
+    n_shapes, n_board = len(shape_teams), int(on_board.sum())
+    vor = np.empty((n_shapes, n_board))
+    rank = np.empty((n_shapes, n_board), dtype=np.int64)
+    levels = {pos: np.empty(n_shapes) for pos in RosterSettings.model_fields}
+    for start in range(0, n_shapes, BATCH_SIZE):
+        batch = slice(start, start + BATCH_SIZE)
+        batch_vor, batch_levels = shape_vor(
+            points,
+            positions,
+            shape_teams[batch],
+            {pos: values[batch] for pos, values in shape_starters.items()},
+        )
+        batch_vor = (batch_vor * penalties.penalty_multiplier)[:, on_board]
+        order = np.argsort(-batch_vor, axis=1, kind="stable")
+        rows = np.arange(len(order))[:, None]
+        rank[batch][rows, order] = np.arange(1, n_board + 1)
+        vor[batch] = batch_vor
+        for pos, level in batch_levels.items():
+            levels[pos][batch] = level
+
+    shapes = []
+    for i in range(n_shapes):
+        roster = {pos: int(values[i]) for pos, values in shape_starters.items()}
+        shapes.append(
+            {
+                "key": shape_key(int(shape_teams[i]), roster),
+                "teams": int(shape_teams[i]),
+                "roster": roster,
+                "replacement_levels": {
+                    pos: None if np.isnan(level[i]) else round(float(level[i]), 4)
+                    for pos, level in levels.items()
+                },
+            }
+        )
+    ppg = penalties.apply_penalties(points)[on_board]
+    cube = {
+        "date": date_str,
+        "base": shape_key(cfg.teams, cfg.roster.model_dump()),
+        "players": pd.DataFrame(
+            {
+                "name": board["first_name"] + " " + board["last_name"],
+                "team": board["team"],
+                "position": board["position"],
+                "adp": board["adp"].astype(float).round(1),
+                "bye": board["bye_week"].astype("Int64"),
+                "ppg": np.round(ppg, 2),
+            }
+        )
+        .replace({np.nan: None})
+        .to_dict(orient="records"),
+        "shapes": shapes,
+        "vor": np.where(np.isnan(vor), None, np.round(vor, 2)).tolist(),
+        "rank": rank.tolist(),
+    }
+    # Compact: the VOR and rank rows would put every number on its own line.
+    save_json(data_dir / CUBE_FILE, cube, indent=None)
+    log.info(
+        "League-shape cube saved.",
+        extra={
+            "shapes": n_shapes,
+            "players": n_board,
+            "path": str(data_dir / CUBE_FILE),
+        },
+    )
+    return cube
+
+
+def query_shape(
+    date_str: str, teams: int | None = None, starters: dict[str, int] | None = None
+) -> list[dict]:
+    """
+    Reads one shape's board from a run's league-shape cube. Roster positions
+    not given keep the league config's starter count.
+
+    Returns:
+        The board in players_final.json's format, best VOR first.
+    """
+    cfg = settings.league_config
+    cube = load_json(settings.DATA_DIR / date_str / CUBE_FILE)
+    roster = {**cfg.roster.model_dump(), **(starters or {})}
+    key = shape_key(teams or cfg.teams, roster)
+    index = {shape["key"]: i for i, shape in enumerate(cube["shapes"])}
+    if key not in index:
+        raise ValueError(
+            f"Shape '{key}' is not in the cube; rebuild it with league-shapes."
+        )
+    i = index[key]
+    board = []
+    for player, vor, rank in zip(cube["players"], cube["vor"][i], cube["rank"][i]):
+        board.append({"id": rank, **player, "vor": vor})
+    board.sort(key=lambda player: player["id"])
+    fields = ["id", "name", "team", "position", "adp", "vor", "bye", "ppg"]
+    return [{field: player[field] for field in fields} for player in board]
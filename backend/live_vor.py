@@ -0,0 +1,351 @@
+# Path: ffbPlayerDraftingApp/backend/live_vor.py
+
+"""
+Live-draft VOR: replacement levels that move as the draft picks over each
+position.
+
+Preseason, a position's replacement player is its (teams x starters)-th best
+(see compute_vor.py). During a draft each pick changes that: the open
+starting slots at the player's position drop by one (or, once its starters
+are all drafted, a FLEX slot is used), and the player leaves the pool. The
+live replacement level is the player ranked at the open slot count among
+the remaining players, and FLEX's is the player ranked at the open FLEX
+slots among the RB/WR/TE players left below their position's cut.
+
+LiveVor keeps one Fenwick tree of remaining players per position, over the
+position's players in a fixed order by points, plus one over the merged
+RB/WR/TE order flagging who is in the FLEX pool. A pick or an undo updates
+O(1) entries and re-reads two replacement levels by k-th-element descent,
+so it costs O(log n) instead of a full re-rank. A player's VOR is a lookup
+against their position's current level; within a position it keeps the
+points order, so the best remaining players are a merge of the positions'
+heads.
+
+Conventions follow compute_vor: points-less positions and positions
+without starters are measured against 0.0, as is a position with fewer
+players left than open slots. Once a position's starters are all drafted,
+its best remaining player becomes its replacement level; once every FLEX
+slot is used, FLEX no longer lifts anyone's VOR. Positional penalties
+scale VOR after the levels are found, as in the VOR phase.
+"""
+
+import heapq
+import math
+
+import numpy as np
+import pandas as pd
+
+from backend.constants import FLEX_POSITIONS
+from backend.logging_config import log
+from backend.settings import RosterSettings, settings
+from backend.storage.file_store import load_json
+from backend.transforms.adjustments import PlayerAdjustments
+
+
+class _Fenwick:
+    """Present/absent flags over a fixed order, with k-th present lookup."""
+
+    def __init__(self, present: np.ndarray):
+        self.n = len(present)
+        tree = [0] + [int(flag) for flag in present]
+        for i in range(1, self.n + 1):
+            parent = i + (i & -i)
+            if parent <= self.n:
+                tree[parent] += tree[i]
+        self.tree = tree
+        self.total = int(np.sum(present))
+        self.top_step = 1 << (self.n.bit_length() - 1) if self.n else 0
+
+    def add(self, i: int, delta: int) -> None:
+        """Adds delta to slot i (0-based)."""
+        self.total += delta
+        i += 1
+        while i <= self.n:
+            self.tree[i] += delta
+            i += i & -i
+
+    def prefix(self, i: int) -> int:
+        """How many slots before slot i are present."""
+        count = 0
+        while i > 0:
+            count += self.tree[i]
+            i -= i & -i
+        return count
+
+    def kth(self, k: int) -> int:
+        """The 0-based slot of the k-th present one, 1 <= k <= total."""
+        slot, step = 0, self.top_step
+        while step:
+            if slot + step <= self.n and self.tree[slot + step] < k:
+                slot += step
+                k -= self.tree[slot]
+            step >>= 1
+        return slot
+
+
+class LiveVor:
+    """Replacement levels and VOR of the players left in a draft."""
+
+    def __init__(
+        self,
+        points: np.ndarray,
+        positions: np.ndarray,
+        roster: RosterSettings,
+        teams: int,
+        penalties: dict[str, float] | None = None,
+        listed: np.ndarray | None = None,
+    ):
+        """
+        Args:
+            points: Expected points per player.
+            positions: One position per player.
+            roster: Starters per position.
+            teams: Number of teams in the league.
+            penalties: Position -> VOR multiplier (the league's positional
+                penalties, as validated by PlayerAdjustments).
+            listed: Which players best_available may return; every player
+                counts towards the replacement levels either way.
+        """
+        self.points = np.asarray(points, dtype=np.float64)
+        self.positions = np.asarray(positions, dtype=object)
+        n = len(self.points)
+        self.roster = roster
+        self.remaining = np.ones(n, dtype=bool)
+        self.listed = np.ones(n, dtype=bool) if listed is None else np.asarray(listed)
+        self.history: list[int] = []
+
+        # --- One group per position, its players ordered by points ---
+        self.group_positions = list(dict.fromkeys(self.positions))
+        self.group = np.array(
+            [self.group_positions.index(pos) for pos in self.positions], dtype=np.int64
+        )
+        self.orders, self.trees = [], []
+        self.rank = np.zeros(n, dtype=np.int64)
+        for g in range(len(self.group_positions)):
+            members = np.flatnonzero(self.group == g)
+            # Descending, NaN last, as _kth_largest orders them.
+            order = members[np.argsort(-self.points[members], kind="stable")]
+            self.rank[order] = np.arange(len(order))
+            self.orders.append(order)
+            self.trees.append(_Fenwick(np.ones(len(order), dtype=bool)))
+        self.slots = [
+            teams * getattr(roster, pos) if pos in RosterSettings.model_fields else 0
+            for pos in self.group_positions
+        ]
+        self.drafted = [0] * len(self.group_positions)
+        self.is_flex = np.isin(self.positions, FLEX_POSITIONS)
+        self.flex_group = [pos in FLEX_POSITIONS for pos in self.group_positions]
+
+        # --- The FLEX pool, over every RB/WR/TE player ordered by points ---
+        self.flex_slots = teams * roster.FLEX
+        self.flex_surplus = 0
+        flex_members = np.flatnonzero(self.is_flex)
+        self.flex_order = flex_members[
+            np.argsort(-self.points[flex_members], kind="stable")
+        ]
+        self.flex_rank = np.full(n, -1, dtype=np.int64)
+        self.flex_rank[self.flex_order] = np.arange(len(self.flex_order))
+        slots = np.array(self.slots, dtype=np.int64)
+        self.in_pool = self.is_flex & (self.rank >= slots[self.group])
+        self.flex_tree = _Fenwick(self.in_pool[self.flex_order])
+
+        self.multiplier = np.ones(len(self.group_positions))
+        for pos, penalty in (penalties or {}).items():
+            if pos in self.group_positions:
+                self.multiplier[self.group_positions.index(pos)] = penalty
+        self.group_levels = np.zeros(len(self.group_positions))
+        for g in range(len(self.group_positions)):
+            self._refresh_level(g)
+        self.flex_level = 0.0
+        self._refresh_flex_level()
+
+    # --- Replacement levels ---
+
+    def _open_slots(self, g: int) -> int:
+        return max(self.slots[g] - self.drafted[g], 0)
+
+    def _open_flex_slots(self) -> int:
+        return self.flex_slots - min(self.flex_surplus, self.flex_slots)
+
+    def _refresh_level(self, g: int) -> None:
+        k = max(self._open_slots(g), 1)
+        tree = self.trees[g]
+        if self.slots[g] == 0 or k > tree.total:
+            self.group_levels[g] = 0.0
+        else:
+            self.group_levels[g] = self.points[self.orders[g][tree.kth(k)]]
+
+    def _refresh_flex_level(self) -> None:
+        k = self._open_flex_slots()
+        if 0 < k <= self.flex_tree.total:
+            self.flex_level = float(self.points[self.flex_order[self.flex_tree.kth(k)]])
+        else:
+            self.flex_level = 0.0
+
+    @property
+    def levels(self) -> dict[str, float]:
+        """Position -> current replacement level, keyed as compute_vor's."""
+        levels = {}
+        for pos in RosterSettings.model_fields:
+            if pos == "FLEX":
+                continue
+            g = self.group_positions.index(pos) if pos in self.group_positions else -1
+            levels[pos] = float(self.group_levels[g]) if g >= 0 else 0.0
+        levels["FLEX"] = self.flex_level
+        return levels
+
+    # --- The FLEX pool ---
+
+    def _near_cut(self, g: int) -> list[int]:
+        """The remaining players ranked at and just below g's open slot count."""
+        tree, k = self.trees[g], self._open_slots(g)
+        return [
+            int(self.orders[g][tree.kth(rank)])
+            for rank in (k, k + 1)
+            if 1 <= rank <= tree.total
+        ]
+
+    def _sync_pool(self, players: list[int]) -> None:
+        """Sets each player's FLEX pool flag from the current draft state."""
+        for i in players:
+            g = self.group[i]
+            in_pool = bool(
+                self.remaining[i]
+                and self.trees[g].prefix(self.rank[i]) >= self._open_slots(g)
+            )
+            if in_pool != self.in_pool[i]:
+                self.in_pool[i] = in_pool
+                self.flex_tree.add(self.flex_rank[i], 1 if in_pool else -1)
+
+    # --- Picks ---
+
+    def _move(self, i: int, drafted: bool) -> None:
+        g = self.group[i]
+        flex = self.flex_group[g]
+        # Only these players can cross the cut into or out of the FLEX pool.
+        changed = [i, *self._near_cut(g)] if flex else []
+        self.trees[g].add(self.rank[i], -1 if drafted else 1)
+        self.remaining[i] = not drafted
+        if drafted:
+            if flex and self.drafted[g] >= self.slots[g]:
+                self.flex_surplus += 1
+            self.drafted[g] += 1
+        else:
+            self.drafted[g] -= 1
+            if flex and self.drafted[g] >= self.slots[g]:
+                self.flex_surplus -= 1
+        if flex:
+            self._sync_pool(changed + self._near_cut(g))
+            self._refresh_flex_level()
+        self._refresh_level(g)
+
+    def pick(self, i: int) -> None:
+        """Removes player i from the pool."""
+        if not self.remaining[i]:
+            raise ValueError(f"Player {i} has already been drafted.")
+        self._move(i, drafted=True)
+        self.history.append(i)
+
+    def undo(self) -> int:
+        """Puts the last drafted player back and returns their index."""
+        if not self.history:
+            raise ValueError("No pick to undo.")
+        i = self.history.pop()
+        self._move(i, drafted=False)
+        return i
+
+    # --- VOR ---
+
+    def player_vor(self, i: int) -> float:
+        """One player's current VOR, NaN once drafted."""
+        if not self.remaining[i]:
+            return float("nan")
+        g = self.group[i]
+        points = self.points[i]
+        vor = points - self.group_levels[g]
+        if self.is_flex[i] and self._open_flex_slots() > 0:
+            flex_vor = points - self.flex_level
+            vor = max(vor, flex_vor)
+        return float(vor * self.multiplier[g])
+
+    def vor(self) -> np.ndarray:
+        """Every player's current VOR, NaN for drafted players."""
+        vor = self.points - self.group_levels[self.group]
+        if self._open_flex_slots() > 0:
+            flex_vor = self.points - self.flex_level
+            vor = np.where(self.is_flex & (flex_vor > vor), flex_vor, vor)
+        vor = vor * self.multiplier[self.group]
+        return np.where(self.remaining, vor, np.nan)
+
+    def best_available(
+        self, top: int, position: str | None = None
+    ) -> list[tuple[int, float]]:
+        """
+        The best remaining listed players by VOR.
+
+        Each position's players keep their points order in VOR, so the
+        board is a merge of the positions' first remaining players. Ties go
+        to the lower player index and NaN VOR ranks last, as a stable sort
+        of the whole board would order them.
+
+        Returns:
+            Up to `top` (player index, VOR) pairs, best first.
+        """
+        groups = [
+            g
+            for g, pos in enumerate(self.group_positions)
+            if position is None or pos == position
+        ]
+        heap = []
+
+        def push(g: int, slot: int) -> None:
+            i = int(self.orders[g][slot])
+            vor = self.player_vor(i)
+            heapq.heappush(heap, (np.inf if math.isnan(vor) else -vor, i, g, slot))
+
+        for g in groups:
+            if self.trees[g].total:
+                push(g, self.trees[g].kth(1))
+        board = []
+        while heap and len(board) < top:
+            key, i, g, slot = heapq.heappop(heap)
+            if self.listed[i]:
+                board.append((i, -key if key != np.inf else float("nan")))
+            tree = self.trees[g]
+            passed = tree.prefix(slot + 1)
+            if passed < tree.total:
+                push(g, tree.kth(passed + 1))
+        return board
+
+
+def load_live_draft(date_str: str) -> tuple[LiveVor, pd.DataFrame]:
+    """
+    A live-draft engine over a run's players_with_ppg.json.
+
+    Replacement levels use every player's un-penalized expected_ppg, and the
+    league's positional penalties scale the VOR, as in the VOR phase. Only
+    players with an ADP are listed on the board.
+
+    Returns:
+        (the engine, the players frame its indices refer to)
+    """
+    players = pd.DataFrame(
+        load_json(settings.DATA_DIR / date_str / "players_with_ppg.json")
+    )
+    cfg = settings.league_config
+    adjustments = PlayerAdjustments(
+        players["slug"], players["position"], cfg, apply_penalties=True
+    )
+    engine = LiveVor(
+        players["expected_ppg"].to_numpy(dtype=np.float64),
+        players["position"].to_numpy(dtype=object),
+        cfg.roster,
+        cfg.teams,
+        adjustments.penalties,
+        players["adp"].notna().to_numpy(),
+    )
+    log.info(
+        "Live draft engine ready.",
+        extra={"date": date_str, "players": len(players), **engine.levels},
+    )
+    return engine, players
@@ -2,6 +2,7 @@
 
 import logging
 import sys
+from contextlib import contextmanager
 
 from pythonjsonlogger import jsonlogger
 
@@ -29,3 +30,18 @@ handler.setFormatter(formatter)
 log.addHandler(handler)
 
 # Now, any file can just 'from backend.logging_config import log' to use it.
+
+
+@contextmanager
+def quiet_logs(level: int = logging.WARNING):
+    """
+    Drops the application's log records below `level` inside the block, for
+    batch commands that rerun pipeline code many times. Warnings and errors
+    still come through, and the previous level is restored on exit.
+    """
+    previous_level = log.level
+    log.setLevel(max(level, previous_level))
+    try:
+        yield
+    finally:
+        log.setLevel(previous_level)
@@ -0,0 +1,282 @@
+# Path: ffbPlayerDraftingApp/backend/match_harness.py
+
+"""
+Accuracy and throughput harness for player-name matchers.
+
+Ground truth is player_alias_map.json plus the curated pairs in
+match_labels.json. Each matcher is run over source name lists, either recorded
+by the enrich phase (source_records.json) or generated at several pool sizes by
+perturbing canonical names the way real sources do (suffixes, team codes,
+missing players), and scored for precision, recall, duplicate assignments and
+throughput.
+"""
+
+import random
+import time
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from backend.logging_config import quiet_logs
+from backend.settings import settings
+from backend.storage.file_store import load_json
+from backend.transforms.resolve_identity import UNRESOLVED, PlayerIdentityResolver
+from backend.utils import create_hybrid_slug_map, load_alias_map
+
+# A matcher takes the canonical player frame ('slug', 'position', 'team', ...)
+# and the source records ('slug', 'position', 'team') and returns, for every
+# source record, the canonical slug it was matched to (or None).
+Matcher = Callable[[pd.DataFrame, pd.DataFrame], list[str | None]]
+
+DEFAULT_POOL_SIZES = (250, 500, 1000, 2000)
+_POSITIONS = ["QB", "RB", "WR", "TE", "K"]
+_TEAMS = ["ARI", "BUF", "CIN", "DAL", "DET", "KC", "MIN", "PHI", "SF", "TB"]
+_FIRST = [
+    "aaron",
+    "brian",
+    "chris",
+    "dj",
+    "evan",
+    "jalen",
+    "josh",
+    "kenneth",
+    "mike",
+    "tyler",
+]
+_LAST = [
+    "allen",
+    "brown",
+    "davis",
+    "harris",
+    "jones",
+    "moore",
+    "smith",
+    "thomas",
+    "walker",
+    "white",
+]
+_SUFFIXES = ["jr", "sr", "ii", "iii"]
+
+
+# --- Matchers under test ---
+def hybrid_slug_map_matcher(
+    canonical: pd.DataFrame, source: pd.DataFrame
+) -> list[str | None]:
+    """The original create_hybrid_slug_map (name-only, canonical -> source)."""
+    source_slugs = source["slug"].tolist()
+    mapped = create_hybrid_slug_map(
+        {slug: slug for slug in source_slugs}, canonical["slug"].tolist()
+    )
+    source_to_canonical = {src: canon for canon, src in mapped.items()}
+    return [source_to_canonical.get(slug) for slug in source_slugs]
+
+
+def resolver_matcher(canonical: pd.DataFrame, source: pd.DataFrame) -> list[str | None]:
+    """PlayerIdentityResolver with position/team partitions and name keys."""
+    resolver = PlayerIdentityResolver(canonical)
+    ids = resolver.resolve(
+        source["slug"].tolist(),
+        teams=source["team"].tolist(),
+        positions=source["position"].tolist(),
+        source_name="harness",
+    )
+    return [resolver.slugs[i] if i != UNRESOLVED else None for i in ids]
+
+
+MATCHERS: dict[str, Matcher] = {
+    "create_hybrid_slug_map": hybrid_slug_map_matcher,
+    "PlayerIdentityResolver": resolver_matcher,
+}
+
+
+# --- Ground truth ---
+def load_ground_truth() -> pd.DataFrame:
+    """
+    Labeled (source slug -> canonical slug) pairs from the alias map and
+    match_labels.json. Alias entries carry no position.
+    """
+    rows = [
+        {"source": src, "canonical": canon, "position": None}
+        for src, canon in load_alias_map().items()
+    ]
+    labels_path = settings.BASE_DIR / "match_labels.json"
+    if labels_path.exists():
+        rows.extend(load_json(labels_path).get("pairs", []))
+    truth = pd.DataFrame(rows, columns=["source", "canonical", "position"])
+    return truth.drop_duplicates(subset="source", keep="last").reset_index(drop=True)
+
+
+def build_synthetic_pool(
+    truth: pd.DataFrame, pool_size: int, seed: int = 0, missing_rate: float = 0.1
+) -> tuple[pd.DataFrame, pd.DataFrame, dict[int, str | None]]:
+    """
+    Generates a canonical pool of `pool_size` players and a source list that
+    refers to them the way scraped sources do.
+
+    Returns:
+        (canonical frame, source records, {source row -> expected canonical slug})
+    """
+    rng = random.Random(seed)
+
+    canonical_rows = {}
+    for pair in truth.itertuples(index=False):
+        canonical_rows[pair.canonical] = pair.position or rng.choice(_POSITIONS)
+    while len(canonical_rows) < pool_size:
+        slug = f"{rng.choice(_FIRST)}-{rng.choice(_LAST)}-{len(canonical_rows)}"
+        canonical_rows[slug] = rng.choice(_POSITIONS)
+    canonical = pd.DataFrame(
+        [
+            {
+                "player_id": str(i),
+                "slug": slug,
+                "position": pos,
+                "team": rng.choice(_TEAMS),
+            }
+            for i, (slug, pos) in enumerate(canonical_rows.items())
+        ]
+    )
+
+    # Some players are missing from the canonical pool (e.g. pruned or retired);
+    # their source records must stay unmatched.
+    missing = {slug for slug in canonical["slug"] if rng.random() < missing_rate}
+    team_of = dict(zip(canonical["slug"], canonical["team"]))
+    pos_of = dict(zip(canonical["slug"], canonical["position"]))
+
+    labeled_canonicals = set(truth["canonical"])
+    source_rows, expected = [], {}
+    for pair in truth.itertuples(index=False):
+        expected[len(source_rows)] = (
+            None if pair.canonical in missing else pair.canonical
+        )
+        source_rows.append(
+            {
+                "slug": pair.source,
+                "position": pair.position,
+                "team": team_of[pair.canonical],
+            }
+        )
+    for slug in canonical["slug"]:
+        if slug in labeled_canonicals:
+            continue
+        variant = slug
+        roll = rng.random()
+        if roll < 0.15:
+            variant = f"{slug}-{rng.choice(_SUFFIXES)}"
+        elif roll < 0.25:
+            variant = f"{slug}-{team_of[slug].lower()}"
+        expected[len(source_rows)] = None if slug in missing else slug
+        source_rows.append(
+            {"slug": variant, "position": pos_of[slug], "team": team_of[slug]}
+        )
+
+    canonical = canonical[~canonical["slug"].isin(missing)].reset_index(drop=True)
+    return canonical, pd.DataFrame(source_rows), expected
+
+
+def load_recorded_pool(
+    date_str: str, truth: pd.DataFrame
+) -> list[tuple[str, pd.DataFrame, pd.DataFrame, dict[int, str | None]]]:
+    """
+    Loads the canonical players and the source records saved by the enrich
+    phase. Only sources with a ground-truth label are scored for accuracy.
+    """
+    data_dir = settings.DATA_DIR / date_str
+    canonical = pd.DataFrame(load_json(data_dir / "players_enriched.json"))
+    recorded = load_json(data_dir / "source_records.json")
+    truth_map = dict(zip(truth["source"], truth["canonical"]))
+    canonical_slugs = set(canonical["slug"])
+
+    pools = []
+    for source_name, records in recorded.items():
+        source = pd.DataFrame(records, columns=["slug", "team", "position"])
+        expected = {
+            i: (truth_map[slug] if truth_map[slug] in canonical_slugs else None)
+            for i, slug in enumerate(source["slug"])
+            if slug in truth_map
+        }
+        pools.append((source_name, canonical, source, expected))
+    return pools
+
+
+# --- Scoring ---
+def evaluate_matcher(
+    matcher: Matcher,
+    canonical: pd.DataFrame,
+    source: pd.DataFrame,
+    expected: dict[int, str | None],
+) -> dict:
+    """Runs one matcher once and scores it against the labeled rows."""
+    start = time.perf_counter()
+    predicted = matcher(canonical, source)
+    elapsed = time.perf_counter() - start
+
+    labeled = np.array(list(expected), dtype=np.int64)
+    truth = [expected[i] for i in labeled]
+    guess = [predicted[i] for i in labeled]
+    true_positive = sum(g is not None and g == t for g, t in zip(guess, truth))
+    predicted_positive = sum(g is not None for g in guess)
+    actual_positive = sum(t is not None for t in truth)
+
+    # A duplicate is a canonical player claimed by more source records than the
+    # labels expect (several labeled spellings of one player are legitimate).
+    assigned = pd.Series(predicted, dtype=object).value_counts()
+    allowed = pd.Series(list(expected.values()), dtype=object).value_counts()
+    allowed = allowed.reindex(assigned.index, fill_value=0).clip(lower=1)
+    duplicates = int((assigned > allowed).sum())
+    return {
+        "canonical_players": len(canonical),
+        "source_records": len(source),
+        "labeled": len(labeled),
+        "precision": true_positive / predicted_positive if predicted_positive else 1.0,
+        "recall": true_positive / actual_positive if actual_positive else 1.0,
+        "false_positives": predicted_positive - true_positive,
+        "duplicate_assignments": duplicates,
+        "seconds": elapsed,
+        # Matchers block and partition internally, so the cross product is not
+        # the work done; source records matched per second is comparable.
+        "records_per_second": len(source) / elapsed if elapsed > 0 else float("inf"),
+    }
+
+
+def run_match_harness(
+    date_str: str | None = None,
+    pool_sizes: tuple[int, ...] = DEFAULT_POOL_SIZES,
+    matchers: dict[str, Matcher] | None = None,
+    seed: int = 0,
+) -> list[dict]:
+    """
+    Scores every matcher on synthetic pools of each size and, when a dated run
+    with source_records.json exists, on the recorded source lists too.
+
+    Returns:
+        One result dict per (matcher, pool), also printed as a table.
+    """
+    matchers = matchers or MATCHERS
+    truth = load_ground_truth()
+    pools = [
+        (f"synthetic-{size}", *build_synthetic_pool(truth, size, seed=seed))
+        for size in pool_sizes
+    ]
+    if date_str and (settings.DATA_DIR / date_str / "source_records.json").exists():
+        pools.extend(load_recorded_pool(date_str, truth))
+
+    results = []
+    # Matchers log every fuzzy decision; keep the harness output readable.
+    with quiet_logs():
+        for pool_name, canonical, source, expected in pools:
+            for matcher_name, matcher in matchers.items():
+                result = evaluate_matcher(matcher, canonical, source, expected)
+                results.append({"pool": pool_name, "matcher": matcher_name, **result})
+
+    print(
+        f"{'pool':<22} {'matcher':<24} {'labeled':>7} {'precision':>9} {'recall':>7} "
+        f"{'false+':>6} {'dupes':>5} {'seconds':>8} {'records/s':>12}"
+    )
+    for r in results:
+        print(
+            f"{r['pool']:<22} {r['matcher']:<24} {r['labeled']:>7} {r['precision']:>9.3f} "
+            f"{r['recall']:>7.3f} {r['false_positives']:>6} {r['duplicate_assignments']:>5} "
+            f"{r['seconds']:>8.3f} {r['records_per_second']:>12,.0f}"
+        )
+    return results
@@ -2,7 +2,7 @@
 
 """Pydantic models for typed data structures throughout the pipeline."""
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class PlayerRaw(BaseModel):
@@ -16,6 +16,12 @@ class PlayerRaw(BaseModel):
     last_name: str
     position: str | None = None
     team: str | None = None
+    # Sleeper's own normalized name ("patrickmahomes"), reused for matching.
+    search_full_name: str | None = None
+    # Relevance signals used to prune deep depth-chart players in the clean phase.
+    status: str | None = None
+    depth_chart_order: int | None = None
+    search_rank: int | None = None
     # The 'alias' allows Pydantic to read from a different key name in the source JSON.
     bye_week: int | None = Field(default=None, alias="fantasy_data_tms_bye_week")
 
@@ -23,6 +29,11 @@ class PlayerRaw(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
 
+# Validates (and dumps) a whole list of raw players in one call, which is much
+# cheaper than constructing PlayerRaw objects one keyword-splat at a time.
+PlayerRawList = TypeAdapter(list[PlayerRaw])
+
+
 class PlayerEnriched(PlayerRaw):
     """
     Represents a player after being enriched with external data like ADP
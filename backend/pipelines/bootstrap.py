@@ -0,0 +1,160 @@
+# Path: ffbPlayerDraftingApp/backend/pipelines/bootstrap.py
+
+"""
+Optional bootstrap phase: how fragile is the board?
+
+Each sample resamples every player's weeks of last season with replacement
+and perturbs every projection, then reruns the stats and VOR scoring on the
+result: the top-N average and weekly floor, the positional z-scores and
+blend, boosts and mimics, the replacement levels, the positional penalties
+and the ranking of the players with an ADP. Samples are evaluated in batches
+as (samples, players) arrays through the same kernels the stats and VOR
+phases use, so a few thousand samples take seconds.
+
+The result, players_bootstrap.json, lists the board in players_final.json's
+order with each player's VOR, PPG and rank percentiles across the samples.
+"""
+
+import datetime
+
+import numpy as np
+import pandas as pd
+
+from backend.logging_config import log
+from backend.settings import settings
+from backend.storage.file_store import load_json, save_json
+from backend.transforms.adjustments import (
+    PlayerAdjustments,
+    load_boost_rules,
+    load_mimic_rules,
+)
+from backend.transforms.compute_ppg import WEEKLY_QUANTILES, load_weekly_scores
+from backend.transforms.compute_vor import compute_vor
+from backend.transforms.scoring import score_players
+
+DEFAULT_SAMPLES = 2_000
+# Samples per batch; bounds memory at a few (batch, players, weeks) arrays.
+BATCH_SIZE = 50
+# Assumed relative standard deviation of a preseason projection: each sample
+# scales projected_ppg by a normal factor with mean 1 and this deviation.
+PROJECTION_NOISE = 0.2
+# Reported percentiles of VOR, PPG and rank across the samples.
+PERCENTILES = (5, 50, 95)
+
+
+def run_bootstrap(
+    date_str: str | None = None, samples: int = DEFAULT_SAMPLES, seed: int = 0
+):
+    if not date_str:
+        date_str = datetime.date.today().isoformat()
+    log.info(
+        "Starting bootstrap pipeline.", extra={"date": date_str, "samples": samples}
+    )
+
+    data_dir = settings.DATA_DIR / date_str
+    output_path = data_dir / "players_bootstrap.json"
+    try:
+        if samples < 1:
+            raise ValueError(f"The bootstrap needs at least one sample, got {samples}.")
+        df = pd.DataFrame(load_json(data_dir / "players_with_ppg.json"))
+        history = load_weekly_scores(data_dir, len(df))
+        cfg = settings.league_config
+        rng = np.random.default_rng(seed)
+
+        # The adjustment rules were reported by the stats and VOR phases.
+        adjustments = PlayerAdjustments(
+            df["slug"],
+            df["position"],
+            cfg,
+            load_boost_rules(settings.BASE_DIR / "player_boost.json"),
+            load_mimic_rules(settings.BASE_DIR / "player_mimics.json"),
+            apply_penalties=True,
+        )
+
+        positions = df["position"].to_numpy(dtype=object)
+        codes, uniques = pd.factorize(df["position"])
+        projected_ppg = df["projected_ppg"].to_numpy(dtype=np.float64, na_value=np.nan)
+        on_board = df["adp"].notna().to_numpy()
+        n_board = int(on_board.sum())
+
+        board_vor = np.empty((samples, n_board))
+        board_ppg = np.empty((samples, n_board))
+        board_rank = np.empty((samples, n_board), dtype=np.int64)
+        for start in range(0, samples, BATCH_SIZE):
+            size = min(BATCH_SIZE, samples - start)
+            resampled = history.resample(rng, size)
+            top_n_avg = resampled.top_n_avg(
+                cfg.top_game_count, cfg.min_historical_score
+            )
+            # As in the stats phase: no qualifying games marks a rookie.
+            top_n_avg[top_n_avg == 0.0] = np.nan
+            noise = 1.0 + PROJECTION_NOISE * rng.standard_normal((size, len(df)))
+            score = score_players(
+                projected_ppg * noise,
+                top_n_avg,
+                codes,
+                len(uniques),
+                cfg.weight_projection,
+                cfg.weight_last_year,
+                resampled.quantile(WEEKLY_QUANTILES["p10"]),
+                cfg.weight_floor,
+            ).score
+            expected_ppg = adjustments.apply_mimics(adjustments.apply_boosts(score))
+            vor, _ = compute_vor(expected_ppg, positions, cfg.roster, cfg.teams)
+
+            batch = slice(start, start + size)
+            board_vor[batch] = adjustments.apply_penalties(vor)[:, on_board]
+            board_ppg[batch] = adjustments.apply_penalties(expected_ppg)[:, on_board]
+            order = np.argsort(-board_vor[batch], axis=1, kind="stable")
+            board_rank[batch][np.arange(size)[:, None], order] = np.arange(
+                1, n_board + 1
+            )
+
+        # The board itself, ranked as the VOR phase ranks it.
+        point_vor, _ = compute_vor(
+            df["expected_ppg"].to_numpy(dtype=np.float64),
+            positions,
+            cfg.roster,
+            cfg.teams,
+        )
+        point_vor = adjustments.apply_penalties(point_vor)[on_board]
+        order = np.argsort(-point_vor, kind="stable")
+        board = df[on_board].iloc[order]
+
+        output = pd.DataFrame(
+            {
+                "id": np.arange(1, n_board + 1),
+                "name": (board["first_name"] + " " + board["last_name"]).to_numpy(),
+                "team": board["team"].to_numpy(),
+                "position": board["position"].to_numpy(),
+                "vor": point_vor[order].round(2),
+            }
+        )
+        for metric, values in (("vor", board_vor), ("ppg", board_ppg)):
+            for p, row in zip(PERCENTILES, np.percentile(values, PERCENTILES, axis=0)):
+                output[f"{metric}_p{p:02d}"] = row[order].round(2)
+        # Rank percentiles are ranks some sample actually produced.
+        rank_percentiles = np.percentile(
+            board_rank, PERCENTILES, axis=0, method="inverted_cdf"
+        )
+        for p, row in zip(PERCENTILES, rank_percentiles):
+            output[f"rank_p{p:02d}"] = row[order].astype(int)
+
+        save_json(output_path, output.replace({np.nan: None}).to_dict(orient="records"))
+        top = output.head(50)
+        log.info(
+            "Bootstrap pipeline completed.",
+            extra={
+                "path": str(output_path),
+                "samples": samples,
+                "median_top50_rank_range": float(
+                    (
+                        top[f"rank_p{PERCENTILES[-1]:02d}"]
+                        - top[f"rank_p{PERCENTILES[0]:02d}"]
+                    ).median()
+                ),
+            },
+        )
+    except Exception as e:
+        log.exception("Bootstrap pipeline failed.", extra={"error": str(e)})
+        raise
@@ -7,22 +7,46 @@ import datetime
 from pydantic import ValidationError
 
 from backend.logging_config import log  # Corrected import path
-from backend.models import PlayerRaw  # Corrected import path
+from backend.models import PlayerRawList  # Corrected import path
 from backend.settings import settings  # Corrected import path
 from backend.storage.file_store import load_json, save_json  # Corrected import path
 from backend.transforms.filter_players import (
-    keep_rostered_and_relevant,
+    keep_rostered_and_relevant_records,
+    prune_irrelevant_players,
+    validate_players,
 )  # Corrected import path
 
 
+def _always_keep(configured: list[str]) -> set[str]:
+    """
+    The relevance escape hatch: configured slugs/ids plus every player named in
+    player_boost.json or player_mimics.json, so strategic overrides survive.
+    """
+    keep = set(configured)
+    boost_path = settings.BASE_DIR / "player_boost.json"
+    if boost_path.exists():
+        for slugs in load_json(boost_path).values():
+            keep.update(slugs)
+    mimic_path = settings.BASE_DIR / "player_mimics.json"
+    if mimic_path.exists():
+        for target_slug, source_slug in load_json(mimic_path).items():
+            keep.update((target_slug, source_slug))
+    return keep
+
+
 def run_clean(date_str: str | None = None):
     """
     Executes the clean pipeline:
     1. Loads raw_players.json artifact.
-    2. Validates and parses data into PlayerRaw models.
-    3. Filters out players who are not on a team or have irrelevant positions
-       based on the league_config.json settings.
-    4. Saves the cleaned data to roster_players.json.
+    2. Filters out players who are not on a team or have irrelevant positions
+       based on the league_config.json settings (on the raw dicts).
+    3. Validates the survivors into PlayerRaw models in one batch. Invalid
+       records are skipped and written to invalid_players.json.
+    4. Prunes practice-squad and deep depth-chart players (the 'relevance'
+       settings), keeping anyone listed in the boost/mimic files or the
+       relevance.always_keep escape hatch. Removed players are written to
+       pruned_players.json.
+    5. Saves the cleaned data to roster_players.json.
 
     Args:
         date_str (str | None): The date in 'YYYY-MM-DD' format.
@@ -36,6 +60,8 @@ def run_clean(date_str: str | None = None):
     data_dir = settings.DATA_DIR / date_str
     input_path = data_dir / "raw_players.json"
     output_path = data_dir / "roster_players.json"
+    pruned_path = data_dir / "pruned_players.json"
+    invalid_path = data_dir / "invalid_players.json"
 
     try:
         # 1. Load the artifact from the previous phase
@@ -46,25 +72,33 @@ def run_clean(date_str: str | None = None):
             )
             return
 
-        # 2. Validate data with Pydantic models.
-        # The raw data is a dict of dicts; we want a list of models.
-        players_to_process = [PlayerRaw(**p) for p in raw_players_dict.values()]
-
-        # 3. Dynamically get relevant positions from the loaded league config.
+        # 2. Dynamically get relevant positions from the loaded league config.
         # We exclude "FLEX" as it's a roster spot, not a player position.
         roster_settings = (
             settings.league_config.roster.model_dump()  # pylint: disable=no-member
         )  # pylint: disable=no-member
         relevant_positions = {pos for pos in roster_settings if pos != "FLEX"}
 
-        # 4. Apply the transformation
-        rostered_players = keep_rostered_and_relevant(
-            players_to_process, relevant_positions
+        # The raw data is a dict of dicts; the cheap team/position check runs
+        # on the dicts so only rostered players are turned into models.
+        rostered_records = keep_rostered_and_relevant_records(
+            raw_players_dict.values(), relevant_positions
+        )
+
+        # 3. Validate the survivors with Pydantic in one batch.
+        rostered_players, invalid_report = validate_players(rostered_records)
+        save_json(invalid_path, invalid_report)
+
+        # 4. Prune players who cannot matter before enrichment and matching.
+        relevance = settings.league_config.relevance  # pylint: disable=no-member
+        relevant_players, pruned_report = prune_irrelevant_players(
+            rostered_players, relevance, _always_keep(relevance.always_keep)
         )
+        save_json(pruned_path, pruned_report)
 
         # 5. Save the new artifact
         # Convert Pydantic models back to dicts for JSON serialization
-        output_data = [player.model_dump(by_alias=True) for player in rostered_players]
+        output_data = PlayerRawList.dump_python(relevant_players, by_alias=True)
         save_json(output_path, output_data)
 
         log.info("Clean pipeline completed successfully.")
@@ -1,13 +1,61 @@
 # backend/pipelines/enrich.py (Corrected)
 import datetime
+from pathlib import Path
+
+import numpy as np
 import pandas as pd
 
 # --- CHANGE: Import only the consolidated fantasypros module ---
+from backend.contracts import ROSTER_PLAYERS
 from backend.data_sources import fantasypros
 from backend.logging_config import log
 from backend.settings import settings
 from backend.storage.file_store import load_json, save_json
-from backend.utils import slugify, create_hybrid_slug_map
+from backend.transforms.fantasy_points import STATS
+from backend.transforms.resolve_identity import PlayerIdentityResolver
+from backend.transforms.names import slugify_series
+
+
+def save_source_records(
+    data_dir: Path, adp_df: pd.DataFrame, projections_df: pd.DataFrame
+) -> None:
+    """
+    Keeps the source records that were matched so the match harness
+    (backend/match_harness.py) can replay this run's name matching.
+    """
+    source_columns = {"player_slug": "slug", "team": "team", "position": "position"}
+    source_records = {
+        "adp": adp_df[list(source_columns)]
+        .rename(columns=source_columns)
+        .to_dict(orient="records")
+    }
+    if not projections_df.empty:
+        source_records["projections"] = (
+            projections_df[list(source_columns)]
+            .rename(columns=source_columns)
+            .to_dict(orient="records")
+        )
+    save_json(data_dir / "source_records.json", source_records)
+
+
+def save_projection_stats(data_dir: Path, projections_df: pd.DataFrame) -> None:
+    """
+    Keeps each projection's raw stat line next to its points, as stored
+    backtest seasons do, so fantasypros.rescore_projections can score the
+    projections under another rule set without a new scrape.
+    """
+    if projections_df.empty:
+        return
+    if set(STATS) <= set(projections_df.columns):
+        lines = projections_df[list(STATS)].to_numpy(dtype=np.float64)
+    else:
+        lines = np.full((len(projections_df), len(STATS)), np.nan)
+    records = projections_df[["player_slug", "team", "position", "projection_fpts"]]
+    records = records.rename(columns={"player_slug": "slug"}).replace({np.nan: None})
+    records["stats"] = [
+        None if np.isnan(line).any() else line.tolist() for line in lines
+    ]
+    save_json(data_dir / "projection_stats.json", records.to_dict(orient="records"))
 
 
 def run_enrich(date_str: str | None = None):
@@ -22,48 +70,47 @@ def run_enrich(date_str: str | None = None):
     try:
         players_data = load_json(input_path)
         df = pd.DataFrame(players_data)
-        df["slug"] = [
-            slugify(f"{f} {l}") for f, l in zip(df["first_name"], df["last_name"])
-        ]
+        ROSTER_PLAYERS.check(df)
+        df["slug"] = slugify_series(df["first_name"] + " " + df["last_name"])
 
         # --- CHANGE: Fetch data using the new, reliable functions ---
         log.info("Fetching ADP and Projection data from consolidated source...")
-        adp_bye_map = fantasypros.fetch_adp()
+        adp_df = fantasypros.fetch_adp_records()
 
         # Call the new projections function, which returns a DataFrame
         projections_df = fantasypros.fetch_all_projections()
 
-        # --- ADDED: Convert the projections DataFrame to the required dictionary format ---
-        # The create_hybrid_slug_map function expects a dict: {slug: value}
+        # --- Resolve every external record to a canonical player once ---
+        # Each ADP and projection row gets the dense id of a roster player, so
+        # the join below is plain integer indexing rather than a slug dict map.
+        resolver = PlayerIdentityResolver(df)
+
+        adp_ids = resolver.resolve(
+            adp_df["player_slug"].tolist(),
+            teams=adp_df["team"].tolist(),
+            positions=adp_df["position"].tolist(),
+            source_name="adp",
+        )
+        df["adp"] = resolver.align(adp_ids, adp_df["adp"].to_numpy())
+        df["bye_week"] = resolver.align(
+            adp_ids, pd.to_numeric(adp_df["bye_week"]).to_numpy()
+        )
+
         if not projections_df.empty:
-            proj_map = projections_df.set_index("player_slug")[
-                "projection_fpts"
-            ].to_dict()
-            log.info(
-                f"Successfully converted projections DataFrame to dictionary with {len(proj_map)} entries."
+            proj_ids = resolver.resolve(
+                projections_df["player_slug"].tolist(),
+                teams=projections_df["team"].tolist(),
+                positions=projections_df["position"].tolist(),
+                source_name="projections",
+            )
+            df["projected_points"] = resolver.align(
+                proj_ids, projections_df["projection_fpts"].to_numpy()
             )
         else:
             log.warning(
                 "Received empty projections DataFrame. Projections will be missing."
             )
-            proj_map = {}
-
-        # The rest of the logic remains the same as it now has the data in the expected format
-        canonical_slugs = df["slug"].dropna().unique().tolist()
-        mapped_adp_bye = create_hybrid_slug_map(adp_bye_map, canonical_slugs)
-        mapped_proj = create_hybrid_slug_map(proj_map, canonical_slugs)
-
-        df["adp"] = (
-            df["slug"]
-            .map(mapped_adp_bye)
-            .apply(lambda x: x[0] if isinstance(x, tuple) else None)
-        )
-        df["bye_week"] = (
-            df["slug"]
-            .map(mapped_adp_bye)
-            .apply(lambda x: x[1] if isinstance(x, tuple) else None)
-        )
-        df["projected_points"] = df["slug"].map(mapped_proj)
+            df["projected_points"] = np.nan
 
         if "fantasy_data_tms_bye_week" in df.columns:
             df = df.drop(columns=["fantasy_data_tms_bye_week"])
@@ -76,6 +123,9 @@ def run_enrich(date_str: str | None = None):
         )
 
         save_json(output_path, df.to_dict(orient="records"))
+
+        save_source_records(data_dir, adp_df, projections_df)
+        save_projection_stats(data_dir, projections_df)
         log.info(
             "Enrich pipeline completed successfully. Saved to players_enriched.json"
         )
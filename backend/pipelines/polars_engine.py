@@ -0,0 +1,466 @@
+# Path: ffbPlayerDraftingApp/backend/pipelines/polars_engine.py
+
+"""
+The enrich, stats and VOR stages expressed as lazy Polars query plans.
+
+Selected with `python -m backend.cli --engine polars <phase>`. Each stage loads
+its JSON artifact once, builds a single LazyFrame for the stage's joins,
+window expressions, filters and projections, and collects it once, so Polars
+can prune unused columns, push the ADP filter down and run the per-position
+windows on all cores. The parts that are not relational (name matching in
+PlayerIdentityResolver and the compiled PlayerAdjustments) are shared with
+the pandas stages; their results enter the plans as plain columns.
+
+The artifacts are the same as the pandas engine's, and players_final.json is
+identical. Polars is an optional dependency: this module is only imported
+when the polars engine is selected.
+"""
+
+import datetime
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+from backend.constants import FLEX_POSITIONS
+from backend.contracts import (
+    ENRICHED_PLAYERS,
+    FINAL_PLAYERS,
+    PLAYERS_WITH_PPG,
+    ROSTER_PLAYERS,
+    FrameContract,
+)
+from backend.data_sources import fantasypros, historical
+from backend.logging_config import log
+from backend.pipelines.enrich import save_projection_stats, save_source_records
+from backend.settings import settings
+from backend.storage.file_store import load_json, save_json
+from backend.transforms.adjustments import (
+    PlayerAdjustments,
+    load_boost_rules,
+    load_mimic_rules,
+)
+from backend.transforms.compute_ppg import WeeklyScoreMatrix
+from backend.transforms.resolve_identity import UNRESOLVED, PlayerIdentityResolver
+from backend.transforms.scoring import SCALE_TARGET
+
+# Columns PlayerIdentityResolver reads from the canonical player frame.
+RESOLVER_COLUMNS = (
+    "slug",
+    "player_id",
+    "position",
+    "team",
+    "search_rank",
+    "first_name",
+    "last_name",
+)
+
+
+# --- Helpers ---
+def _load_frame(path) -> pl.DataFrame:
+    return pl.DataFrame(load_json(path), infer_schema_length=None)
+
+
+def _pandas_view(df: pl.DataFrame, columns) -> pd.DataFrame:
+    """The given columns as a pandas frame, for the shared pandas/NumPy code."""
+    return pd.DataFrame({c: df[c].to_numpy() for c in columns if c in df.columns})
+
+
+def _check(contract: FrameContract, df: pl.DataFrame) -> None:
+    if settings.CONTRACTS_ENABLED:
+        columns = [spec.name for spec in contract.columns]
+        contract.check(_pandas_view(df, [*columns, "slug"]))
+
+
+def _matched(ids: np.ndarray, **columns) -> pl.LazyFrame:
+    """
+    One row per resolved source record, keyed by its canonical row. When
+    several records resolve to the same player the last one wins, as in
+    PlayerIdentityResolver.align.
+    """
+    return (
+        pl.LazyFrame({"row": ids, **columns})
+        .filter(pl.col("row") != UNRESOLVED)
+        .unique(subset="row", keep="last", maintain_order=True)
+    )
+
+
+def _slug(names: pl.Expr) -> pl.Expr:
+    """utils.slugify as an expression: 'Ja'Marr Chase' -> 'jamarr-chase'."""
+    return (
+        names.str.to_lowercase()
+        .str.replace_all(r"[^a-z0-9\s-]", "")
+        .str.replace_all(r"[\s-]+", "-")
+        .str.strip_chars("-")
+        .fill_null("")
+    )
+
+
+def _ordered_sum(values: pl.Expr) -> pl.Expr:
+    """
+    The sum of the non-null values, added in row order. Polars' own sum and
+    std accumulate in blocks; the NumPy kernels add one value at a time, and
+    matching them to the last bit keeps near-tied players in the same order.
+    """
+    return values.fill_null(0.0).cum_sum().last()
+
+
+def _positional_z_score(column: str) -> pl.Expr:
+    """
+    normalize.positional_z_scores as a window over 'position': missing
+    values, players without a position and groups with a zero or undefined
+    sample standard deviation get 0.
+    """
+    values = pl.when(pl.col("position").is_not_null()).then(pl.col(column))
+    count = values.count().over("position")
+    deviations = values - _ordered_sum(values).over("position") / count
+    std = (_ordered_sum(deviations * deviations).over("position") / (count - 1)).sqrt()
+    z_score = deviations / std
+    return pl.when(z_score.is_not_null() & (std > 0)).then(z_score).otherwise(0.0)
+
+
+def _scale_to_target(column: str) -> pl.Expr:
+    top = pl.col(column).max()
+    return pl.col(column) * pl.when(top > 0).then(SCALE_TARGET / top).otherwise(0.0)
+
+
+def _kth_largest(points: pl.Expr, k: int) -> pl.Expr:
+    """The k-th largest value, or 0.0 when there are fewer than k."""
+    if k <= 0:
+        return pl.lit(0.0)
+    return pl.when(points.count() >= k).then(points.top_k(k).min()).otherwise(0.0)
+
+
+def _replacement_levels(teams: int) -> dict[str, pl.Expr]:
+    """compute_vor.replacement_levels as scalar expressions over the frame."""
+    cfg = settings.league_config
+    points = pl.col("expected_ppg")
+    levels: dict[str, pl.Expr] = {}
+    flex_leftover = pl.lit(False)
+
+    for pos, starters in cfg.roster.model_dump().items():
+        if pos == "FLEX":
+            continue
+        is_pos = pl.col("position") == pos
+        replacement_idx = teams * starters
+        levels[pos] = _kth_largest(points.filter(is_pos), replacement_idx)
+        if pos in FLEX_POSITIONS:
+            # The players left once this position's starters are taken; none
+            # when there are not enough players to fill the starting spots.
+            rank = points.rank("ordinal", descending=True).over("position")
+            leftover = (rank > replacement_idx) & (
+                points.filter(is_pos).count() >= replacement_idx
+            )
+            flex_leftover = flex_leftover | (is_pos & leftover)
+
+    levels["FLEX"] = _kth_largest(points.filter(flex_leftover), teams * cfg.roster.FLEX)
+    return levels
+
+
+# --- Stages ---
+def run_enrich(date_str: str | None = None):
+    if not date_str:
+        date_str = datetime.date.today().isoformat()
+    log.info("Starting enrich pipeline (polars).", extra={"date": date_str})
+
+    data_dir = settings.DATA_DIR / date_str
+    input_path = data_dir / "roster_players.json"
+    output_path = data_dir / "players_enriched.json"
+
+    try:
+        roster = _load_frame(input_path)
+        _check(ROSTER_PLAYERS, roster)
+        players = roster.with_columns(
+            slug=_slug(pl.concat_str("first_name", pl.lit(" "), "last_name"))
+        )
+
+        log.info("Fetching ADP and Projection data from consolidated source...")
+        adp_df = fantasypros.fetch_adp_records()
+        projections_df = fantasypros.fetch_all_projections()
+
+        # --- Resolve every external record to a canonical row once ---
+        resolver = PlayerIdentityResolver(_pandas_view(players, RESOLVER_COLUMNS))
+        adp_ids = resolver.resolve(
+            adp_df["player_slug"].tolist(),
+            teams=adp_df["team"].tolist(),
+            positions=adp_df["position"].tolist(),
+            source_name="adp",
+        )
+        adp = _matched(
+            adp_ids,
+            adp=adp_df["adp"].to_numpy(dtype=np.float64),
+            bye_week=pd.to_numeric(adp_df["bye_week"]).to_numpy(dtype=np.float64),
+        )
+        if not projections_df.empty:
+            proj_ids = resolver.resolve(
+                projections_df["player_slug"].tolist(),
+                teams=projections_df["team"].tolist(),
+                positions=projections_df["position"].tolist(),
+                source_name="projections",
+            )
+            projections = _matched(
+                proj_ids,
+                projected_points=projections_df["projection_fpts"].to_numpy(
+                    dtype=np.float64
+                ),
+            )
+        else:
+            log.warning(
+                "Received empty projections DataFrame. Projections will be missing."
+            )
+            projections = pl.LazyFrame(
+                schema={"row": pl.Int64, "projected_points": pl.Float64}
+            )
+
+        # --- The plan: two index joins, then drop the replaced bye column ---
+        enriched = (
+            players.lazy()
+            .with_row_index("row")
+            .with_columns(pl.col("row").cast(pl.Int64))
+            .join(adp, on="row", how="left", maintain_order="left")
+            .join(projections, on="row", how="left", maintain_order="left")
+            .with_columns(pl.col("adp", "bye_week", "projected_points").fill_nan(None))
+            .drop("row", "fantasy_data_tms_bye_week", strict=False)
+            .collect()
+        )
+
+        log.info("Enrichment complete. Logging sample of projected points:")
+        log.info(
+            f"\n{enriched.select('first_name', 'last_name', 'slug', 'projected_points').head(10)}"
+        )
+        save_json(output_path, enriched.to_dicts())
+        save_source_records(data_dir, adp_df, projections_df)
+        save_projection_stats(data_dir, projections_df)
+        log.info(
+            "Enrich pipeline completed successfully. Saved to players_enriched.json"
+        )
+
+    except Exception as e:
+        log.exception("Enrich pipeline failed.", extra={"error": str(e)})
+        raise
+
+
+def run_stats(date_str: str | None = None):
+    if not date_str:
+        date_str = datetime.date.today().isoformat()
+    log.info("Starting stats pipeline (polars).", extra={"date": date_str})
+
+    input_path = settings.DATA_DIR / date_str / "players_enriched.json"
+    output_path = settings.DATA_DIR / date_str / "players_with_ppg.json"
+    try:
+        players = _load_frame(input_path)
+        _check(ENRICHED_PLAYERS, players)
+        cfg = settings.league_config
+
+        # --- Historical Top-N Average: explode, filter, top-k per player ---
+        hist_records = historical.fetch_last_year_weekly_records()
+        resolver = PlayerIdentityResolver(_pandas_view(players, RESOLVER_COLUMNS))
+        hist_ids = resolver.resolve(
+            hist_records["slug"].tolist(),
+            teams=hist_records["team"].tolist(),
+            positions=hist_records["position"].tolist(),
+            source_name="historical",
+        )
+        player_weeks = resolver.align(
+            hist_ids, hist_records["scores"].tolist(), fill=None
+        )
+        # Saved for the backtest, as in the pandas stats phase.
+        save_json(
+            settings.DATA_DIR / date_str / "weekly_scores.json", player_weeks.tolist()
+        )
+        # The weekly floor and ceiling metrics come from the same NumPy kernel
+        # as in the pandas stats phase, so the floor blends in identically.
+        position_codes, position_labels = pd.factorize(players["position"].to_numpy())
+        distribution = WeeklyScoreMatrix.from_score_lists(player_weeks).distribution(
+            position_codes, len(position_labels)
+        )
+        top_n_avg = (
+            _matched(
+                hist_ids,
+                week_score=pl.Series(
+                    hist_records["scores"].tolist(), dtype=pl.List(pl.Float64)
+                ),
+            )
+            .explode("week_score")
+            .with_columns(pl.col("week_score").fill_nan(None))
+            .filter(pl.col("week_score") >= cfg.min_historical_score)
+            .group_by("row")
+            .agg(
+                top_n_avg=_ordered_sum(
+                    pl.col("week_score").sort(descending=True).head(cfg.top_game_count)
+                )
+                / pl.col("week_score").head(cfg.top_game_count).count()
+            )
+        )
+
+        # --- Player Adjustments, compiled once against the loaded rows ---
+        boost_list_path = settings.BASE_DIR / "player_boost.json"
+        boost_rules = load_boost_rules(boost_list_path)
+        if boost_rules is None:
+            log.warning(
+                f"player_boost.json not found at {boost_list_path}. Skipping player boost."
+            )
+        mimic_rules = load_mimic_rules(settings.BASE_DIR / "player_mimics.json")
+        frame = _pandas_view(players, ["slug", "position"])
+        adjustments = PlayerAdjustments(
+            frame["slug"], frame["position"], cfg, boost_rules, mimic_rules
+        )
+        mimic_source = np.arange(len(players))
+        mimic_source[adjustments.mimic_targets] = adjustments.mimic_sources
+
+        # --- The plan: join, window z-scores, scale, blend, boost, mimic ---
+        has_proj = pl.col("projected_ppg").is_not_null()
+        has_hist = pl.col("top_n_avg").is_not_null()
+        veteran = (
+            pl.col("scaled_proj") * cfg.weight_projection
+            + pl.col("scaled_hist") * cfg.weight_last_year
+        ) + pl.col("scaled_floor") * cfg.weight_floor
+        scored = (
+            players.lazy()
+            .with_row_index("row")
+            .with_columns(pl.col("row").cast(pl.Int64))
+            .join(top_n_avg, on="row", how="left", maintain_order="left")
+            # A 0.0 average (no qualifying games) marks a rookie, not a dud.
+            .with_columns(
+                top_n_avg=pl.when(pl.col("top_n_avg") != 0.0).then("top_n_avg"),
+                # Polars divides by a scalar as a multiplication by its
+                # reciprocal, which can differ from pandas in the last bit;
+                # dividing by a column keeps the two engines equal.
+                projected_ppg=pl.col("projected_points").fill_nan(None)
+                / pl.lit(pl.Series(np.full(len(players), float(cfg.games_divisor)))),
+            )
+            .with_columns(
+                pl.lit(pl.Series(name, values)).fill_nan(None)
+                for name, values in distribution.items()
+            )
+            .with_columns(
+                z_proj=_positional_z_score("projected_ppg"),
+                z_hist=_positional_z_score("top_n_avg"),
+                z_floor=_positional_z_score("p10"),
+            )
+            .with_columns(
+                scaled_hist=_scale_to_target("z_hist"),
+                scaled_proj=_scale_to_target("z_proj"),
+                scaled_floor=_scale_to_target("z_floor"),
+            )
+            .with_columns(
+                score=pl.when(has_proj & has_hist)
+                .then(veteran)
+                .when(has_proj)
+                .then("scaled_proj")
+                .when(has_hist)
+                .then("scaled_hist")
+                .otherwise(0.0)
+                * pl.lit(pl.Series(adjustments.boost_multiplier))
+            )
+            .with_columns(expected_ppg=pl.col("score").gather(pl.lit(mimic_source)))
+            .drop("row")
+            # The pandas stats phase's column order.
+            .select(
+                pl.exclude("z_floor", "scaled_floor", "expected_ppg"),
+                "z_floor",
+                "scaled_floor",
+                "expected_ppg",
+            )
+            .collect()
+        )
+        adjustments.log_report()
+        save_json(
+            settings.DATA_DIR / date_str / "unmatched_adjustments.json",
+            adjustments.unmatched,
+        )
+        log.info("Final 'expected_ppg' calculation complete.")
+
+        for slug in ("jamarr-chase", "ashton-jeanty", "christian-mccaffrey"):
+            sample = scored.filter(pl.col("slug") == slug).select(
+                "slug", "top_n_avg", "scaled_hist", "scaled_proj", "expected_ppg"
+            )
+            log.info(f"Final check before saving. Data for {slug}:\n{sample}")
+
+        save_json(output_path, scored.to_dicts())
+        log.info("Stats pipeline completed successfully.")
+    except Exception as e:
+        log.exception("Stats pipeline failed.", extra={"error": str(e)})
+        raise
+
+
+def run_vor(date_str: str | None = None):
+    if not date_str:
+        date_str = datetime.date.today().isoformat()
+    log.info("Starting VOR pipeline (polars).", extra={"date": date_str})
+
+    input_path = settings.DATA_DIR / date_str / "players_with_ppg.json"
+    output_path = settings.DATA_DIR / date_str / "players_final.json"
+    try:
+        players = _load_frame(input_path)
+        _check(PLAYERS_WITH_PPG, players)
+        cfg = settings.league_config
+
+        frame = _pandas_view(players, ["slug", "position"])
+        penalties = PlayerAdjustments(
+            frame["slug"], frame["position"], cfg, apply_penalties=True
+        )
+        log.info(
+            f"CRITICAL DIAGNOSTIC: Positional penalties loaded into VOR pipeline: {cfg.positional_penalties}"
+        )
+
+        # --- The plan: replacement levels from the un-penalized scores, VOR,
+        # then penalties, the ADP filter, the ranking and the output columns ---
+        levels = _replacement_levels(cfg.teams)
+        points = pl.col("expected_ppg")
+        replacement = pl.lit(0.0)
+        for pos, level in levels.items():
+            if pos != "FLEX":
+                replacement = (
+                    pl.when(pl.col("position") == pos)
+                    .then(level)
+                    .otherwise(replacement)
+                )
+        vor = points - replacement
+        if cfg.roster.FLEX > 0:
+            flex_vor = points - levels["FLEX"]
+            is_flex = pl.col("position").is_in(FLEX_POSITIONS)
+            vor = pl.when(is_flex & (flex_vor > vor)).then(flex_vor).otherwise(vor)
+
+        multiplier = pl.lit(pl.Series(penalties.penalty_multiplier))
+        players_lf = players.lazy()
+        final_plan = (
+            players_lf.with_columns(vor=vor)
+            .with_columns(
+                expected_ppg=points * multiplier, vor=pl.col("vor") * multiplier
+            )
+            .filter(pl.col("adp").is_not_null() & pl.col("adp").is_not_nan())
+            .sort("vor", descending=True, nulls_last=True, maintain_order=True)
+            .select(
+                id=pl.int_range(1, pl.len() + 1),
+                name=pl.concat_str("first_name", pl.lit(" "), "last_name"),
+                team="team",
+                position="position",
+                adp=pl.col("adp").round(1),
+                vor=pl.col("vor").round(2),
+                bye=pl.col("bye_week").cast(pl.Int64),
+                ppg=pl.col("expected_ppg").round(2),
+            )
+        )
+        levels_plan = players_lf.select(**levels)
+        final_df, levels_df = pl.collect_all([final_plan, levels_plan])
+
+        log.info(
+            "Determined replacement levels from original scores.",
+            extra=levels_df.row(0, named=True),
+        )
+        penalties.log_report()
+        log.info(
+            f"Filtered out players with no ADP. Removed: {len(players) - len(final_df)}, Remaining: {len(final_df)}"
+        )
+
+        _check(FINAL_PLAYERS, final_df)
+        save_json(output_path, final_df.to_dicts())
+        log.info(
+            "VOR pipeline completed. Final artifact created.",
+            extra={"path": str(output_path)},
+        )
+
+    except Exception as e:
+        log.exception("VOR pipeline failed.", extra={"error": str(e)})
+        raise
@@ -4,9 +4,11 @@ import datetime
 import pandas as pd
 import numpy as np
 
+from backend.contracts import FINAL_PLAYERS, PLAYERS_WITH_PPG
 from backend.logging_config import log
 from backend.settings import settings
 from backend.storage.file_store import load_json, save_json
+from backend.transforms.adjustments import PlayerAdjustments
 from backend.transforms.compute_vor import calculate_vor
 
 
@@ -20,6 +22,7 @@ def run_vor(date_str: str | None = None):
     try:
         ppg_data = load_json(input_path)
         df = pd.DataFrame(ppg_data)
+        PLAYERS_WITH_PPG.check(df)
         cfg = settings.league_config
 
         # --- THE FINAL FIX: Re-ordering the VOR Logic ---
@@ -34,25 +37,18 @@ def run_vor(date_str: str | None = None):
 
         # Step 2: NOW, apply the strategic positional penalties.
         log.info("Applying positional penalties to expected_ppg.")
-        if hasattr(cfg, "positional_penalties"):
-            penalties = cfg.positional_penalties
-
-            # --- START ADDITION: CRITICAL DIAGNOSTIC ---
-            log.info(
-                f"CRITICAL DIAGNOSTIC: Positional penalties loaded into VOR pipeline: {penalties}"
-            )
-            # --- END ADDITION ---
-
-            for position, penalty in penalties.items():
-                if penalty < 1.0:
-                    # Apply the penalty to the original ppg AND the calculated vor
-                    df_with_vor.loc[
-                        df_with_vor["position"] == position, "expected_ppg"
-                    ] *= penalty
-                    df_with_vor.loc[
-                        df_with_vor["position"] == position, "vor"
-                    ] *= penalty
-                    log.info(f"Applied a x{penalty} penalty to {position} position.")
+        log.info(
+            f"CRITICAL DIAGNOSTIC: Positional penalties loaded into VOR pipeline: {cfg.positional_penalties}"
+        )
+        penalties = PlayerAdjustments(
+            df_with_vor["slug"], df_with_vor["position"], cfg, apply_penalties=True
+        )
+        # Apply the penalty to the original ppg AND the calculated vor
+        df_with_vor["expected_ppg"] = penalties.apply_penalties(
+            df_with_vor["expected_ppg"].to_numpy()
+        )
+        df_with_vor["vor"] = penalties.apply_penalties(df_with_vor["vor"].to_numpy())
+        penalties.log_report()
 
         # Step 3: Filter out players with no ADP (after all calculations are done).
         initial_count = len(df_with_vor)
@@ -63,7 +59,7 @@ def run_vor(date_str: str | None = None):
         )
 
         # Step 4: Sort and Rank based on the final, adjusted VOR.
-        final_df = df_with_vor.sort_values(by="vor", ascending=False)
+        final_df = df_with_vor.sort_values(by="vor", ascending=False, kind="stable")
         final_df["rank"] = range(1, len(final_df) + 1)
 
         log.info("Formatting final output.")
@@ -79,6 +75,7 @@ def run_vor(date_str: str | None = None):
         formatted_df["bye"] = final_df["bye_week"].astype("Int64")
         formatted_df["ppg"] = final_df["expected_ppg"].round(2)
 
+        FINAL_PLAYERS.check(formatted_df)
         output_data = formatted_df.replace({np.nan: None}).to_dict(orient="records")
         save_json(output_path, output_data)
         log.info(
@@ -0,0 +1,240 @@
+# Path: ffbPlayerDraftingApp/backend/player_table.py
+
+"""
+A compact, columnar representation of the player pool.
+
+Between stages players travel as JSON artifacts, read back as lists of
+Pydantic models, lists of dicts or object-dtype DataFrames in which every
+position and team is a Python string. PlayerTable holds the same data in
+memory as a struct of NumPy arrays instead: positions and teams are
+dictionary-encoded as small integer codes, numeric fields are float32
+(stored source data) or float64 (computed scores), and bool columns stay
+bool. Conversion to a DataFrame or to the models in backend/models.py is a
+column-at-a-time operation. The pipeline stages do not use it; see
+bench_player_table.py for its memory and conversion cost against the
+representations they do use.
+"""
+
+from typing import Iterable, Type
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel
+
+from backend.constants import POSITIONS
+from backend.models import PlayerRaw
+
+# Encoded value for a missing position or team.
+MISSING_CODE = -1
+
+# Identity, name and status columns kept as Python strings.
+STRING_COLUMNS = frozenset(
+    {"player_id", "slug", "first_name", "last_name", "search_full_name", "status"}
+)
+
+# Integer fields of the models; stored as floats (NaN for missing) and
+# decoded back to nullable integers.
+INTEGER_COLUMNS = frozenset(
+    {
+        "bye_week",
+        "fantasy_data_tms_bye_week",
+        "depth_chart_order",
+        "search_rank",
+        "rank",
+    }
+)
+
+# Source data that float32 holds to its printed precision (ranks, weeks, ADP).
+FLOAT32_COLUMNS = INTEGER_COLUMNS | {"adp"}
+
+
+def _encode(
+    values: pd.Series, categories: Iterable[str] = ()
+) -> tuple[np.ndarray, tuple[str, ...]]:
+    """
+    Dictionary-encodes a string column. The given categories keep fixed codes
+    (so e.g. QB is always 0); any other values are appended in sorted order.
+    """
+    labels = list(categories)
+    extra = sorted(set(values.dropna().unique()) - set(labels))
+    labels.extend(extra)
+    # int8 holds codes up to 127; a wider dtype keeps more labels from wrapping.
+    dtype = np.int8 if len(labels) <= np.iinfo(np.int8).max else np.int32
+    codes = pd.Categorical(values, categories=labels).codes.astype(dtype)
+    return codes, tuple(labels)
+
+
+class PlayerTable:
+    """
+    The player pool as parallel arrays, one entry per player.
+
+    Attributes:
+        ids: Dense int32 player ids (the row number).
+        position_codes / team_codes: Codes into position_labels /
+             team_labels, MISSING_CODE when absent; int8 unless there are
+             more than 127 labels. Positions always use the order of
+             constants.POSITIONS.
+        strings: Identity and name columns (player_id, slug, names, ...).
+        numeric: Numeric columns; float32 for source data, bool for flags,
+             float64 otherwise.
+    """
+
+    def __init__(
+        self,
+        position_codes: np.ndarray,
+        position_labels: tuple[str, ...],
+        team_codes: np.ndarray,
+        team_labels: tuple[str, ...],
+        strings: dict[str, np.ndarray],
+        numeric: dict[str, np.ndarray],
+    ):
+        self.ids = np.arange(len(position_codes), dtype=np.int32)
+        self.position_codes = position_codes
+        self.position_labels = position_labels
+        self.team_codes = team_codes
+        self.team_labels = team_labels
+        self.strings = strings
+        self.numeric = numeric
+        self.columns = [*strings, "position", "team", *numeric]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    # --- Construction ---
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "PlayerTable":
+        """
+        Builds a table from a player DataFrame. Numeric columns are stored as
+        floats (NaN for missing) and bool columns as bools; any other column,
+        including a bool column with missing values, is kept as an object array.
+        """
+        position_codes, position_labels = _encode(
+            df["position"] if "position" in df else pd.Series([None] * len(df)),
+            POSITIONS,
+        )
+        team_codes, team_labels = _encode(
+            df["team"] if "team" in df else pd.Series([None] * len(df))
+        )
+
+        strings, numeric = {}, {}
+        for column in df.columns:
+            if column in ("position", "team"):
+                continue
+            values = df[column]
+            if pd.api.types.is_bool_dtype(values):
+                if values.isna().any():
+                    strings[column] = (
+                        values.astype(object).where(values.notna(), None).to_numpy()
+                    )
+                else:
+                    numeric[column] = values.to_numpy(dtype=bool)
+            elif column not in STRING_COLUMNS and (
+                pd.api.types.is_numeric_dtype(values) or values.isna().all()
+            ):
+                dtype = np.float32 if column in FLOAT32_COLUMNS else np.float64
+                numeric[column] = values.to_numpy(dtype=dtype, na_value=np.nan)
+            else:
+                strings[column] = (
+                    values.astype(object).where(values.notna(), None).to_numpy()
+                )
+        table = cls(
+            position_codes, position_labels, team_codes, team_labels, strings, numeric
+        )
+        table.columns = list(df.columns)
+        return table
+
+    @classmethod
+    def from_records(cls, records: list[dict]) -> "PlayerTable":
+        """Builds a table from a JSON artifact (a list of player dicts)."""
+        return cls.from_frame(pd.DataFrame(records))
+
+    @classmethod
+    def from_models(cls, players: list[BaseModel]) -> "PlayerTable":
+        """
+        Builds a table from player models (PlayerRaw or a subclass), reading
+        one field at a time across all players instead of dumping each model.
+        """
+        if not players:
+            return cls.from_frame(pd.DataFrame(columns=["position", "team"]))
+        fields = type(players[0]).model_fields
+        columns = {
+            name: [getattr(player, name) for player in players] for name in fields
+        }
+        df = pd.DataFrame(columns)
+        # Serialize with the models' aliases, as model_dump(by_alias=True) does.
+        aliases = {name: f.alias for name, f in fields.items() if f.alias}
+        return cls.from_frame(df.rename(columns=aliases))
+
+    # --- Conversion ---
+    @property
+    def positions(self) -> np.ndarray:
+        """Decoded position strings (None where missing)."""
+        return self._decode(self.position_codes, self.position_labels)
+
+    @property
+    def teams(self) -> np.ndarray:
+        """Decoded team strings (None where missing)."""
+        return self._decode(self.team_codes, self.team_labels)
+
+    @staticmethod
+    def _decode(codes: np.ndarray, labels: tuple[str, ...]) -> np.ndarray:
+        lookup = np.array(list(labels) + [None], dtype=object)
+        return lookup[codes]  # MISSING_CODE (-1) picks the trailing None.
+
+    def position_mask(self, position: str) -> np.ndarray:
+        """Boolean mask of the players at one position, without string compares."""
+        if position not in self.position_labels:
+            return np.zeros(len(self), dtype=bool)
+        return self.position_codes == self.position_labels.index(position)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Decodes the table back into a player DataFrame."""
+        columns = {name: values for name, values in self.strings.items()}
+        columns["position"] = self.positions
+        columns["team"] = self.teams
+        for name, values in self.numeric.items():
+            if name in INTEGER_COLUMNS:
+                columns[name] = pd.array(values.astype(np.float64)).astype("Int64")
+            elif values.dtype == np.float32:
+                # Through the shortest repr, so 93.1 comes back as 93.1 rather
+                # than 93.0999984741211.
+                columns[name] = values.astype(str).astype(np.float64)
+            else:
+                columns[name] = values
+        return pd.DataFrame(columns)[[c for c in self.columns if c in columns]]
+
+    def to_records(self) -> list[dict]:
+        """The table as a JSON-serializable list of dicts (None for missing)."""
+        columns = {name: values.tolist() for name, values in self.strings.items()}
+        columns["position"] = self.positions.tolist()
+        columns["team"] = self.teams.tolist()
+        for name, values in self.numeric.items():
+            if values.dtype == bool:
+                columns[name] = values.tolist()
+                continue
+            missing = np.isnan(values)
+            if name in INTEGER_COLUMNS:
+                decoded = np.where(missing, 0, values).astype(np.int64).astype(object)
+            elif values.dtype == np.float32:
+                decoded = values.astype(str).astype(np.float64).astype(object)
+            else:
+                decoded = values.astype(object)
+            decoded[missing] = None
+            columns[name] = decoded.tolist()
+        names = [c for c in self.columns if c in columns]
+        return [dict(zip(names, row)) for row in zip(*(columns[c] for c in names))]
+
+    def to_models(self, model: Type[BaseModel] = PlayerRaw) -> list[BaseModel]:
+        """Rebuilds player models. Columns the model does not declare are dropped."""
+        return [model.model_validate(record) for record in self.to_records()]
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the arrays, counting the string objects they point to."""
+        total = self.ids.nbytes + self.position_codes.nbytes + self.team_codes.nbytes
+        total += sum(values.nbytes for values in self.numeric.values())
+        for values in self.strings.values():
+            total += values.nbytes + sum(
+                value.__sizeof__() for value in values if value is not None
+            )
+        return total
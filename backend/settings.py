@@ -30,12 +30,33 @@ class RosterSettings(BaseModel):
     DEF: int
 
 
+class RelevanceSettings(BaseModel):
+    """
+    Controls the relevance pre-filter in the clean phase. Players failing any
+    check are dropped before enrichment, matching and scoring.
+    """
+
+    enabled: bool = True
+    # Drop players listed deeper than this on their team's depth chart.
+    max_depth_chart_order: int | None = 3
+    # Drop players Sleeper ranks worse than this (unranked players are 9999999).
+    max_search_rank: int | None = 1500
+    excluded_statuses: list[str] = ["Inactive", "Practice Squad"]
+    # Positions without depth-chart or search-rank data (team defenses).
+    exempt_positions: list[str] = ["DEF"]
+    # Escape hatch: slugs or Sleeper player_ids that are never pruned.
+    always_keep: list[str] = []
+
+
 class LeagueConfig(BaseModel):
     """Defines all league-specific rules and scoring weights."""
 
     teams: int
     roster: RosterSettings
     scoring: str
+    # Overrides of the scoring preset's weights, keyed by stat ('pass_td') or
+    # position and stat ('TE:rec'); see transforms/fantasy_points.py.
+    scoring_rules: dict[str, float] = {}
     week: int
     games_divisor: int
     boost_small: float
@@ -44,9 +65,13 @@ class LeagueConfig(BaseModel):
     boost_max: float
     top_game_count: int
     weight_projection: float
-    weight_last_year: float
+    weight_last_year: float = 0.0
+    # Weight of the weekly floor (p10 of last season's weeks) for veterans;
+    # survival formats such as guillotine leagues reward a high floor.
+    weight_floor: float = 0.0
     min_historical_score: float
     positional_penalties: dict[str, float]
+    relevance: RelevanceSettings = RelevanceSettings()
 
 
 def _load_league_config(path: Path) -> LeagueConfig:
@@ -70,6 +95,9 @@ class Settings(BaseSettings):
         default_factory=lambda: _load_league_config(_LEAGUE_CONFIG_PATH)
     )
 
+    # Check the frame contracts (backend/contracts.py) at stage boundaries.
+    CONTRACTS_ENABLED: bool = True
+
     # API URLs
     SLEEPER_API_URL: str = "https://api.sleeper.app/v1/players/nfl"
     FANTASYPROS_ADP_URL: str = "https://www.fantasypros.com/nfl/adp/ppr-overall.php"
@@ -11,13 +11,14 @@ from typing import Any
 from backend.logging_config import log
 
 
-def save_json(file_path: Path, data: Any):
+def save_json(file_path: Path, data: Any, indent: int | None = 2):
     """
     Saves data to a JSON file, creating parent directories if they don't exist.
 
     Args:
         file_path (Path): The full path to the output file.
         data (Any): The JSON-serializable data to save.
+        indent (int | None): Pretty-printing indent; None writes compact JSON.
     """
     try:
         log.info("Attempting to save JSON artifact.", extra={"path": str(file_path)})
@@ -25,7 +26,7 @@ def save_json(file_path: Path, data: Any):
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
         with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+            json.dump(data, f, indent=indent)
 
         log.info("Successfully saved JSON artifact.", extra={"path": str(file_path)})
     except (IOError, TypeError) as e:
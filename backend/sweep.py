@@ -0,0 +1,364 @@
+# Path: ffbPlayerDraftingApp/backend/sweep.py
+
+"""
+Batched parameter sweeps over the scoring settings.
+
+A sweep re-ranks one day's matched players (players_with_ppg.json) under many
+settings of the blend weights, boost sizes and positional penalties at once.
+The positional z-scores do not depend on any of these, so they are computed
+once; each batch of settings is then a broadcast blend, a boost multiply, one
+mimic gather, a batched VOR (compute_vor over a (settings, players) matrix),
+a penalty multiply and a row-wise argsort. Every setting is compared with the
+league config's own ranking for rank stability (Spearman correlation) and
+for the players entering and leaving the top N.
+"""
+
+import itertools
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from backend.settings import LeagueConfig, settings
+from backend.storage.file_store import load_json, save_json
+from backend.transforms.adjustments import (
+    BOOST_TIERS,
+    BoostRules,
+    PlayerAdjustments,
+    load_boost_rules,
+    load_mimic_rules,
+)
+from backend.transforms.compute_vor import compute_vor
+from backend.transforms.scoring import score_players
+
+# Settings evaluated per batch; bounds memory at a few (batch, players) arrays.
+BATCH_SIZE = 1_000
+# Refuse grids whose Cartesian product is larger than this.
+MAX_SETTINGS = 1_000_000
+DEFAULT_TOP_N = 24
+# How many of the most disruptive settings the report prints.
+REPORTED_SETTINGS = 10
+
+WEIGHT_PARAMETERS = ("weight_projection", "weight_last_year")
+BOOST_PARAMETERS = {
+    config_field: tier for tier, (_, config_field) in BOOST_TIERS.items()
+}
+PENALTY_PREFIX = "penalty_"
+
+
+def parse_grid(spec: str) -> np.ndarray:
+    """
+    Parses one parameter's values: '0.7' (fixed), '0.5,0.6,0.8' (a list) or
+    '0.5:1.0:6' (start:stop:count, evenly spaced and inclusive).
+    """
+    try:
+        if ":" in spec:
+            start, stop, count = spec.split(":")
+            return np.linspace(float(start), float(stop), int(count))
+        return np.array([float(value) for value in spec.split(",")])
+    except ValueError as e:
+        raise ValueError(f"Invalid parameter grid '{spec}': {e}") from e
+
+
+def build_settings(
+    grids: dict[str, np.ndarray], samples: int | None = None, seed: int = 0
+) -> dict[str, np.ndarray]:
+    """
+    Expands parameter grids into one column per parameter, one row per setting.
+
+    Args:
+        grids: Parameter name -> candidate values (see parse_grid).
+        samples: If given, draw this many settings uniformly between each
+                 parameter's lowest and highest value instead of taking the
+                 Cartesian product of the grids.
+        seed: Seed for the random samples.
+
+    Returns:
+        Parameter name -> values, all of the same length. weight_last_year
+        defaults to 1 - weight_projection when only the latter is swept.
+    """
+    for name in grids:
+        known = (*WEIGHT_PARAMETERS, *BOOST_PARAMETERS)
+        if name not in known and not name.startswith(PENALTY_PREFIX):
+            raise ValueError(
+                f"Unknown sweep parameter '{name}'. Use one of {list(known)} "
+                f"or {PENALTY_PREFIX}<POSITION>."
+            )
+    if samples is not None:
+        rng = np.random.default_rng(seed)
+        table = {
+            name: rng.uniform(values.min(), values.max(), samples)
+            for name, values in grids.items()
+        }
+    else:
+        n_settings = int(np.prod([len(values) for values in grids.values()]))
+        if n_settings > MAX_SETTINGS:
+            raise ValueError(
+                f"The grid has {n_settings:,} settings; the limit is {MAX_SETTINGS:,}. "
+                "Use fewer values or --samples."
+            )
+        product = itertools.product(*grids.values())
+        columns = np.array(list(product), dtype=np.float64).reshape(-1, len(grids))
+        table = {name: columns[:, i] for i, name in enumerate(grids)}
+    if "weight_projection" in table and "weight_last_year" not in table:
+        table["weight_last_year"] = 1.0 - table["weight_projection"]
+    return table
+
+
+@dataclass
+class SweepResult:
+    """
+    Rankings of the ADP-drafted players under every swept setting.
+
+    Attributes:
+        settings: Parameter name -> one value per setting.
+        baseline_order: Indexes of the ranked players (those with an ADP, in
+                        input order), best first, under the league config's
+                        own values.
+        spearman: Rank correlation of each setting with the baseline.
+        top_n_overlap: How many of the baseline's top N each setting keeps.
+        entered / left: Per setting, the players entering / leaving the top N.
+        top_n_ranks: (settings, top_n) ranks (1-based) of the baseline's top N.
+    """
+
+    settings: dict[str, np.ndarray]
+    baseline_order: np.ndarray
+    top_n: int
+    spearman: np.ndarray
+    top_n_overlap: np.ndarray
+    entered: list[list[int]]
+    left: list[list[int]]
+    top_n_ranks: np.ndarray
+
+
+class ScoreSweep:
+    """The sweep kernel, compiled once against one player frame."""
+
+    def __init__(
+        self,
+        players: pd.DataFrame,
+        cfg: LeagueConfig,
+        boost_rules: BoostRules | None = None,
+        mimic_rules: dict[str, str] | None = None,
+    ):
+        """
+        Args:
+            players: players_with_ppg.json as a frame ('projected_ppg',
+                     'top_n_avg', 'position', 'slug', 'adp').
+            cfg: The league config; its values are the baseline and fill in
+                 every parameter that is not swept.
+            boost_rules: Parsed player_boost.json.
+            mimic_rules: Parsed player_mimics.json.
+        """
+        self.cfg = cfg
+        self.positions = players["position"].to_numpy(dtype=object)
+        self.projected_ppg = players["projected_ppg"].to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+        self.top_n_avg = players["top_n_avg"].to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+        # Runs from before the weekly floor existed have no 'p10' column.
+        self.floor_ppg = (
+            players["p10"].to_numpy(dtype=np.float64, na_value=np.nan)
+            if "p10" in players
+            else None
+        )
+        self.codes, uniques = pd.factorize(players["position"])
+        self.n_positions = len(uniques)
+        self.adjustments = PlayerAdjustments(
+            players["slug"],
+            players["position"],
+            cfg,
+            boost_rules,
+            mimic_rules,
+            apply_penalties=True,
+        )
+        self.has_adp = players["adp"].notna().to_numpy()
+
+    def vor(self, table: dict[str, np.ndarray]) -> np.ndarray:
+        """
+        VOR of every player under each setting in the table, as the stats and
+        VOR phases would compute it. Shape (settings, players).
+        """
+        n_settings = len(next(iter(table.values())))
+        weights = {
+            name: np.asarray(table.get(name, getattr(self.cfg, name))).reshape(-1, 1)
+            for name in WEIGHT_PARAMETERS
+        }
+        scores = score_players(
+            self.projected_ppg,
+            self.top_n_avg,
+            self.codes,
+            self.n_positions,
+            weights["weight_projection"],
+            weights["weight_last_year"],
+            self.floor_ppg,
+            self.cfg.weight_floor,
+        ).score
+        scores = np.broadcast_to(scores, (n_settings, scores.shape[-1]))
+
+        boosts = {
+            tier: table[name]
+            for name, tier in BOOST_PARAMETERS.items()
+            if name in table
+        }
+        boosted = scores * self.adjustments.boost_multipliers(boosts)
+        expected_ppg = self.adjustments.apply_mimics(boosted)
+
+        # Replacement levels come from the un-penalized scores, as in run_vor.
+        vor, _ = compute_vor(
+            expected_ppg, self.positions, self.cfg.roster, self.cfg.teams
+        )
+        penalties = {
+            name.removeprefix(PENALTY_PREFIX): values
+            for name, values in table.items()
+            if name.startswith(PENALTY_PREFIX)
+        }
+        return vor * self.adjustments.penalty_multipliers(penalties)
+
+    def orders(self, table: dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Each setting's ranking of the players with an ADP, best first, as row
+        indexes into those players. Ties keep their input order, as in run_vor.
+        """
+        vor = self.vor(table)[:, self.has_adp]
+        return np.argsort(-vor, axis=1, kind="stable")
+
+    def run(
+        self,
+        table: dict[str, np.ndarray],
+        top_n: int = DEFAULT_TOP_N,
+        batch_size: int = BATCH_SIZE,
+    ) -> SweepResult:
+        """Ranks the players under every setting and compares each with the baseline."""
+        baseline = {
+            name: np.array([getattr(self.cfg, name)]) for name in WEIGHT_PARAMETERS
+        }
+        baseline_order = self.orders(baseline)[0]
+        n_ranked = len(baseline_order)
+        top_n = min(top_n, n_ranked)
+        baseline_rank = np.empty(n_ranked, dtype=np.int64)
+        baseline_rank[baseline_order] = np.arange(n_ranked)
+        baseline_top = baseline_order[:top_n]
+        in_baseline_top = baseline_rank < top_n
+
+        n_settings = len(next(iter(table.values())))
+        spearman = np.empty(n_settings)
+        overlap = np.empty(n_settings, dtype=np.int64)
+        top_n_ranks = np.empty((n_settings, top_n), dtype=np.int64)
+        entered, left = [], []
+        rows = np.arange(batch_size)[:, None]
+        for start in range(0, n_settings, batch_size):
+            batch = {
+                name: values[start : start + batch_size]
+                for name, values in table.items()
+            }
+            order = self.orders(batch)
+            size = len(order)
+            rank = np.empty_like(order)
+            rank[rows[:size], order] = np.arange(n_ranked)
+
+            d = (rank - baseline_rank).astype(np.float64)
+            spearman[start : start + size] = 1 - 6 * (d * d).sum(axis=1) / (
+                n_ranked * (n_ranked**2 - 1)
+            )
+            in_top = rank < top_n
+            overlap[start : start + size] = (in_top & in_baseline_top).sum(axis=1)
+            top_n_ranks[start : start + size] = rank[:, baseline_top] + 1
+            for row in range(size):
+                entered.append(np.flatnonzero(in_top[row] & ~in_baseline_top).tolist())
+                left.append(np.flatnonzero(~in_top[row] & in_baseline_top).tolist())
+
+        return SweepResult(
+            settings=table,
+            baseline_order=baseline_order,
+            top_n=top_n,
+            spearman=spearman,
+            top_n_overlap=overlap,
+            entered=entered,
+            left=left,
+            top_n_ranks=top_n_ranks,
+        )
+
+
+def run_sweep(
+    date_str: str,
+    grids: dict[str, np.ndarray],
+    samples: int | None = None,
+    seed: int = 0,
+    top_n: int = DEFAULT_TOP_N,
+) -> SweepResult:
+    """
+    Sweeps the parameter grids over a dated run's players_with_ppg.json,
+    prints a report and saves every setting's result to sweep_results.json.
+    """
+    data_dir = settings.DATA_DIR / date_str
+    players = pd.DataFrame(load_json(data_dir / "players_with_ppg.json"))
+    table = build_settings(grids, samples=samples, seed=seed)
+    if not table:
+        raise ValueError("Nothing to sweep: pass at least one --param.")
+
+    sweep = ScoreSweep(
+        players,
+        settings.league_config,
+        load_boost_rules(settings.BASE_DIR / "player_boost.json"),
+        load_mimic_rules(settings.BASE_DIR / "player_mimics.json"),
+    )
+    result = sweep.run(table, top_n=top_n)
+
+    ranked = players[sweep.has_adp].reset_index(drop=True)
+    names = (ranked["first_name"] + " " + ranked["last_name"]).tolist()
+    _print_report(result, names)
+
+    records = []
+    for i in range(len(result.spearman)):
+        records.append(
+            {
+                **{name: float(values[i]) for name, values in table.items()},
+                "spearman": float(result.spearman[i]),
+                "top_n_overlap": int(result.top_n_overlap[i]),
+                "entered_top_n": [names[p] for p in result.entered[i]],
+                "left_top_n": [names[p] for p in result.left[i]],
+            }
+        )
+    save_json(data_dir / "sweep_results.json", records)
+    return result
+
+
+def _print_report(result: SweepResult, names: list[str]) -> None:
+    n_settings = len(result.spearman)
+    print(
+        f"Swept {n_settings:,} settings of {list(result.settings)} over "
+        f"{len(result.baseline_order):,} ranked players."
+    )
+    print(
+        f"Spearman vs. baseline: min {result.spearman.min():.4f}, "
+        f"median {np.median(result.spearman):.4f}, max {result.spearman.max():.4f}"
+    )
+    print(
+        f"Top-{result.top_n} overlap with baseline: min {result.top_n_overlap.min()}, "
+        f"median {np.median(result.top_n_overlap):.0f}, max {result.top_n_overlap.max()}\n"
+    )
+
+    print(
+        f"Most disruptive settings (lowest top-{result.top_n} overlap, then Spearman):"
+    )
+    worst = np.lexsort((result.spearman, result.top_n_overlap))[:REPORTED_SETTINGS]
+    for i in worst:
+        values = ", ".join(f"{k}={v[i]:.3f}" for k, v in result.settings.items())
+        print(
+            f"  {values}: spearman {result.spearman[i]:.4f}, "
+            f"overlap {result.top_n_overlap[i]}/{result.top_n}"
+        )
+        print(f"      in:  {[names[p] for p in result.entered[i]]}")
+        print(f"      out: {[names[p] for p in result.left[i]]}")
+
+    print(f"\nBaseline top {result.top_n} across all settings:")
+    print(f"  {'base':>4} {'player':<28} {'best':>5} {'median':>6} {'worst':>5}")
+    for j, player in enumerate(result.baseline_order[: result.top_n]):
+        ranks = result.top_n_ranks[:, j]
+        print(
+            f"  {j + 1:>4} {names[player]:<28} {ranks.min():>5} "
+            f"{np.median(ranks):>6.0f} {ranks.max():>5}"
+        )
@@ -0,0 +1,275 @@
+# Path: ffbPlayerDraftingApp/backend/transforms/adjustments.py
+
+"""
+Validates the manual player adjustments (player_boost.json, player_mimics.json
+and the league's positional_penalties) and compiles them, once per run, into
+index arrays and multiplier vectors over the player frame's rows.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel, ConfigDict, ValidationError
+
+from backend.logging_config import log
+from backend.settings import LeagueConfig
+from backend.storage.file_store import load_json
+
+
+class BoostRules(BaseModel):
+    """The schema of player_boost.json. Unknown keys are rejected."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    max_boost_slugs: list[str] = []
+    large_boost_slugs: list[str] = []
+    medium_boost_slugs: list[str] = []
+    small_boost_slugs: list[str] = []
+
+
+# Boost tier -> (player_boost.json key, LeagueConfig field with the boost value)
+BOOST_TIERS = {
+    "max": ("max_boost_slugs", "boost_max"),
+    "large": ("large_boost_slugs", "boost_large"),
+    "medium": ("medium_boost_slugs", "boost_medium"),
+    "small": ("small_boost_slugs", "boost_small"),
+}
+
+
+def load_boost_rules(path: Path) -> BoostRules | None:
+    """Loads player_boost.json, or returns None if it does not exist."""
+    if not path.exists():
+        return None
+    try:
+        return BoostRules(**load_json(path))
+    except ValidationError as e:
+        raise ValueError(f"Invalid boost rules in {path}: {e}") from e
+
+
+def load_mimic_rules(path: Path) -> dict[str, str]:
+    """
+    Loads player_mimics.json (target slug -> source slug). A rule whose
+    source is itself a mimic target is followed to the end of the chain;
+    self-references and cycles are rejected.
+    """
+    if not path.exists():
+        return {}
+    mimic_map = load_json(path)
+    if not isinstance(mimic_map, dict) or not all(
+        isinstance(k, str) and isinstance(v, str) for k, v in mimic_map.items()
+    ):
+        raise ValueError(f"Invalid mimic rules in {path}: expected slug -> slug.")
+    for target_slug in mimic_map:
+        _mimic_root(target_slug, mimic_map)
+    return mimic_map
+
+
+def _mimic_root(target_slug: str, mimic_map: dict[str, str]) -> str:
+    """Follows a chain of mimic rules (a -> b -> c) to the slug that supplies the value."""
+    if mimic_map[target_slug] == target_slug:
+        raise ValueError(f"Mimic rule for '{target_slug}' points at itself.")
+    seen = [target_slug]
+    slug = mimic_map[target_slug]
+    while slug in mimic_map:
+        if slug in seen:
+            raise ValueError(f"Mimic rules form a cycle: {' -> '.join(seen + [slug])}")
+        seen.append(slug)
+        slug = mimic_map[slug]
+    return slug
+
+
+class PlayerAdjustments:
+    """
+    Boosts, mimics and positional penalties compiled against one player frame.
+
+    Compiling resolves every slug and position to row indexes once; applying a
+    rule set is then a multiply or a single gather/scatter over the whole
+    column, however many rules there are. Rules that name players or
+    positions not in the frame are collected in `unmatched` instead of being
+    skipped silently.
+    """
+
+    def __init__(
+        self,
+        slugs: pd.Series,
+        positions: pd.Series,
+        cfg: LeagueConfig,
+        boost_rules: BoostRules | None = None,
+        mimic_rules: dict[str, str] | None = None,
+        apply_penalties: bool = False,
+    ):
+        """
+        Args:
+            slugs: The frame's 'slug' column.
+            positions: The frame's 'position' column.
+            cfg: League settings (boost values, positional penalties, roster).
+            boost_rules: Parsed player_boost.json, if boosts should be compiled.
+            mimic_rules: Parsed player_mimics.json, if mimics should be compiled.
+            apply_penalties: Whether to compile cfg.positional_penalties.
+        """
+        n = len(slugs)
+        slugs = slugs.reset_index(drop=True)
+        positions = positions.reset_index(drop=True)
+        self.unmatched: list[dict] = []
+
+        # Slug -> row indexes, built once and shared by every rule.
+        self._rows_by_slug: dict[str, np.ndarray] = (
+            pd.Series(np.arange(n)).groupby(slugs.to_numpy(dtype=object)).indices
+        )
+
+        # --- Boosts: one multiplier per row (tiers compound) ---
+        self.boost_multiplier = np.ones(n)
+        self.boosted: dict[str, tuple[float, list[str]]] = {}
+        # How many times each row is listed in each tier.
+        self.boost_counts: dict[str, np.ndarray] = {}
+        if boost_rules is not None:
+            for tier_name, (json_key, config_field) in BOOST_TIERS.items():
+                boost_value = getattr(cfg, config_field)
+                matched = []
+                counts = np.zeros(n, dtype=np.int64)
+                for slug in getattr(boost_rules, json_key):
+                    rows = self._rows(slug, "boost", json_key)
+                    if rows is not None:
+                        self.boost_multiplier[rows] *= 1 + boost_value
+                        counts[rows] += 1
+                        matched.append(slug)
+                self.boosted[tier_name] = (boost_value, matched)
+                self.boost_counts[tier_name] = counts
+
+        # --- Mimics: every target row copies its chain root's first row ---
+        targets, sources = [], []
+        self.mimics: dict[str, str] = {}
+        for target_slug in mimic_rules or {}:
+            root_slug = _mimic_root(target_slug, mimic_rules)
+            target_rows = self._rows(target_slug, "mimic", "target")
+            source_rows = self._rows(root_slug, "mimic", f"source of '{target_slug}'")
+            if target_rows is None or source_rows is None:
+                continue
+            targets.append(target_rows)
+            sources.append(np.full(len(target_rows), source_rows[0]))
+            self.mimics[target_slug] = root_slug
+        self.mimic_targets = (
+            np.concatenate(targets) if targets else np.empty(0, dtype=np.int64)
+        )
+        self.mimic_sources = (
+            np.concatenate(sources) if sources else np.empty(0, dtype=np.int64)
+        )
+
+        # --- Positional penalties: one multiplier per row ---
+        self.penalty_multiplier = np.ones(n)
+        self.penalties: dict[str, float] = {}
+        self._known_positions = {
+            pos for pos in cfg.roster.model_dump() if pos != "FLEX"
+        }
+        self._position_values = positions.to_numpy(dtype=object)
+        if apply_penalties:
+            known_positions = self._known_positions
+            position_values = self._position_values
+            for position, penalty in cfg.positional_penalties.items():
+                if penalty <= 0:
+                    raise ValueError(
+                        f"Positional penalty for '{position}' must be positive, got {penalty}."
+                    )
+                if position not in known_positions:
+                    self._report(
+                        "penalty", position, "position not in the league roster"
+                    )
+                    continue
+                if penalty > 1.0:
+                    # Penalties only ever reduce a position's value.
+                    self._report("penalty", position, f"factor {penalty} is above 1.0")
+                    continue
+                self.penalty_multiplier[position_values == position] = penalty
+                self.penalties[position] = penalty
+
+    def _rows(self, slug: str, rule: str, key: str) -> np.ndarray | None:
+        rows = self._rows_by_slug.get(slug)
+        if rows is None:
+            self._report(rule, slug, f"no player with this slug ({key})")
+        return rows
+
+    def _report(self, rule: str, key: str, reason: str) -> None:
+        self.unmatched.append({"rule": rule, "key": key, "reason": reason})
+
+    def apply_boosts(self, scores: np.ndarray) -> np.ndarray:
+        return np.asarray(scores, dtype=np.float64) * self.boost_multiplier
+
+    def boost_multipliers(self, boost_values: dict[str, np.ndarray]) -> np.ndarray:
+        """
+        The boost multiplier under many boost settings at once.
+
+        Args:
+            boost_values: Tier name -> one boost value per setting, shape
+                          (settings,). Tiers left out keep the compiled value.
+
+        Returns:
+            A (settings, players) array; row i is what boost_multiplier would
+            be with the i-th values.
+        """
+        n_settings = len(next(iter(boost_values.values()), [1.0]))
+        multiplier = np.ones((n_settings, len(self.boost_multiplier)))
+        for tier_name, counts in self.boost_counts.items():
+            boost_value = np.asarray(
+                boost_values.get(tier_name, self.boosted[tier_name][0]),
+                dtype=np.float64,
+            ).reshape(-1, 1)
+            # Compounded one tier at a time, in the order of the scalar path.
+            for listing in range(1, counts.max(initial=0) + 1):
+                multiplier[:, counts >= listing] *= 1 + boost_value
+        return multiplier
+
+    def penalty_multipliers(self, penalty_values: dict[str, np.ndarray]) -> np.ndarray:
+        """
+        The penalty multiplier under many penalty settings at once.
+
+        Args:
+            penalty_values: Position -> one penalty factor per setting, shape
+                            (settings,). Positions left out keep the compiled
+                            penalty.
+
+        Returns:
+            A (settings, players) array of per-player penalty factors.
+        """
+        n_settings = len(next(iter(penalty_values.values()), [1.0]))
+        multiplier = np.tile(self.penalty_multiplier, (n_settings, 1))
+        for position, values in penalty_values.items():
+            values = np.asarray(values, dtype=np.float64)
+            if position not in self._known_positions:
+                raise ValueError(f"Position '{position}' is not in the league roster.")
+            if np.any(values <= 0) or np.any(values > 1.0):
+                raise ValueError(
+                    f"Positional penalties for '{position}' must be in (0, 1]."
+                )
+            multiplier[:, self._position_values == position] = values[:, None]
+        return multiplier
+
+    def apply_mimics(self, values: np.ndarray) -> np.ndarray:
+        """
+        Gives every mimic target its source player's value, in one gather.
+        Works on the last axis, so a (settings, players) batch is one gather too.
+        """
+        out = np.array(values, dtype=np.float64)
+        out[..., self.mimic_targets] = out[..., self.mimic_sources]
+        return out
+
+    def apply_penalties(self, values: np.ndarray) -> np.ndarray:
+        return np.asarray(values, dtype=np.float64) * self.penalty_multiplier
+
+    def log_report(self) -> None:
+        """Logs what was applied and warns about every rule that matched nothing."""
+        for tier_name, (boost_value, slugs) in self.boosted.items():
+            if slugs:
+                log.info(
+                    f"Applied a {boost_value:.0%} '{tier_name}' boost to {len(slugs)} players."
+                )
+                log.info(f"'{tier_name}' boosted players: {slugs}")
+        if self.mimics:
+            log.info(
+                f"Applied {len(self.mimics)} player mimic rules.",
+                extra={"mimics": self.mimics},
+            )
+        for position, penalty in self.penalties.items():
+            log.info(f"Applied a x{penalty} penalty to {position} position.")
+        for entry in self.unmatched:
+            log.warning("Adjustment rule did not match.", extra=entry)
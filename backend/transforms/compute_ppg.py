@@ -1,7 +1,221 @@
 # Path: ffbPlayerDraftingApp/backend/transforms/compute_ppg.py (DEFINITIVE FINAL)
+from pathlib import Path
+from typing import Sequence
+
 import pandas as pd
 import numpy as np
 from backend.settings import settings  # Import settings to access config
+from backend.storage.file_store import load_json
+
+# Weekly quantiles reported per player: floor, median and ceiling.
+WEEKLY_QUANTILES = {"p10": 0.1, "p50": 0.5, "p90": 0.9}
+# A boom week scores at least this quantile of all weeks played at the
+# player's position; a bust week scores below the bust quantile.
+BOOM_QUANTILE = 0.8
+BUST_QUANTILE = 0.2
+
+
+def _sorted_quantile(
+    descending: np.ndarray, counts: np.ndarray, q: float
+) -> np.ndarray:
+    """
+    The q-th quantile along the last axis, linearly interpolated as
+    np.quantile's default method does, from rows sorted descending with their
+    `counts` valid values first. Rows without values give NaN.
+    """
+    position = q * np.maximum(counts - 1, 0)
+    lower = np.floor(position).astype(np.int64)
+    upper = np.minimum(lower + 1, np.maximum(counts - 1, 0))
+
+    def at(ascending_index: np.ndarray) -> np.ndarray:
+        # Ascending index k sits at descending index count - 1 - k.
+        index = np.maximum(counts - 1 - ascending_index, 0)[..., None]
+        return np.take_along_axis(descending, index, axis=-1)[..., 0]
+
+    low, high = at(lower), at(upper)
+    with np.errstate(invalid="ignore"):
+        value = low + (position - lower) * (high - low)
+    return np.where(counts > 0, value, np.nan)
+
+
+class WeeklyScoreMatrix:
+    """
+    Last season's weekly scores as a players x weeks matrix with a mask of the
+    weeks each player actually played. Leading batch axes, e.g. (samples,
+    players, weeks) from resample(), are supported everywhere except in
+    distribution().
+
+    Each row is sorted once, descending, and its running sums are kept, so a
+    top-N average under any (top_n, min_score) setting is a comparison, a
+    count and one gather for all players at once: re-running the stats phase
+    with a different top_game_count or min_historical_score costs almost
+    nothing.
+    """
+
+    def __init__(self, scores: np.ndarray):
+        """
+        Args:
+            scores: A (..., players, weeks) float array with NaN for missing
+                    weeks.
+        """
+        self.scores = np.asarray(scores, dtype=np.float64)
+        self.mask = ~np.isnan(self.scores)
+
+        # Missing weeks become -inf so they sort to the end of every row.
+        descending = -np.sort(-np.where(self.mask, self.scores, -np.inf), axis=-1)
+        self._sorted = descending
+        self._running_sums = np.cumsum(
+            np.where(np.isfinite(descending), descending, 0.0), axis=-1
+        )
+
+    @classmethod
+    def from_score_lists(
+        cls, player_scores: Sequence[Sequence[float | None] | None]
+    ) -> "WeeklyScoreMatrix":
+        """
+        Builds the matrix from one list of weekly scores per player (e.g. the
+        output of PlayerIdentityResolver.align). None marks a missing week or,
+        in place of the whole list, a player with no history.
+        """
+        n_weeks = max((len(s) for s in player_scores if s is not None), default=0)
+        matrix = np.full((len(player_scores), n_weeks), np.nan)
+        for row, scores in enumerate(player_scores):
+            if scores:
+                matrix[row, : len(scores)] = [
+                    np.nan if s is None else s for s in scores
+                ]
+        return cls(matrix)
+
+    @property
+    def games_played(self) -> np.ndarray:
+        return self.mask.sum(axis=-1)
+
+    def resample(self, rng: np.random.Generator, n_samples: int) -> "WeeklyScoreMatrix":
+        """
+        Bootstrap resamples of every player's season: each sample draws as
+        many weeks as the player played, with replacement, from those weeks.
+
+        Returns:
+            A (n_samples, players, weeks) matrix; a player's drawn weeks come
+            first in each row, the rest are missing.
+        """
+        n_players, n_weeks = self.scores.shape
+        games = self.games_played
+        # Week indexes into each player's sorted row, drawn in float32 (the
+        # bulk of the cost) and clipped against rounding up to `games`.
+        uniform = rng.random((n_samples, n_players, n_weeks), dtype=np.float32)
+        draws = np.minimum(
+            (uniform * games[:, None]).astype(np.int64),
+            np.maximum(games - 1, 0)[:, None],
+        )
+        draws += np.arange(n_players)[:, None] * n_weeks
+        resampled = self._sorted.ravel()[draws]
+        return WeeklyScoreMatrix(
+            np.where(np.arange(n_weeks) < games[:, None], resampled, np.nan)
+        )
+
+    def quantile(self, q: float) -> np.ndarray:
+        """Each player's q-th quantile over the weeks played; NaN with none."""
+        if self.scores.shape[-1] == 0:
+            return np.full(self.scores.shape[:-1], np.nan)
+        return _sorted_quantile(self._sorted, self.games_played, q)
+
+    def distribution(
+        self, position_codes: np.ndarray, n_positions: int
+    ) -> dict[str, np.ndarray]:
+        """
+        Weekly floor and ceiling metrics over the weeks each player played,
+        for all players at once.
+
+        Args:
+            position_codes: One integer code per player, as from pd.factorize
+                            (-1 for no position).
+            n_positions: Number of distinct codes.
+
+        Returns:
+            Column name -> one value per player: the WEEKLY_QUANTILES, the
+            boom and bust rates (shares of weeks played, judged against the
+            weeks played at the player's position) and the volatility (the
+            population standard deviation of the weekly scores). NaN for
+            players without a week played.
+        """
+        n_players, n_weeks = self.scores.shape
+        names = [*WEEKLY_QUANTILES, "boom_rate", "bust_rate", "volatility"]
+        if n_weeks == 0:
+            return {name: np.full(n_players, np.nan) for name in names}
+        games = self.games_played
+        metrics = {name: self.quantile(q) for name, q in WEEKLY_QUANTILES.items()}
+
+        boom_at = np.full(n_players, np.nan)
+        bust_at = np.full(n_players, np.nan)
+        for code in range(n_positions):
+            at_position = position_codes == code
+            weeks = self.scores[at_position][self.mask[at_position]]
+            if len(weeks):
+                pool = -np.sort(-weeks)[None, :]
+                counts = np.array([len(weeks)])
+                boom_at[at_position] = _sorted_quantile(pool, counts, BOOM_QUANTILE)[0]
+                bust_at[at_position] = _sorted_quantile(pool, counts, BUST_QUANTILE)[0]
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            booms = (self.mask & (self.scores >= boom_at[:, None])).sum(axis=1)
+            busts = (self.mask & (self.scores < bust_at[:, None])).sum(axis=1)
+            metrics["boom_rate"] = np.where(games > 0, booms / games, np.nan)
+            metrics["bust_rate"] = np.where(games > 0, busts / games, np.nan)
+            mean = self._running_sums[:, -1] / games
+            deviations = np.where(self.mask, self.scores - mean[:, None], 0.0)
+            metrics["volatility"] = np.where(
+                games > 0,
+                np.sqrt((deviations * deviations).sum(axis=1) / games),
+                np.nan,
+            )
+        return metrics
+
+    def top_n_avg(self, top_n: int, min_score: float) -> np.ndarray:
+        """
+        Calculates the average of each player's top N weekly scores, first
+        filtering out scores below a minimum threshold to exclude dud games.
+
+        Returns:
+            One value per player; NaN when no week meets the threshold.
+        """
+        if self._sorted.shape[-1] == 0 or top_n <= 0:
+            return np.full(self._sorted.shape[:-1], np.nan)
+
+        # Rows are sorted descending, so the qualifying weeks are a prefix.
+        qualifying = (self._sorted >= min_score).sum(axis=-1)
+        games = np.minimum(qualifying, top_n)
+        totals = np.take_along_axis(
+            self._running_sums, np.maximum(games - 1, 0)[..., None], axis=-1
+        )[..., 0]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(games > 0, totals / games, np.nan)
+
+
+def top_n_games_avg(
+    player_scores: Sequence[list[float] | None], top_n: int, min_score: float
+) -> np.ndarray:
+    """
+    Calculates the top-N weekly average for scores already aligned to players
+    (e.g. by PlayerIdentityResolver.align), one entry per player.
+    """
+    return WeeklyScoreMatrix.from_score_lists(player_scores).top_n_avg(top_n, min_score)
+
+
+def load_weekly_scores(data_dir: Path, n_players: int) -> WeeklyScoreMatrix:
+    """
+    Loads a run's weekly_scores.json, checking that it still has one row per
+    player of the run's players_with_ppg.json.
+    """
+    history = WeeklyScoreMatrix.from_score_lists(
+        load_json(data_dir / "weekly_scores.json")
+    )
+    if len(history.scores) != n_players:
+        raise ValueError(
+            "weekly_scores.json does not match players_with_ppg.json; "
+            "rerun the stats phase."
+        )
+    return history
 
 
 def calculate_top_n_games_avg(
@@ -14,24 +228,7 @@ def calculate_top_n_games_avg(
     cfg = settings.league_config
     min_score = cfg.min_historical_score
 
-    def get_player_avg(slug):
-        scores = historical_stats.get(slug)
-        if not scores:
-            return np.nan
-
-        # --- THE FINAL FIX: Filter out injury-shortened "dud" games ---
-        filtered_scores = [s for s in scores if s >= min_score]
-
-        if not filtered_scores:
-            return np.nan  # Player had scores, but none met the threshold
-
-        sorted_scores = sorted(filtered_scores, reverse=True)
-        games_to_average = min(len(sorted_scores), top_n)
-        top_scores = sorted_scores[:games_to_average]
-
-        if not top_scores:
-            return np.nan
-
-        return sum(top_scores) / games_to_average
-
-    return slug_series.apply(get_player_avg)
+    player_scores = [historical_stats.get(slug) for slug in slug_series]
+    return pd.Series(
+        top_n_games_avg(player_scores, top_n, min_score), index=slug_series.index
+    )
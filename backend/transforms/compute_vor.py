@@ -1,58 +1,219 @@
 # Path: ffbPlayerDraftingApp/backend/transforms/compute_vor.py (DEFINITIVE FINAL)
 
+import numpy as np
 import pandas as pd
+
+from backend.constants import FLEX_POSITIONS
 from backend.logging_config import log
-from backend.settings import settings
+from backend.settings import RosterSettings, settings
 
 
-def calculate_vor(df: pd.DataFrame) -> tuple[pd.DataFrame, dict]:
-    log.info("Calculating Value over Replacement (VOR) with FLEX logic.")
-    cfg = settings.league_config
-    roster = cfg.roster
+def _kth_largest(values: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Partially orders the last axis so its k largest values come first.
+    NaN sorts after every number, as it does in sort_values().
+
+    Returns:
+        (the k-th largest value along the last axis, the values ranked below it)
+    """
+    partitioned = -np.partition(-values, k - 1, axis=-1)
+    return partitioned[..., k - 1], partitioned[..., k:]
 
-    replacement_levels = {}
 
-    # Step 1: Calculate replacement for dedicated positions
+def replacement_levels(
+    points: np.ndarray, positions: np.ndarray, roster: RosterSettings, teams: int
+) -> dict[str, np.ndarray]:
+    """
+    Finds each position's replacement level with a partial selection instead of
+    a full sort. The replacement player is the last starter league-wide (e.g.
+    the 24th QB in a 12-team, 2-QB league); FLEX is the last FLEX starter among
+    the RB/WR/TE players left over once those positions' starters are taken.
+
+    Args:
+        points: Expected points, shape (players,) or (scenarios, players) to
+                evaluate several point estimates at once.
+        positions: One position per player (column).
+        roster: Starters per position.
+        teams: Number of teams in the league.
+
+    Returns:
+        Position -> replacement level, a scalar array or one per scenario. A
+        position without enough players has a level of 0.0.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    batch_shape = points.shape[:-1]
+    levels: dict[str, np.ndarray] = {}
+    flex_pool: list[np.ndarray] = []
+
     for pos, starters in roster.model_dump().items():
         if pos == "FLEX":
             continue
-        pos_df = df[df["position"] == pos].sort_values("expected_ppg", ascending=False)
-        replacement_idx = cfg.teams * starters
+        pos_points = points[..., positions == pos]
+        n_players = pos_points.shape[-1]
+        replacement_idx = teams * starters
 
-        if 0 < replacement_idx <= len(pos_df):
-            replacement_levels[pos] = pos_df.iloc[replacement_idx - 1]["expected_ppg"]
+        if 0 < replacement_idx <= n_players:
+            levels[pos], leftover = _kth_largest(pos_points, replacement_idx)
         else:
-            replacement_levels[pos] = 0.0
+            levels[pos] = np.zeros(batch_shape)
+            leftover = pos_points if replacement_idx == 0 else pos_points[..., :0]
+        if pos in FLEX_POSITIONS:
+            flex_pool.append(leftover)
+
+    flex_replacement_idx = teams * roster.FLEX
+    pool = np.concatenate(flex_pool, axis=-1) if flex_pool else points[..., :0]
+    if 0 < flex_replacement_idx <= pool.shape[-1]:
+        levels["FLEX"], _ = _kth_largest(pool, flex_replacement_idx)
+    else:
+        levels["FLEX"] = np.zeros(batch_shape)
+    return levels
+
+
+def compute_vor(
+    points: np.ndarray, positions: np.ndarray, roster: RosterSettings, teams: int
+) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+    """
+    Value over replacement for every player as array expressions. RB/WR/TE
+    players take the better of their positional and FLEX VOR when the league
+    has FLEX spots.
+
+    Args:
+        points: Expected points, shape (players,) or (scenarios, players).
+        positions: One position per player (column).
+        roster: Starters per position.
+        teams: Number of teams in the league.
+
+    Returns:
+        (VOR with the same shape as points, replacement levels by position)
+    """
+    points = np.asarray(points, dtype=np.float64)
+    positions = np.asarray(positions, dtype=object)
+    levels = replacement_levels(points, positions, roster, teams)
+
+    # Players at positions without a roster entry are measured against 0.0.
+    replacement = np.zeros_like(points)
+    for pos, level in levels.items():
+        if pos == "FLEX":
+            continue
+        is_pos = positions == pos
+        replacement[..., is_pos] = np.expand_dims(level, -1)
+    vor = points - replacement
 
-    # Step 2: Calculate FLEX replacement level ONLY IF FLEX spots exist
     if roster.FLEX > 0:
-        flex_pool = pd.concat(
-            [
-                df[df["position"] == "RB"].iloc[cfg.teams * roster.RB :],
-                df[df["position"] == "WR"].iloc[cfg.teams * roster.WR :],
-                df[df["position"] == "TE"].iloc[cfg.teams * roster.TE :],
-            ]
-        ).sort_values("expected_ppg", ascending=False)
-
-        flex_replacement_idx = cfg.teams * roster.FLEX
-        if 0 < flex_replacement_idx <= len(flex_pool):
-            replacement_levels["FLEX"] = flex_pool.iloc[flex_replacement_idx - 1][
-                "expected_ppg"
-            ]
+        is_flex = np.isin(positions, FLEX_POSITIONS)
+        flex_vor = points - np.expand_dims(levels["FLEX"], -1)
+        # Written as a comparison (not np.maximum) so a NaN FLEX VOR never
+        # replaces a valid positional one.
+        vor = np.where(is_flex & (flex_vor > vor), flex_vor, vor)
+    return vor, levels
+
+
+def shape_replacement_levels(
+    points: np.ndarray,
+    positions: np.ndarray,
+    teams: np.ndarray,
+    starters: dict[str, np.ndarray],
+) -> dict[str, np.ndarray]:
+    """
+    replacement_levels for many league shapes (team count and starters per
+    position) over one set of expected points. Every position is sorted once;
+    a shape's level is then a gather at index teams * starters. For FLEX, the
+    RB/WR/TE players are merged into one descending order, and a shape's FLEX
+    pool is the players ranked below their position's starters, so its level
+    is found with a cumulative count along that order.
+
+    Args:
+        points: Expected points, shape (players,).
+        positions: One position per player.
+        teams: Number of teams per shape, shape (shapes,).
+        starters: Roster position -> starters per shape, shape (shapes,). Every
+                  RosterSettings field is required.
+
+    Returns:
+        Position -> replacement level per shape, as replacement_levels computes
+        it for each shape on its own.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    positions = np.asarray(positions, dtype=object)
+    teams = np.asarray(teams, dtype=np.int64)
+    levels: dict[str, np.ndarray] = {}
+    flex_values, flex_cuts = [], []
+
+    for pos in RosterSettings.model_fields:
+        if pos == "FLEX":
+            continue
+        # Descending, NaN last, as _kth_largest orders them.
+        pos_points = points[positions == pos]
+        ordered = pos_points[np.argsort(-pos_points, kind="stable")]
+        replacement_idx = teams * np.asarray(starters[pos], dtype=np.int64)
+        has_level = (replacement_idx > 0) & (replacement_idx <= len(ordered))
+        if len(ordered):
+            gathered = ordered[np.clip(replacement_idx - 1, 0, len(ordered) - 1)]
+            levels[pos] = np.where(has_level, gathered, 0.0)
         else:
-            replacement_levels["FLEX"] = 0.0
-    else:
-        replacement_levels["FLEX"] = 0.0
+            levels[pos] = np.zeros(len(teams))
+        if pos in FLEX_POSITIONS:
+            flex_values.append(ordered)
+            flex_cuts.append(replacement_idx)
+
+    flex_replacement_idx = teams * np.asarray(starters["FLEX"], dtype=np.int64)
+    values = np.concatenate(flex_values) if flex_values else np.empty(0)
+    if not len(values):
+        levels["FLEX"] = np.zeros(len(teams))
+        return levels
+    order = np.argsort(-values, kind="stable")
+    position_rank = np.concatenate([np.arange(len(v)) for v in flex_values])
+    group = np.repeat(np.arange(len(flex_values)), [len(v) for v in flex_values])
+    # A player is in a shape's FLEX pool when ranked below its position's
+    # starters; a starter count beyond the position's size leaves no one.
+    in_pool = position_rank[order] >= np.stack(flex_cuts, axis=1)[:, group[order]]
+    pool_size = np.cumsum(in_pool, axis=1)
+    has_level = (flex_replacement_idx > 0) & (flex_replacement_idx <= pool_size[:, -1])
+    kth = np.argmax(pool_size >= flex_replacement_idx[:, None], axis=1)
+    levels["FLEX"] = np.where(has_level, values[order][kth], 0.0)
+    return levels
+
 
-    # Step 3: Calculate VOR for each player
-    def get_player_vor(row):
-        pos_vor = row["expected_ppg"] - replacement_levels.get(row["position"], 0.0)
+def shape_vor(
+    points: np.ndarray,
+    positions: np.ndarray,
+    teams: np.ndarray,
+    starters: dict[str, np.ndarray],
+) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+    """
+    compute_vor for many league shapes at once (see shape_replacement_levels).
 
-        if row["position"] in ["RB", "WR", "TE"] and cfg.roster.FLEX > 0:
-            flex_vor = row["expected_ppg"] - replacement_levels.get("FLEX", 0.0)
-            return max(pos_vor, flex_vor)
+    Returns:
+        (VOR with shape (shapes, players), replacement levels by position)
+    """
+    points = np.asarray(points, dtype=np.float64)
+    positions = np.asarray(positions, dtype=object)
+    levels = shape_replacement_levels(points, positions, teams, starters)
 
-        return pos_vor
+    replacement = np.zeros((len(levels["FLEX"]), len(points)))
+    for pos, level in levels.items():
+        if pos == "FLEX":
+            continue
+        is_pos = positions == pos
+        replacement[:, is_pos] = level[:, None]
+    vor = points - replacement
+
+    has_flex = (np.asarray(starters["FLEX"]) > 0)[:, None]
+    is_flex = np.isin(positions, FLEX_POSITIONS)
+    flex_vor = points - levels["FLEX"][:, None]
+    vor = np.where(has_flex & is_flex & (flex_vor > vor), flex_vor, vor)
+    return vor, levels
+
+
+def calculate_vor(df: pd.DataFrame) -> tuple[pd.DataFrame, dict]:
+    log.info("Calculating Value over Replacement (VOR) with FLEX logic.")
+    cfg = settings.league_config
 
-    df["vor"] = df.apply(get_player_vor, axis=1)
-    return df, replacement_levels
+    vor, levels = compute_vor(
+        df["expected_ppg"].to_numpy(dtype=np.float64),
+        df["position"].to_numpy(dtype=object),
+        cfg.roster,
+        cfg.teams,
+    )
+    df["vor"] = vor
+    return df, {pos: float(level) for pos, level in levels.items()}
@@ -0,0 +1,167 @@
+# Path: ffbPlayerDraftingApp/backend/transforms/fantasy_points.py
+
+"""
+Local fantasy scoring over raw stat components.
+
+The FantasyPros stats and projections tables carry the raw stat lines
+(yards, touchdowns, receptions, ...) next to the site's FPTS for the scoring
+mode in the URL. Scoring those lines here makes every scoring mode, and any
+custom league rule, a local computation over one scrape: a scoring rule set
+is a (positions, stats) weight matrix, and a player's points are their stat
+row times their position's weight row, one matrix multiply per position.
+
+Rule sets start from a preset (STD, HALF or PPR) and the league config's
+'scoring_rules' override single weights, for every position ('pass_td': 6)
+or one ('TE:rec': 1.5 for a tight-end premium).
+
+Only offensive positions are scored locally. Kickers and defenses keep the
+site's FPTS: their scoring is the same in every preset, and the
+points-allowed tiers of a defense are not linear in the scraped stats.
+"""
+
+from collections.abc import Mapping
+
+import numpy as np
+import pandas as pd
+
+# The stat axis of every stat array, in this order.
+STATS = (
+    "pass_cmp",
+    "pass_att",
+    "pass_yds",
+    "pass_td",
+    "pass_int",
+    "rush_att",
+    "rush_yds",
+    "rush_td",
+    "targets",
+    "rec",
+    "rec_yds",
+    "rec_td",
+    "fumbles_lost",
+)
+# Positions scored from their stats, in weight-matrix row order.
+LOCAL_POSITIONS = ("QB", "RB", "WR", "TE")
+
+# FantasyPros headers ("GROUP_STAT" once the two header rows are joined).
+SOURCE_STAT_COLUMNS = {
+    "PASSING_CMP": "pass_cmp",
+    "PASSING_ATT": "pass_att",
+    "PASSING_YDS": "pass_yds",
+    "PASSING_TD": "pass_td",
+    "PASSING_TDS": "pass_td",
+    "PASSING_INT": "pass_int",
+    "PASSING_INTS": "pass_int",
+    "RUSHING_ATT": "rush_att",
+    "RUSHING_YDS": "rush_yds",
+    "RUSHING_TD": "rush_td",
+    "RUSHING_TDS": "rush_td",
+    "RECEIVING_TGT": "targets",
+    "RECEIVING_REC": "rec",
+    "RECEIVING_YDS": "rec_yds",
+    "RECEIVING_TD": "rec_td",
+    "RECEIVING_TDS": "rec_td",
+    "MISC_FL": "fumbles_lost",
+}
+
+_STANDARD = {
+    "pass_yds": 0.04,
+    "pass_td": 4.0,
+    "pass_int": -2.0,
+    "rush_yds": 0.1,
+    "rush_td": 6.0,
+    "rec_yds": 0.1,
+    "rec_td": 6.0,
+    "fumbles_lost": -2.0,
+}
+SCORING_PRESETS = {
+    "STD": _STANDARD,
+    "HALF": {**_STANDARD, "rec": 0.5},
+    "PPR": {**_STANDARD, "rec": 1.0},
+}
+
+
+def scoring_weights(
+    scoring: str, rules: Mapping[str, float] | None = None
+) -> np.ndarray:
+    """
+    The (LOCAL_POSITIONS, STATS) weight matrix of a rule set.
+
+    Args:
+        scoring: The preset to start from: 'STD', 'HALF' or 'PPR'.
+        rules: Weight overrides keyed by stat ('rec') or position and stat
+            ('TE:rec').
+
+    Raises:
+        ValueError: For an unknown preset, stat or position.
+    """
+    preset = SCORING_PRESETS.get(scoring.upper())
+    if preset is None:
+        raise ValueError(
+            f"Unknown scoring preset '{scoring}'; expected one of "
+            f"{', '.join(SCORING_PRESETS)}."
+        )
+    weights = np.zeros((len(LOCAL_POSITIONS), len(STATS)))
+    for stat, points in preset.items():
+        weights[:, STATS.index(stat)] = points
+    # Rules for every position first, so position-specific ones win.
+    for key, points in sorted((rules or {}).items(), key=lambda rule: ":" in rule[0]):
+        position, _, stat = key.rpartition(":")
+        if stat not in STATS:
+            raise ValueError(f"Unknown stat '{stat}' in scoring rule '{key}'.")
+        if position and position.upper() not in LOCAL_POSITIONS:
+            raise ValueError(
+                f"Scoring rule '{key}' names a position that is not scored "
+                f"locally; expected one of {', '.join(LOCAL_POSITIONS)}."
+            )
+        rows = [LOCAL_POSITIONS.index(position.upper())] if position else slice(None)
+        weights[rows, STATS.index(stat)] = points
+    return weights
+
+
+def source_stats(table: pd.DataFrame) -> np.ndarray | None:
+    """
+    The stat lines of a FantasyPros table as a (rows, STATS) array.
+
+    Stats a table does not have are 0 (a quarterback table has no receiving
+    columns). Returns None when no stat column is recognized, so the caller
+    can fall back to the table's FPTS.
+    """
+    headers = [
+        "_".join(str(part) for part in col) if isinstance(col, tuple) else str(col)
+        for col in table.columns
+    ]
+    stats = np.zeros((len(table), len(STATS)))
+    found = False
+    for column, header in enumerate(headers):
+        stat = SOURCE_STAT_COLUMNS.get(header.strip().upper())
+        if stat is None:
+            continue
+        values = table.iloc[:, column].astype(str).str.replace(",", "", regex=False)
+        stats[:, STATS.index(stat)] = pd.to_numeric(values, errors="coerce").fillna(0.0)
+        found = True
+    return stats if found else None
+
+
+def fantasy_points(
+    stats: np.ndarray, positions: np.ndarray, weights: np.ndarray
+) -> np.ndarray:
+    """
+    Scores stat lines under a rule set.
+
+    Args:
+        stats: A (players, ..., STATS) array, e.g. (players, weeks, STATS);
+            NaN stat lines (weeks not played) score NaN.
+        positions: Each player's position.
+        weights: A scoring_weights matrix.
+
+    Returns:
+        A (players, ...) array of points rounded to hundredths; NaN for
+        positions not scored locally.
+    """
+    points = np.full(stats.shape[:-1], np.nan)
+    for row, position in enumerate(LOCAL_POSITIONS):
+        players = positions == position
+        if players.any():
+            points[players] = np.round(stats[players] @ weights[row], 2)
+    return points
@@ -2,8 +2,15 @@
 
 """Functions for filtering lists of players based on defined rules."""
 
+from collections import Counter
+from typing import Iterable
+
+from pydantic import ValidationError
+
 from backend.logging_config import log  # Corrected import path
-from backend.models import PlayerRaw  # Corrected import path
+from backend.models import PlayerRaw, PlayerRawList  # Corrected import path
+from backend.settings import RelevanceSettings
+from backend.utils import slugify
 
 
 def keep_rostered_and_relevant(
@@ -47,3 +54,153 @@ def keep_rostered_and_relevant(
     )
 
     return filtered_players
+
+
+def keep_rostered_and_relevant_records(
+    records: Iterable[dict], relevant_positions: set[str]
+) -> list[dict]:
+    """
+    The same filter as keep_rostered_and_relevant, applied to raw Sleeper
+    dicts before any model is built, so the ~11k raw players only pay for a
+    two-key lookup and only the survivors are validated.
+
+    Args:
+        records: Raw player dicts as stored in raw_players.json.
+        relevant_positions: A set of position strings (e.g., {"QB", "RB", ...}).
+
+    Returns:
+        The raw dicts of players on a team at a relevant position.
+    """
+    records = list(records)
+    filtered = [
+        record
+        for record in records
+        if record.get("team") is not None
+        and record.get("position") in relevant_positions
+    ]
+    log.info(
+        "Player filtering complete.",
+        extra={
+            "initial_count": len(records),
+            "final_count": len(filtered),
+            "players_removed": len(records) - len(filtered),
+            "relevant_positions": list(relevant_positions),
+        },
+    )
+    return filtered
+
+
+def validate_players(records: list[dict]) -> tuple[list[PlayerRaw], list[dict]]:
+    """
+    Validates raw player dicts as one batch. Records that fail validation are
+    set aside and reported instead of aborting the whole batch.
+
+    Returns:
+        A tuple of (valid PlayerRaw models, report rows for invalid records).
+    """
+    try:
+        return PlayerRawList.validate_python(records), []
+    except ValidationError as e:
+        errors_by_record: dict[int, list[str]] = {}
+        for error in e.errors():
+            index, *field = error["loc"]
+            message = f"{'.'.join(map(str, field)) or 'record'}: {error['msg']}"
+            errors_by_record.setdefault(index, []).append(message)
+
+    invalid = [
+        {
+            "player_id": records[index].get("player_id"),
+            "name": f"{records[index].get('first_name')} {records[index].get('last_name')}",
+            "errors": messages,
+        }
+        for index, messages in errors_by_record.items()
+    ]
+    log.warning(
+        f"Skipped {len(invalid)} raw players that failed validation.",
+        extra={"invalid_count": len(invalid), "validated_count": len(records)},
+    )
+    valid = [r for i, r in enumerate(records) if i not in errors_by_record]
+    return PlayerRawList.validate_python(valid), invalid
+
+
+def prune_irrelevant_players(
+    players: list[PlayerRaw],
+    relevance: RelevanceSettings,
+    always_keep: set[str],
+) -> tuple[list[PlayerRaw], list[dict]]:
+    """
+    Drops practice-squad and deep depth-chart players who cannot matter for a
+    draft, using Sleeper's status, depth_chart_order and search_rank fields.
+    Missing fields never count against a player.
+
+    Args:
+        players: A list of PlayerRaw models (already filtered to rostered players).
+        relevance: The league's relevance settings.
+        always_keep: Slugs or Sleeper player_ids that must never be pruned.
+
+    Returns:
+        A tuple of (kept players, removed-player report rows with a 'reason').
+    """
+    if not relevance.enabled:
+        log.info("Relevance pruning is disabled. Keeping all rostered players.")
+        return players, []
+
+    excluded_statuses = set(relevance.excluded_statuses)
+    exempt_positions = set(relevance.exempt_positions)
+    max_depth = relevance.max_depth_chart_order
+    max_rank = relevance.max_search_rank
+
+    def prune_reason(player: PlayerRaw) -> str | None:
+        if player.status in excluded_statuses:
+            return f"status:{player.status}"
+        if player.position in exempt_positions:
+            return None
+        if (
+            max_depth is not None
+            and player.depth_chart_order is not None
+            and player.depth_chart_order > max_depth
+        ):
+            return "depth_chart_order"
+        if (
+            max_rank is not None
+            and player.search_rank is not None
+            and player.search_rank > max_rank
+        ):
+            return "search_rank"
+        return None
+
+    kept, removed = [], []
+    for player in players:
+        reason = prune_reason(player)
+        if reason is not None:
+            slug = slugify(f"{player.first_name} {player.last_name}")
+            if slug in always_keep or player.player_id in always_keep:
+                reason = None
+        if reason is None:
+            kept.append(player)
+            continue
+        removed.append(
+            {
+                "player_id": player.player_id,
+                "name": f"{player.first_name} {player.last_name}",
+                "position": player.position,
+                "team": player.team,
+                "status": player.status,
+                "depth_chart_order": player.depth_chart_order,
+                "search_rank": player.search_rank,
+                "reason": reason,
+            }
+        )
+
+    removed_by_reason = Counter(row["reason"] for row in removed)
+    log.info(
+        "Relevance pruning complete.",
+        extra={
+            "initial_count": len(players),
+            "final_count": len(kept),
+            "players_removed": len(removed),
+            "removed_by_reason": dict(removed_by_reason),
+            "removed_by_position": dict(Counter(row["position"] for row in removed)),
+        },
+    )
+    return kept, removed
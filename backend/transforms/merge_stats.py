@@ -2,9 +2,13 @@
 
 """Functions for merging external stats with player data."""
 
+import numpy as np
+import pandas as pd
+
 from backend.logging_config import log  # Corrected import path
 from backend.models import PlayerRaw, PlayerEnriched  # Corrected import path
-from backend.utils import slugify  # Corrected import path
+from backend.transforms.resolve_identity import PlayerIdentityResolver
+from backend.transforms.names import slugify_series
 
 
 def merge_external_data(
@@ -23,39 +27,41 @@ def merge_external_data(
     Returns:
         A new list of PlayerEnriched objects.
     """
-    enriched_players = []
-    adp_matches = 0
-    proj_matches = 0
-
-    for player in players:
-        # Create a consistent key for lookups from the player's full name.
-        player_slug = slugify(f"{player.first_name} {player.last_name}")
-
-        # Look up the player in the ADP map.
-        adp = adp_map.get(player_slug)
-        if adp is not None:
-            adp_matches += 1
-
-        # Look up the player in the projections map.
-        projection = projections_map.get(player_slug)
-        if projection is not None:
-            proj_matches += 1
-
-        # Create a new PlayerEnriched object, inheriting all fields from the
-        # base player and adding the new, enriched data.
-        enriched_player = PlayerEnriched(
+    canonical = pd.DataFrame(
+        [player.model_dump(exclude={"bye_week"}) for player in players],
+        columns=["player_id", "first_name", "last_name", "position", "team"],
+    )
+    # Create a consistent key for lookups from each player's full name.
+    canonical["slug"] = slugify_series(
+        canonical["first_name"] + " " + canonical["last_name"]
+    )
+    # Exact and alias matches only; fuzzy matching belongs to the pipelines.
+    resolver = PlayerIdentityResolver(canonical, score_cutoff=None)
+
+    adp_ids = resolver.resolve(list(adp_map), source_name="adp")
+    adp = resolver.align(adp_ids, list(adp_map.values()))
+    proj_ids = resolver.resolve(list(projections_map), source_name="projections")
+    projections = resolver.align(proj_ids, list(projections_map.values()))
+
+    # Create a new PlayerEnriched object, inheriting all fields from the
+    # base player and adding the new, enriched data.
+    enriched_players = [
+        PlayerEnriched(
             **player.model_dump(),  # Unpack all fields from the PlayerRaw object
-            adp=adp,
-            projected_points=projection,
+            adp=None if np.isnan(adp[i]) else float(adp[i]),
+            projected_points=(
+                None if np.isnan(projections[i]) else float(projections[i])
+            ),
         )
-        enriched_players.append(enriched_player)
+        for i, player in enumerate(players)
+    ]
 
     log.info(
         "External data merge complete.",
         extra={
             "total_players": len(players),
-            "adp_matches": adp_matches,
-            "projection_matches": proj_matches,
+            "adp_matches": int(np.count_nonzero(~np.isnan(adp))),
+            "projection_matches": int(np.count_nonzero(~np.isnan(projections))),
         },
     )
     return enriched_players
@@ -0,0 +1,139 @@
+# Path: ffbPlayerDraftingApp/backend/transforms/names.py
+
+"""
+Player-name normalization shared by every data source.
+
+Every public function takes and returns a whole pandas Series. Source tables
+repeat the same names many times (e.g. 17 weekly stat pages), so each column is
+factorized first and only its unique values are normalized, using C-level
+string methods (str.translate / split / rpartition) instead of two regex
+passes per row. The result is then broadcast back onto the column.
+"""
+
+import string
+from typing import Callable
+
+import pandas as pd
+
+from backend.constants import NAME_SUFFIXES, NFL_TEAM_CODES
+from backend.utils import slugify
+
+# One translate() pass does the work of slugify's two regexes for ASCII text:
+# lower-case letters, keep digits, turn whitespace/hyphens into spaces (split()
+# then collapses runs of them) and delete everything else.
+_SLUG_TABLE: dict[int, str | None] = {}
+for _code in range(128):
+    _char = chr(_code)
+    if _char in string.ascii_uppercase:
+        _SLUG_TABLE[_code] = _char.lower()
+    elif _char in string.ascii_lowercase or _char in string.digits:
+        continue
+    elif _char == "-" or _char in string.whitespace:
+        _SLUG_TABLE[_code] = " "
+    else:
+        _SLUG_TABLE[_code] = None
+
+# Stat pages flag players with "*" / "+" markers.
+_MARKERS = str.maketrans("", "", "*+")
+_SUFFIX_SET = frozenset(NAME_SUFFIXES)
+
+
+def _on_uniques(values: pd.Series, func: Callable[[str], str | None]) -> pd.Series:
+    """
+    Applies a string kernel to the unique non-null values of a column and
+    broadcasts the results back. Missing values map to func("").
+    """
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    normalized = [
+        func(value) if isinstance(value, str) else func("") for value in uniques
+    ]
+    missing = func("")
+    out = [normalized[code] if code >= 0 else missing for code in codes]
+    return pd.Series(out, index=values.index, dtype=object, name=values.name)
+
+
+def _slug(value: str) -> str:
+    if not value.isascii():
+        return slugify(value)
+    return "-".join(value.translate(_SLUG_TABLE).split())
+
+
+def _split_team(value: str) -> tuple[str, str | None]:
+    """'Josh Allen (BUF)*' -> ('Josh Allen', 'BUF'); no team code -> (value, None)."""
+    value = value.translate(_MARKERS).strip()
+    head, _, tail = value.rpartition(" ")
+    tail = tail.strip("()")
+    if head and tail in NFL_TEAM_CODES:
+        return head.rstrip(" -"), tail
+    return value, None
+
+
+def _name_key(slug: str) -> str:
+    head, _, tail = slug.rpartition("-")
+    if head and tail in _SUFFIX_SET:
+        slug = head
+    return slug.replace("-", "")
+
+
+def slugify_series(names: pd.Series) -> pd.Series:
+    """
+    Column-wise equivalent of utils.slugify: 'Ja'Marr Chase' -> 'jamarr-chase'.
+    Missing values become empty strings.
+    """
+    return _on_uniques(names, _slug)
+
+
+def strip_team_codes(names: pd.Series) -> pd.Series:
+    """Removes stat markers and a trailing NFL team code from raw names."""
+    return _on_uniques(names, lambda value: _split_team(value)[0])
+
+
+def extract_team_codes(names: pd.Series) -> pd.Series:
+    """Returns the trailing NFL team code of each raw name, or None."""
+    return _on_uniques(names, lambda value: _split_team(value)[1])
+
+
+def clean_source_names(names: pd.Series) -> pd.Series:
+    """
+    Turns raw names as printed by external sources ("Patrick Mahomes II KC",
+    "Aaron Jones Sr. (MIN)*") into slugs with the team code removed.
+    Generational suffixes are kept in the slug; name_keys() drops them.
+    """
+    return _on_uniques(names, lambda value: _slug(_split_team(value)[0]))
+
+
+def name_keys(slugs: pd.Series) -> pd.Series:
+    """
+    Builds separator- and suffix-free matching keys from slugs, e.g.
+    'patrick-mahomes-ii' and 'patrick-mahomes' both become 'patrickmahomes'.
+    This is the format of Sleeper's precomputed 'search_full_name'.
+    """
+    return _on_uniques(slugs, _name_key)
+
+
+def sleeper_name_keys(players: pd.DataFrame) -> pd.Series:
+    """
+    Matching keys for canonical Sleeper players. Sleeper already ships a
+    normalized 'search_full_name'; it is reused as-is unless the last name
+    carries a generational suffix, so only those rows are normalized here.
+    """
+    last_names = (
+        players["last_name"].astype(object).where(players["last_name"].notna(), "")
+    )
+    last_tokens = last_names.str.lower().str.rsplit(" ", n=1).str[-1].str.rstrip(".")
+    has_suffix = last_tokens.isin(_SUFFIX_SET) & last_names.str.contains(" ")
+    if "search_full_name" in players:
+        precomputed = players["search_full_name"].astype(object)
+    else:
+        precomputed = pd.Series(None, index=players.index, dtype=object)
+    needs_key = precomputed.isna() | (precomputed == "") | has_suffix
+
+    keys = precomputed.where(~needs_key, "").astype(object)
+    if needs_key.any():
+        full_names = (
+            players.loc[needs_key, "first_name"].astype(object).fillna("")
+            + " "
+            + last_names[needs_key]
+        )
+        keys[needs_key] = name_keys(slugify_series(full_names))
+    return keys
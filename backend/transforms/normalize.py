@@ -2,9 +2,57 @@
 
 """Functions for normalizing and scaling data using z-scores."""
 
+import numpy as np
 import pandas as pd
 
 
+def positional_z_scores(
+    values: np.ndarray, position_codes: np.ndarray, n_positions: int
+) -> np.ndarray:
+    """
+    Array version of calculate_z_scores: z-scores within each position group,
+    computed with bincount over integer position codes instead of a groupby.
+
+    Missing values, players without a position (code -1) and groups whose
+    sample standard deviation is zero or undefined all get a z-score of 0.
+
+    Args:
+        values: Shape (players,) or (scenarios, players); NaN marks missing.
+        position_codes: One integer code per player, as from pd.factorize.
+        n_positions: Number of distinct codes.
+
+    Returns:
+        An array of z-scores with the same shape as values.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n_players = values.shape[-1]
+    rows = values.reshape(-1, n_players)
+    n_rows = rows.shape[0]
+
+    # One bucket per (scenario, position) so a whole batch is one bincount.
+    has_position = position_codes >= 0
+    buckets = (
+        np.arange(n_rows)[:, None] * n_positions
+        + np.where(has_position, position_codes, 0)[None, :]
+    )
+    valid = ~np.isnan(rows) & has_position[None, :]
+    keys, x = buckets[valid], rows[valid]
+
+    n_buckets = n_rows * n_positions
+    counts = np.bincount(keys, minlength=n_buckets)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = np.bincount(keys, weights=x, minlength=n_buckets) / counts
+        deviations = x - means[keys]
+        sum_sq = np.bincount(keys, weights=deviations * deviations, minlength=n_buckets)
+        stds = np.sqrt(sum_sq / (counts - 1))
+
+    z_scores = np.zeros(rows.shape)
+    scored = np.flatnonzero(valid.ravel())
+    usable = stds[keys] > 0
+    z_scores.ravel()[scored[usable]] = deviations[usable] / stds[keys[usable]]
+    return z_scores.reshape(values.shape)
+
+
 def calculate_z_scores(df: pd.DataFrame, column_name: str) -> pd.Series:
     """
     Calculates the z-score for each value in a column, grouped by position.
@@ -20,11 +68,8 @@ def calculate_z_scores(df: pd.DataFrame, column_name: str) -> pd.Series:
     Returns:
         A pandas Series containing the positionally-normalized z-scores.
     """
-    # Use transform to apply the z-score calculation within each position group.
-    # The lambda function calculates the z-score for its subset (the series for one position).
-    z_scores = df.groupby("position")[column_name].transform(
-        lambda x: (x - x.mean()) / x.std() if x.std() > 0 else 0.0
+    codes, uniques = pd.factorize(df["position"])
+    z_scores = positional_z_scores(
+        df[column_name].to_numpy(dtype=np.float64), codes, len(uniques)
     )
-
-    # Fill any remaining NaNs (for players in groups with no data) with 0.
-    return z_scores.fillna(0.0)
+    return pd.Series(z_scores, index=df.index, name=column_name)
@@ -0,0 +1,378 @@
+# Path: ffbPlayerDraftingApp/backend/transforms/resolve_identity.py
+
+"""Resolves external player records to a single canonical Sleeper identity."""
+
+from collections import defaultdict
+from typing import Any, Sequence
+
+import numpy as np
+import pandas as pd
+from thefuzz import process
+
+from backend.constants import canonical_position
+from backend.logging_config import log
+from backend.transforms.names import name_keys, sleeper_name_keys
+from backend.utils import load_alias_map
+
+# Returned for any external record that could not be tied to a canonical player.
+UNRESOLVED = -1
+
+
+class PlayerIdentityResolver:
+    """
+    Assigns every external record (ADP row, projection row, weekly stat row) the
+    dense integer id of one canonical Sleeper player, exactly once.
+
+    The canonical players are the rows of the frame the resolver is built from;
+    a player's dense id is simply its row position, so resolved records can be
+    joined with plain integer indexing instead of string-keyed dict lookups.
+
+    Resolution runs through in-memory hash indexes in order of confidence:
+    1. Direct slug match.
+    2. Alias match via player_alias_map.json.
+    3. Name-key match: separator- and suffix-free keys (see transforms.names),
+       so 'patrick-mahomes-ii' finds 'patrick-mahomes' by rule, not by alias.
+    4. Fuzzy match (thefuzz) for canonical players still unclaimed, partitioned
+       by position and team so each search is small and cross-position
+       collisions (e.g. two 'josh-allen's) cannot happen.
+
+    A direct or name-key hit only counts when the player shares the record's
+    position or team (when the record carries either); otherwise the record
+    goes on to the partitioned fuzzy step, so a namesake at another position
+    and team (a KC running back 'mike-williams' vs the Jets receiver) is
+    never picked up by slug alone. Alias entries are explicit and may cross
+    positions (e.g. Taysom Hill). When a slug is shared by several canonical
+    players, position, team and Sleeper's search rank decide
+    deterministically which one a record is for.
+    """
+
+    def __init__(
+        self,
+        players: pd.DataFrame,
+        alias_map: dict[str, str] | None = None,
+        score_cutoff: int | None = 85,
+    ):
+        """
+        Args:
+            players: The canonical player frame. Must contain 'slug'; 'player_id',
+                     'position' and 'team' are used when present.
+            alias_map: Source slug -> canonical slug. Defaults to player_alias_map.json.
+            score_cutoff: Minimum fuzzy score to accept. None disables fuzzy matching.
+        """
+        n = len(players)
+        self.slugs = players["slug"].fillna("").to_numpy(dtype=object)
+        self.player_ids = (
+            players["player_id"].astype(str).to_numpy(dtype=object)
+            if "player_id" in players
+            else np.arange(n).astype(str).astype(object)
+        )
+        self.positions = _optional_column(players, "position", n)
+        self.teams = _optional_column(players, "team", n)
+        self.search_ranks = (
+            pd.to_numeric(players["search_rank"], errors="coerce")
+            .fillna(np.inf)
+            .to_numpy(dtype=np.float64)
+            if "search_rank" in players
+            else np.full(n, np.inf)
+        )
+        self.alias_map = load_alias_map() if alias_map is None else alias_map
+        self.score_cutoff = score_cutoff
+
+        if "first_name" in players and "last_name" in players:
+            keys = sleeper_name_keys(players)
+        else:
+            keys = name_keys(players["slug"].astype(object).fillna(""))
+        self.name_keys = keys.to_numpy(dtype=object)
+
+        # --- In-memory hash indexes ---
+        self.slug_index: dict[str, list[int]] = defaultdict(list)
+        self.key_index: dict[str, list[int]] = defaultdict(list)
+        self.team_pos_index: dict[tuple[str, str], list[int]] = defaultdict(list)
+        for idx, (slug, team, pos) in enumerate(
+            zip(self.slugs, self.teams, self.positions)
+        ):
+            if slug:
+                self.slug_index[slug].append(idx)
+            if self.name_keys[idx]:
+                self.key_index[self.name_keys[idx]].append(idx)
+            if team and pos:
+                self.team_pos_index[(team, pos)].append(idx)
+
+        # Fuzzy decisions are remembered so a source slug is only scored once,
+        # no matter how many sources carry it.
+        self._fuzzy_cache: dict[tuple[str, str | None], int] = {}
+
+        log.info(
+            "Built player identity resolver.",
+            extra={
+                "canonical_players": n,
+                "unique_slugs": len(self.slug_index),
+                "aliases": len(self.alias_map),
+            },
+        )
+
+    def __len__(self) -> int:
+        return len(self.slugs)
+
+    def resolve(
+        self,
+        source_slugs: Sequence[str],
+        teams: Sequence[str | None] | None = None,
+        positions: Sequence[str | None] | None = None,
+        source_name: str = "source",
+    ) -> np.ndarray:
+        """
+        Resolves a batch of external records to dense canonical ids.
+
+        Records that carry a position (projection and historical scrapes are
+        per-position, ADP rows carry one too) are matched within that
+        position's partition, and within their team first when a team is known.
+
+        Args:
+            source_slugs: One slug per external record.
+            teams: Optional team per record.
+            positions: Optional position per record (source labels such as
+                       'DST' are mapped onto Sleeper's vocabulary).
+            source_name: A label for log messages (e.g. 'adp', 'projections').
+
+        Returns:
+            An int64 array with one dense id per record, or UNRESOLVED (-1).
+        """
+        n_records = len(source_slugs)
+        ids = np.full(n_records, UNRESOLVED, dtype=np.int64)
+        teams = list(teams) if teams is not None else [None] * n_records
+        positions = (
+            [canonical_position(p) for p in positions]
+            if positions is not None
+            else [None] * n_records
+        )
+        teams = [t if isinstance(t, str) and t else None for t in teams]
+
+        source_keys = name_keys(pd.Series(list(source_slugs), dtype=object)).tolist()
+
+        # --- Step 1: Direct, Alias and Name-Key Matching ---
+        matched = {"direct": 0, "alias": 0, "name_key": 0}
+        off_partition = 0
+        exact_hit = np.zeros(n_records, dtype=bool)
+        for i, (slug, key, team, pos) in enumerate(
+            zip(source_slugs, source_keys, teams, positions)
+        ):
+            if slug in self.slug_index:
+                candidates, kind = self.slug_index[slug], "direct"
+            elif (alias := self.alias_map.get(slug)) and alias in self.slug_index:
+                candidates, kind = self.slug_index[alias], "alias"
+            elif key and key in self.key_index:
+                candidates, kind = self.key_index[key], "name_key"
+            else:
+                continue
+            if kind != "alias":
+                candidates = self._same_partition(candidates, team, pos)
+                if not candidates:
+                    # A namesake elsewhere; let the fuzzy step search the
+                    # record's own partition instead.
+                    off_partition += 1
+                    continue
+            matched[kind] += 1
+            exact_hit[i] = True
+            ids[i] = self._pick(candidates, team, pos)
+
+        superseded = self._drop_off_position_claims(ids, positions)
+
+        log.info(
+            f"Resolved {sum(matched.values())} {source_name} records using direct matches, aliases and name keys.",
+            extra={
+                **matched,
+                "off_partition": off_partition,
+                "superseded": superseded,
+                "records": n_records,
+            },
+        )
+
+        # --- Step 2: Fuzzy Matching for the Remainder ---
+        if self.score_cutoff is not None:
+            self._resolve_fuzzy(
+                source_slugs, teams, positions, ids, exact_hit, source_name
+            )
+
+        log.info(
+            f"Total {source_name} records resolved: {int((ids != UNRESOLVED).sum())}/{n_records}"
+        )
+        return ids
+
+    def align(
+        self, ids: np.ndarray, values: Sequence[Any], fill: Any = np.nan
+    ) -> np.ndarray:
+        """
+        Scatters per-record values onto canonical rows using resolved ids.
+        Later records win when several resolve to the same player.
+
+        Args:
+            ids: The output of resolve() for the same records.
+            values: One value per record.
+            fill: The value for canonical players no record resolved to. Pass
+                  None to align arbitrary Python objects (e.g. score lists).
+
+        Returns:
+            An array with one entry per canonical player.
+        """
+        hit = ids != UNRESOLVED
+        if fill is None:
+            out = np.full(len(self), None, dtype=object)
+            source = np.empty(len(values), dtype=object)
+            for i, value in enumerate(values):
+                source[i] = value
+        else:
+            out = np.full(len(self), fill, dtype=np.float64)
+            source = np.asarray(values, dtype=np.float64)
+        out[ids[hit]] = source[hit]
+        return out
+
+    def _same_partition(
+        self, candidates: list[int], team: str | None, pos: str | None
+    ) -> list[int]:
+        """The candidates sharing the record's position or team, if it has either."""
+        if not team and not pos:
+            return candidates
+        return [
+            i
+            for i in candidates
+            if (pos and self.positions[i] == pos) or (team and self.teams[i] == team)
+        ]
+
+    def _pick(self, candidates: list[int], team: str | None, pos: str | None) -> int:
+        """
+        Chooses deterministically among canonical players sharing a slug:
+        same position first, then same team, then Sleeper's search rank.
+        """
+        if len(candidates) == 1:
+            return candidates[0]
+        if team and pos:
+            same_team_pos = set(self.team_pos_index.get((team, pos), ()))
+            candidates = [i for i in candidates if i in same_team_pos] or candidates
+        if pos and len(candidates) > 1:
+            candidates = [
+                i for i in candidates if self.positions[i] == pos
+            ] or candidates
+        if team and len(candidates) > 1:
+            candidates = [i for i in candidates if self.teams[i] == team] or candidates
+        return min(candidates, key=lambda i: (self.search_ranks[i], i))
+
+    def _drop_off_position_claims(
+        self, ids: np.ndarray, positions: list[str | None]
+    ) -> int:
+        """
+        When several records claim one player (e.g. a player listed in both the
+        QB and TE scrapes), keeps only the claims whose position agrees with
+        the player's Sleeper position so the wrong table's stats can't win.
+        """
+        on_position: set[int] = set()
+        for i, pos in enumerate(positions):
+            idx = ids[i]
+            if idx != UNRESOLVED and pos and self.positions[idx] == pos:
+                on_position.add(int(idx))
+
+        superseded = 0
+        for i, pos in enumerate(positions):
+            idx = ids[i]
+            if idx in on_position and pos and self.positions[idx] != pos:
+                ids[i] = UNRESOLVED
+                superseded += 1
+        return superseded
+
+    def _resolve_fuzzy(
+        self,
+        source_slugs: Sequence[str],
+        teams: list[str | None],
+        positions: list[str | None],
+        ids: np.ndarray,
+        exact_hit: np.ndarray,
+        source_name: str,
+    ) -> None:
+        claimed = set(ids[ids != UNRESOLVED].tolist())
+
+        # Partition the unresolved records. A record with a position can only
+        # match a player at that position; one without can match anyone.
+        pools: dict[tuple, dict[str, int]] = defaultdict(dict)
+        remaining = 0
+        for i, slug in enumerate(source_slugs):
+            if ids[i] != UNRESOLVED or exact_hit[i] or not slug:
+                continue
+            pos, team = positions[i], teams[i]
+
+            # Reuse decisions made for earlier sources before scoring anything.
+            cached = self._fuzzy_cache.get((slug, pos))
+            if cached is not None and cached not in claimed:
+                ids[i] = cached
+                claimed.add(cached)
+                continue
+
+            for key in _partition_keys(team, pos):
+                pools[key][slug] = i
+            remaining += 1
+
+        unmatched_canonical = [
+            idx for idx, slug in enumerate(self.slugs) if slug and idx not in claimed
+        ]
+        if not unmatched_canonical or not remaining:
+            log.info("No remaining players to fuzzy match.")
+            return
+
+        log.info(
+            f"Attempting to fuzzy match {len(unmatched_canonical)} remaining canonical players against {remaining} {source_name} slugs.",
+            extra={"partitions": len(pools)},
+        )
+        fuzzy_match_count = 0
+        for idx in unmatched_canonical:
+            canon_slug = self.slugs[idx]
+            canon_pos, canon_team = self.positions[idx], self.teams[idx]
+            # Search the smallest partition first: same team and position, then
+            # same position, then records that carry no position at all.
+            search_order = (
+                ("team", canon_team, canon_pos),
+                ("pos", canon_pos),
+                ("any",),
+            )
+            for key in search_order:
+                pool = pools.get(key)
+                if not pool:
+                    continue
+                match = process.extractOne(
+                    canon_slug, list(pool), score_cutoff=self.score_cutoff
+                )
+                if not match:
+                    continue
+
+                matched_source_slug, match_score = match[0], match[1]
+                log.info(
+                    "Fuzzy match found.",
+                    extra={
+                        "canonical_slug": canon_slug,
+                        "matched_source_slug": matched_source_slug,
+                        "score": match_score,
+                        "partition": "/".join(str(k) for k in key),
+                    },
+                )
+                record = pool[matched_source_slug]
+                ids[record] = idx
+                self._fuzzy_cache[(matched_source_slug, positions[record])] = idx
+                for stale_key in _partition_keys(teams[record], positions[record]):
+                    pools[stale_key].pop(matched_source_slug, None)
+                fuzzy_match_count += 1
+                break
+
+        log.info(f"Found {fuzzy_match_count} fuzzy matches.")
+
+
+def _partition_keys(team: str | None, pos: str | None) -> list[tuple]:
+    """The fuzzy-matching partitions a record with this team/position lives in."""
+    if not pos:
+        return [("any",)]
+    if team:
+        return [("team", team, pos), ("pos", pos)]
+    return [("pos", pos)]
+
+
+def _optional_column(players: pd.DataFrame, column: str, n: int) -> np.ndarray:
+    if column not in players:
+        return np.full(n, None, dtype=object)
+    return players[column].where(players[column].notna(), None).to_numpy(dtype=object)
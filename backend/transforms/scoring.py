@@ -0,0 +1,119 @@
+# Path: ffbPlayerDraftingApp/backend/transforms/scoring.py
+
+"""
+The stats-phase scoring kernel: per-position z-scores, scaling and the
+veteran/rookie/history-only blend over plain NumPy arrays.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+from backend.transforms.normalize import positional_z_scores
+
+# The best player's scaled z-score in each data source.
+SCALE_TARGET = 25.0
+
+
+class PlayerScores(NamedTuple):
+    z_proj: np.ndarray
+    z_hist: np.ndarray
+    scaled_hist: np.ndarray
+    scaled_proj: np.ndarray
+    score: np.ndarray
+    z_floor: np.ndarray | None = None
+    scaled_floor: np.ndarray | None = None
+
+
+def scale_to_target(z_scores: np.ndarray) -> np.ndarray:
+    """Scales z-scores so the largest one becomes SCALE_TARGET (0 if none is positive)."""
+    top = z_scores.max(axis=-1, keepdims=True)
+    with np.errstate(divide="ignore"):
+        factor = np.where(top > 0, SCALE_TARGET / top, 0.0)
+    return z_scores * factor
+
+
+def blend_scores(
+    scaled_proj: np.ndarray,
+    scaled_hist: np.ndarray,
+    has_proj: np.ndarray,
+    has_hist: np.ndarray,
+    weight_projection: float | np.ndarray,
+    weight_last_year: float | np.ndarray,
+    scaled_floor: np.ndarray | None = None,
+    weight_floor: float | np.ndarray = 0.0,
+) -> np.ndarray:
+    """
+    Blends the scaled scores. Veterans (both sources) get the weighted sum,
+    plus their weighted weekly floor when one is given; rookies get their
+    projection only, history-only players their history, and players with
+    neither a score of 0.
+
+    The weights broadcast against the player axis, so passing arrays of shape
+    (settings, 1) scores every weight combination in one call.
+    """
+    weight_projection = np.asarray(weight_projection, dtype=np.float64)
+    weight_last_year = np.asarray(weight_last_year, dtype=np.float64)
+    veteran = scaled_proj * weight_projection + scaled_hist * weight_last_year
+    if scaled_floor is not None:
+        veteran = veteran + scaled_floor * np.asarray(weight_floor, dtype=np.float64)
+    single_source = np.where(
+        has_proj, scaled_proj, np.where(has_hist, scaled_hist, 0.0)
+    )
+    return np.where(has_proj & has_hist, veteran, single_source)
+
+
+def score_players(
+    projected_ppg: np.ndarray,
+    top_n_avg: np.ndarray,
+    position_codes: np.ndarray,
+    n_positions: int,
+    weight_projection: float | np.ndarray,
+    weight_last_year: float | np.ndarray,
+    floor_ppg: np.ndarray | None = None,
+    weight_floor: float | np.ndarray = 0.0,
+) -> PlayerScores:
+    """
+    Runs the full scoring chain (Scale First, Then Blend) on contiguous arrays.
+
+    Args:
+        projected_ppg: Projected points per game, NaN when there is no projection.
+        top_n_avg: Historical top-N average, NaN when there is no history.
+                   Both may be (players,) or (scenarios, players).
+        position_codes: One integer code per player, as from pd.factorize.
+        n_positions: Number of distinct codes.
+        weight_projection: Weight of the projection for veterans.
+        weight_last_year: Weight of last season for veterans.
+        floor_ppg: Weekly floor (p10 of last season's weeks), NaN without
+                   history. When given, it is z-scored and scaled like the
+                   other sources and blended in for veterans.
+        weight_floor: Weight of the weekly floor for veterans.
+
+    Returns:
+        The intermediate and final arrays, named as the stats phase's columns.
+    """
+    projected_ppg = np.asarray(projected_ppg, dtype=np.float64)
+    top_n_avg = np.asarray(top_n_avg, dtype=np.float64)
+
+    z_proj = positional_z_scores(projected_ppg, position_codes, n_positions)
+    z_hist = positional_z_scores(top_n_avg, position_codes, n_positions)
+    scaled_proj = scale_to_target(z_proj)
+    scaled_hist = scale_to_target(z_hist)
+    z_floor = scaled_floor = None
+    if floor_ppg is not None:
+        floor_ppg = np.asarray(floor_ppg, dtype=np.float64)
+        z_floor = positional_z_scores(floor_ppg, position_codes, n_positions)
+        scaled_floor = scale_to_target(z_floor)
+    score = blend_scores(
+        scaled_proj,
+        scaled_hist,
+        ~np.isnan(projected_ppg),
+        ~np.isnan(top_n_avg),
+        weight_projection,
+        weight_last_year,
+        scaled_floor,
+        weight_floor,
+    )
+    return PlayerScores(
+        z_proj, z_hist, scaled_hist, scaled_proj, score, z_floor, scaled_floor
+    )
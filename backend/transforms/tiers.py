@@ -0,0 +1,135 @@
+# Path: ffbPlayerDraftingApp/backend/transforms/tiers.py
+
+"""
+Optimal 1-D tiering of a ranked list, e.g. one position's VOR.
+
+Tiers are the partition of the sorted values into contiguous groups with the
+least total within-tier squared deviation (1-D k-means, which Jenks natural
+breaks also optimizes). The dynamic program is exact. Each layer adds one
+tier: the best cost of the first j values in k tiers is the best cost of a
+shorter prefix in k - 1 tiers plus the cost of one more tier. The best start
+of the last tier never moves left as j grows, so each layer is filled by
+divide and conquer in O(n log n), and every segment cost is O(1) from prefix
+sums. That makes the whole search O(k n log n).
+
+The tier count is chosen automatically as the smallest one whose goodness of
+variance fit (the share of the total squared deviation explained by the
+tiers) reaches TARGET_GVF, capped at MAX_TIERS.
+"""
+
+import numpy as np
+
+MAX_TIERS = 15
+TARGET_GVF = 0.99
+
+
+class _SegmentCost:
+    """Within-segment sums of squared deviation of sorted values, from prefix sums."""
+
+    def __init__(self, values: np.ndarray):
+        self.sums = np.concatenate([[0.0], np.cumsum(values)])
+        self.squares = np.concatenate([[0.0], np.cumsum(values * values)])
+
+    def __call__(self, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        """The cost of values[start:end + 1] for every (start, end) pair."""
+        count = ends + 1 - starts
+        total = self.sums[ends + 1] - self.sums[starts]
+        cost = self.squares[ends + 1] - self.squares[starts] - total * total / count
+        return np.maximum(cost, 0.0)
+
+
+def tier_costs(values: np.ndarray, max_tiers: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    The optimal-tiering dynamic program over sorted values.
+
+    Each layer's divide and conquer is run breadth first: every pending
+    range of ends at one recursion depth is solved in a single vectorized
+    step, so a layer takes O(log n) array operations.
+
+    Args:
+        values: Values sorted in either direction.
+        max_tiers: The largest tier count to solve for.
+
+    Returns:
+        'cost' and 'start', both (max_tiers, n): cost[k, j] is the least
+        squared deviation of values[:j + 1] in k + 1 tiers, and start[k, j]
+        the index where the last of those tiers begins (-1 where j < k).
+    """
+    n = len(values)
+    segment = _SegmentCost(np.asarray(values, dtype=np.float64))
+    cost = np.full((max_tiers, n), np.inf)
+    start = np.full((max_tiers, n), -1, dtype=np.int64)
+    cost[0] = segment(np.zeros(n, dtype=np.int64), np.arange(n))
+    start[0] = 0
+    for k in range(1, min(max_tiers, n)):
+        # Pending ranges: ends lo..hi, whose best starts lie in first..last.
+        lo, hi = np.array([k]), np.array([n - 1])
+        first, last = np.array([k]), np.array([n - 1])
+        while len(lo):
+            end = (lo + hi) // 2
+            lengths = np.minimum(last, end) - first + 1
+            offsets = np.cumsum(lengths) - lengths
+            task = np.repeat(np.arange(len(lo)), lengths)
+            starts = first[task] + np.arange(lengths.sum()) - offsets[task]
+            candidates = cost[k - 1, starts - 1] + segment(starts, end[task])
+            # The first minimum of each task's candidates.
+            minima = np.minimum.reduceat(candidates, offsets)
+            hits = np.flatnonzero(candidates == minima[task])
+            hits = hits[np.r_[True, task[hits[1:]] != task[hits[:-1]]]]
+            best = starts[hits]
+            cost[k, end] = candidates[hits]
+            start[k, end] = best
+
+            lo, hi = np.concatenate([lo, end + 1]), np.concatenate([end - 1, hi])
+            first = np.concatenate([first, best])
+            last = np.concatenate([best, last])
+            pending = lo <= hi
+            lo, hi, first, last = (
+                lo[pending],
+                hi[pending],
+                first[pending],
+                last[pending],
+            )
+    return cost, start
+
+
+def optimal_tiers(
+    values, n_tiers: int | None = None, max_tiers: int = MAX_TIERS
+) -> np.ndarray:
+    """
+    Tier numbers for a list of values, 1 for the highest tier.
+
+    Args:
+        values: The values to tier, in any order; NaN values get tier 0.
+        n_tiers: A fixed tier count; by default the smallest count reaching
+            TARGET_GVF, up to max_tiers.
+        max_tiers: The largest tier count considered automatically.
+
+    Returns:
+        An integer array of tier numbers in the input order.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    tiers = np.zeros(len(values), dtype=np.int64)
+    valid = np.flatnonzero(~np.isnan(values))
+    if not len(valid):
+        return tiers
+    order = valid[np.argsort(-values[valid], kind="stable")]
+    ranked = values[order]
+
+    distinct = len(np.unique(ranked))
+    limit = min(n_tiers or max_tiers, distinct)
+    cost, start = tier_costs(ranked, limit)
+    if n_tiers is None:
+        total = cost[0, -1]
+        fit = 1.0 - cost[:, -1] / total if total > 0 else np.ones(limit)
+        reached = np.flatnonzero(fit >= TARGET_GVF)
+        limit = int(reached[0]) + 1 if len(reached) else limit
+
+    labels = np.empty(len(ranked), dtype=np.int64)
+    end = len(ranked) - 1
+    for k in range(limit - 1, -1, -1):
+        first = start[k, end]
+        labels[first : end + 1] = k + 1
+        end = first - 1
+    tiers[order] = labels
+    return tiers
@@ -20,11 +20,8 @@ def slugify(text: str) -> str:
     return text
 
 
-def create_hybrid_slug_map(
-    source_data: dict[str, V],
-    canonical_slugs: list[str],
-    score_cutoff: int = 85,
-) -> dict[str, V]:
+def load_alias_map() -> dict[str, str]:
+    """Loads player_alias_map.json, returning an empty map if it is missing."""
     alias_map_path = settings.BASE_DIR / "player_alias_map.json"
     try:
         with open(alias_map_path, "r") as f:
@@ -35,6 +32,15 @@ def create_hybrid_slug_map(
             "player_alias_map.json not found or is invalid. Proceeding without aliases."
         )
         alias_map = {}
+    return alias_map
+
+
+def create_hybrid_slug_map(
+    source_data: dict[str, V],
+    canonical_slugs: list[str],
+    score_cutoff: int = 85,
+) -> dict[str, V]:
+    alias_map = load_alias_map()
 
     final_map: dict[str, V] = {}
     source_slugs_to_match = list(source_data.keys())
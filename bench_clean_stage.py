@@ -0,0 +1,98 @@
+import random
+import sys
+import time
+
+from backend.models import PlayerRaw, PlayerRawList
+from backend.transforms.filter_players import (
+    keep_rostered_and_relevant,
+    keep_rostered_and_relevant_records,
+    validate_players,
+)
+
+# --- Configuration ---
+# Sleeper's full dump is ~11k players, most of them free agents, retired
+# players or positions the league does not roster.
+N_PLAYERS = 11_000
+REPEATS = 5
+RELEVANT_POSITIONS = {"QB", "RB", "WR", "TE", "K", "DEF"}
+ALL_POSITIONS = ["QB", "RB", "WR", "TE", "K", "DEF", "OL", "DL", "LB", "DB", "LS", "P"]
+TEAMS = ["ARI", "BUF", "CIN", "DAL", "DET", "KC", "MIN", "PHI", "SF", "TB"]
+
+
+def make_raw_players(seed: int = 9) -> dict[str, dict]:
+    rng = random.Random(seed)
+    raw = {}
+    for i in range(N_PLAYERS):
+        raw[str(i)] = {
+            "player_id": str(i),
+            "first_name": f"First{i}",
+            "last_name": f"Last{i}",
+            "position": rng.choice(ALL_POSITIONS),
+            "team": rng.choice(TEAMS) if rng.random() < 0.4 else None,
+            "status": rng.choice(["Active", "Inactive", "Practice Squad"]),
+            "depth_chart_order": rng.choice([1, 2, 3, 4, None]),
+            "search_rank": rng.randint(1, 9_999_999),
+            "fantasy_data_tms_bye_week": rng.choice([5, 7, 9, 14, None]),
+            # Sleeper ships dozens of fields the models ignore.
+            **{f"extra_field_{k}": rng.random() for k in range(20)},
+        }
+    return raw
+
+
+def clean_before(raw: dict[str, dict]) -> list[dict]:
+    """The pre-existing path: a model per raw player, filter, dump each survivor."""
+    players = [PlayerRaw(**p) for p in raw.values()]
+    rostered = keep_rostered_and_relevant(players, RELEVANT_POSITIONS)
+    return [player.model_dump(by_alias=True) for player in rostered]
+
+
+def clean_after(raw: dict[str, dict]) -> list[dict]:
+    """Filter the raw dicts first, then validate and dump the survivors in batches."""
+    records = keep_rostered_and_relevant_records(raw.values(), RELEVANT_POSITIONS)
+    players, _ = validate_players(records)
+    return PlayerRawList.dump_python(players, by_alias=True)
+
+
+def best_of(func, raw) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func(raw)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    print("--- Clean Stage Benchmark: before vs after ---")
+    raw = make_raw_players()
+
+    # --- Correctness: identical output on valid data ---
+    if clean_before(raw) != clean_after(raw):
+        print("FATAL: the fast path produced different players.", file=sys.stderr)
+        sys.exit(1)
+    print(f"Both paths keep the same {len(clean_after(raw)):,} players. ✔️")
+
+    # --- Invalid records are reported, not fatal ---
+    broken = dict(raw)
+    rostered_ids = [r["player_id"] for r in clean_after(raw)[:3]]
+    for player_id in rostered_ids:
+        broken[player_id] = {**raw[player_id], "first_name": None}
+    players, invalid = validate_players(
+        keep_rostered_and_relevant_records(broken.values(), RELEVANT_POSITIONS)
+    )
+    if len(invalid) != len(rostered_ids):
+        print("FATAL: invalid records were not reported.", file=sys.stderr)
+        sys.exit(1)
+    print(f"{len(invalid)} invalid records reported, {len(players):,} kept. ✔️\n")
+
+    before = best_of(clean_before, raw)
+    after = best_of(clean_after, raw)
+    print(f"{'raw players':>12} {'before (ms)':>12} {'after (ms)':>11} {'speedup':>8}")
+    print(
+        f"{N_PLAYERS:>12,} {before * 1e3:>12.1f} {after * 1e3:>11.1f} {before / after:>7.1f}x"
+    )
+    print("\n--- Benchmark Complete ---")
+
+
+if __name__ == "__main__":
+    main()
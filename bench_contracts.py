@@ -0,0 +1,123 @@
+import random
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from backend.contracts import (
+    ENRICHED_PLAYERS,
+    FINAL_PLAYERS,
+    PLAYERS_WITH_PPG,
+    ROSTER_PLAYERS,
+    ContractViolation,
+)
+from backend.models import PlayerWithPPG
+
+# --- Configuration ---
+# The clean phase keeps about Sleeper's full dump; the board is much shorter.
+N_PLAYERS = 11_000
+N_BOARD = 1_000
+REPEATS = 5
+POSITIONS = ["QB", "RB", "WR", "TE", "K", "DEF"]
+TEAMS = ["ARI", "BUF", "CIN", "DAL", "DET", "KC", "MIN", "PHI", "SF", "TB"]
+
+
+def make_players(seed: int = 5) -> pd.DataFrame:
+    """A players_with_ppg-shaped frame, which also satisfies the earlier stages."""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(N_PLAYERS):
+        rows.append(
+            {
+                "player_id": str(i),
+                "first_name": f"First{i}",
+                "last_name": f"Last{i}",
+                "position": rng.choice(POSITIONS),
+                "team": rng.choice(TEAMS),
+                "slug": f"first{i}-last{i}",
+                "adp": round(rng.uniform(1, 300), 1) if rng.random() < 0.3 else None,
+                "bye_week": rng.choice([5, 7, 9, 14, None]),
+                "projected_points": round(rng.uniform(0, 350), 1),
+                "top_n_avg": round(rng.uniform(0, 30), 2)
+                if rng.random() < 0.6
+                else None,
+                "expected_ppg": round(rng.uniform(0, 25), 2),
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+def make_board(players: pd.DataFrame) -> pd.DataFrame:
+    board = players.dropna(subset=["adp"]).head(N_BOARD)
+    return pd.DataFrame(
+        {
+            "id": np.arange(1, len(board) + 1),
+            "name": board["first_name"] + " " + board["last_name"],
+            "team": board["team"],
+            "position": board["position"],
+            "adp": board["adp"],
+            "vor": board["expected_ppg"] - 8.0,
+            "bye": board["bye_week"].astype("Int64"),
+            "ppg": board["expected_ppg"],
+        }
+    )
+
+
+def best_of(func) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    print("--- Frame Contracts: cost per stage boundary ---")
+    players = make_players()
+    board = make_board(players)
+
+    # --- Correctness: clean frames pass, a broken one names its column ---
+    checks = [
+        ("roster_players", ROSTER_PLAYERS, players),
+        ("players_enriched", ENRICHED_PLAYERS, players),
+        ("players_with_ppg", PLAYERS_WITH_PPG, players),
+        ("players_final", FINAL_PLAYERS, board),
+    ]
+    for _, contract, frame in checks:
+        contract.check(frame)
+    broken = players.copy()
+    broken.loc[3, "bye_week"] = 40
+    try:
+        ENRICHED_PLAYERS.check(broken)
+    except ContractViolation as e:
+        if "'bye_week'" not in str(e):
+            print(f"FATAL: the violation misses its column: {e}", file=sys.stderr)
+            sys.exit(1)
+    else:
+        print("FATAL: an out-of-range bye week passed.", file=sys.stderr)
+        sys.exit(1)
+    print("Every stage's frame passes and a bad bye week is reported. ✔️\n")
+
+    # --- Throughput: one check per stage boundary ---
+    print(f"{'contract':<18} {'rows':>7} {'columns':>8} {'ms':>8} {'ms/1k rows':>11}")
+    for label, contract, frame in checks:
+        elapsed = best_of(lambda c=contract, f=frame: c.check(f))
+        print(
+            f"{label:<18} {len(frame):>7,} {len(contract.columns):>8} "
+            f"{elapsed * 1e3:>8.2f} {elapsed * 1e3 / len(frame) * 1e3:>11.3f}"
+        )
+
+    # For scale: validating every row through the models instead.
+    records = players.replace({np.nan: None}).to_dict(orient="records")
+    elapsed = best_of(lambda: [PlayerWithPPG.model_validate(r) for r in records])
+    print(
+        f"{'(per-row models)':<18} {len(records):>7,} {'':>8} "
+        f"{elapsed * 1e3:>8.2f} {elapsed * 1e3 / len(records) * 1e3:>11.3f}"
+    )
+    print("\n--- Benchmark Complete ---")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+import json
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+# --- Configuration ---
+# Each engine runs in its own process so peak memory is measured separately.
+N_PLAYERS = 20_000
+LEAGUE_CONFIG_FILES = sorted(Path("backend").glob("league_config*.json"))
+DATE = "2025-08-20"
+POSITIONS = ["QB", "RB", "WR", "TE", "K", "DEF"]
+TEAMS = ["ARI", "BUF", "CIN", "DAL", "DET", "KC", "MIN", "PHI", "SF", "TB"]
+
+
+def make_sources(seed: int = 11):
+    """A roster_players.json plus ADP, projection and weekly-score source frames."""
+    rng = random.Random(seed)
+    roster, adp, projections, history = [], [], [], []
+    for i in range(N_PLAYERS):
+        position, team = rng.choice(POSITIONS), rng.choice(TEAMS)
+        first, last = f"First{i}", f"Last{i}"
+        roster.append(
+            {
+                "player_id": str(i),
+                "first_name": first,
+                "last_name": last,
+                "position": position,
+                "team": team,
+                "status": "Active",
+                "search_rank": rng.randint(1, 5_000),
+                "fantasy_data_tms_bye_week": rng.randint(5, 14),
+            }
+        )
+        slug = f"first{i}-last{i}"
+        if rng.random() < 0.5:
+            adp_value = round(rng.uniform(1, 300), 1)
+            adp.append((slug, adp_value, rng.randint(5, 14), team, position))
+        if rng.random() < 0.6:
+            projections.append((slug, round(rng.uniform(5, 350), 1), team, position))
+        if rng.random() < 0.6:
+            weeks = [
+                round(rng.uniform(0, 35), 1) if rng.random() < 0.8 else None
+                for _ in range(17)
+            ]
+            history.append((slug, position, team, weeks))
+    return (
+        roster,
+        pd.DataFrame(
+            adp, columns=["player_slug", "adp", "bye_week", "team", "position"]
+        ),
+        pd.DataFrame(
+            projections, columns=["player_slug", "projection_fpts", "team", "position"]
+        ),
+        pd.DataFrame(history, columns=["slug", "position", "team", "scores"]),
+    )
+
+
+def run_child(engine: str, data_dir: str, config_path: str, flex: int) -> None:
+    """Runs enrich -> stats -> VOR with one engine and prints timings as JSON."""
+    import logging
+
+    import backend.pipelines.stats as pandas_stats
+    from backend.data_sources import fantasypros, historical
+    from backend.logging_config import log
+    from backend.settings import LeagueConfig, settings
+
+    log.setLevel(logging.ERROR)
+    settings.DATA_DIR = Path(data_dir)
+    config = json.loads(Path(config_path).read_text())
+    config["roster"]["FLEX"] = flex
+    settings.league_config = LeagueConfig(**config)
+
+    roster, adp, projections, history = make_sources()
+    (settings.DATA_DIR / DATE).mkdir(parents=True, exist_ok=True)
+    (settings.DATA_DIR / DATE / "roster_players.json").write_text(json.dumps(roster))
+    fantasypros.fetch_adp_records = lambda: adp
+    fantasypros.fetch_all_projections = lambda: projections
+    historical.fetch_last_year_weekly_records = lambda: history
+    pandas_stats.fetch_last_year_weekly_records = lambda: history
+
+    if engine == "polars":
+        from backend.pipelines import polars_engine
+
+        stages = {
+            "enrich": polars_engine.run_enrich,
+            "stats": polars_engine.run_stats,
+            "vor": polars_engine.run_vor,
+        }
+    else:
+        from backend.pipelines.enrich import run_enrich
+        from backend.pipelines.vor import run_vor
+
+        stages = {"enrich": run_enrich, "stats": pandas_stats.run_stats, "vor": run_vor}
+
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    timings = {}
+    for name, run_stage in stages.items():
+        start = time.perf_counter()
+        run_stage(DATE)
+        timings[name] = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"timings": timings, "peak_growth_mb": (peak - baseline) / 1024}))
+
+
+def run_engine(engine: str, config_path: Path, flex: int) -> tuple[dict, list]:
+    with tempfile.TemporaryDirectory() as data_dir:
+        output = subprocess.run(
+            [sys.executable, __file__, "--child", engine, data_dir, str(config_path)]
+            + [str(flex)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        final = json.loads((Path(data_dir) / DATE / "players_final.json").read_text())
+    return json.loads(output.strip().splitlines()[-1]), final
+
+
+def main():
+    print("--- Pipeline Engines: pandas vs polars (enrich -> stats -> VOR) ---")
+    print(f"{N_PLAYERS:,} roster players, one process per engine run.\n")
+    print(
+        f"{'league config':<34} {'engine':<7} {'enrich':>8} {'stats':>8} {'vor':>8}"
+        f" {'total (s)':>10} {'peak +MB':>9}"
+    )
+    for config_path in LEAGUE_CONFIG_FILES:
+        for flex in (0, 2):
+            label = f"{config_path.stem}{' +2 FLEX' if flex else ''}"
+            try:
+                results = {
+                    engine: run_engine(engine, config_path, flex)
+                    for engine in ("pandas", "polars")
+                }
+            except subprocess.CalledProcessError:
+                print(f"{label:<34} skipped: the league config does not validate")
+                continue
+            if results["pandas"][1] != results["polars"][1]:
+                print(
+                    f"FATAL: players_final.json differs for {label}.", file=sys.stderr
+                )
+                sys.exit(1)
+            for engine, (stats, _) in results.items():
+                t = stats["timings"]
+                print(
+                    f"{label:<34} {engine:<7} {t['enrich']:>8.3f} {t['stats']:>8.3f}"
+                    f" {t['vor']:>8.3f} {sum(t.values()):>10.3f}"
+                    f" {stats['peak_growth_mb']:>9.1f}"
+                )
+    print("\nplayers_final.json is identical for both engines in every config. ✔️")
+    print("\n--- Benchmark Complete ---")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        run_child(sys.argv[2], sys.argv[3], sys.argv[4], int(sys.argv[5]))
+    else:
+        main()
@@ -0,0 +1,93 @@
+import random
+import sys
+import time
+
+import pandas as pd
+
+from backend.transforms.names import clean_source_names, slugify_series
+from backend.utils import slugify
+
+# --- Configuration ---
+# Pool sizes roughly matching one ADP page, one season of projections, and a
+# full season of weekly stat pages (every name repeated once per week).
+POOL_SIZES = [300, 3_000, 30_000]
+WEEKS = 17
+REPEATS = 5
+
+FIRST = ["Ja'Marr", "Patrick", "Amon-Ra", "Kenneth", "D.J.", "Aaron", "Michael"]
+LAST = [
+    "Chase",
+    "Mahomes II",
+    "St. Brown",
+    "Walker III",
+    "Moore",
+    "Jones Sr.",
+    "Pittman Jr.",
+]
+TEAMS = ["CIN", "KC", "DET", "SEA", "CHI", "MIN", "IND"]
+
+
+def make_names(n_players: int, repeat: int, seed: int = 7) -> pd.Series:
+    rng = random.Random(seed)
+    unique = [
+        f"{rng.choice(FIRST)} {rng.choice(LAST)}{i} {rng.choice(TEAMS)}"
+        for i in range(n_players)
+    ]
+    return pd.Series(unique * repeat)
+
+
+def per_row_path(names: pd.Series) -> pd.Series:
+    """The pre-existing approach: two regexes per row, applied row by row."""
+    return (
+        names.str.replace(r"\s+[A-Z]{2,3}$", "", regex=True).str.strip().apply(slugify)
+    )
+
+
+def best_of(func, names: pd.Series) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func(names)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    print("--- Name Normalization Benchmark: per-row vs vectorized ---")
+
+    # --- Correctness: slugify_series must agree with utils.slugify exactly ---
+    sample = make_names(2_000, 1)
+    expected = [slugify(name) for name in sample]
+    if slugify_series(sample).tolist() != expected:
+        print("FATAL: slugify_series disagrees with utils.slugify.", file=sys.stderr)
+        sys.exit(1)
+    print("slugify_series matches utils.slugify on 2,000 names. ✔️\n")
+
+    print(
+        f"{'names':>10} {'unique':>8} {'per-row (ms)':>14} {'vectorized (ms)':>16} {'speedup':>8}"
+    )
+    for n_players in POOL_SIZES:
+        for repeat in (1, WEEKS):
+            names = make_names(n_players // repeat or 1, repeat)
+            per_row = best_of(per_row_path, names)
+            vectorized = best_of(clean_source_names, names)
+            print(
+                f"{len(names):>10,} {names.nunique():>8,} {per_row * 1e3:>14.1f} "
+                f"{vectorized * 1e3:>16.1f} {per_row / vectorized:>7.1f}x"
+            )
+
+    # Suffix and team-code handling differs by design; show a few examples.
+    print("\nRule-based cleaning examples:")
+    examples = pd.Series(
+        ["Patrick Mahomes II KC", "Aaron Jones Sr. (MIN)*", "Josh Allen (BUF)"]
+    )
+    for raw, old, new in zip(
+        examples, per_row_path(examples), clean_source_names(examples)
+    ):
+        print(f"  {raw!r:<28} per-row: {old!r:<24} vectorized: {new!r}")
+
+    print("\n--- Benchmark Complete ---")
+
+
+if __name__ == "__main__":
+    main()
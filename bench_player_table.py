@@ -0,0 +1,133 @@
+import random
+import sys
+import time
+
+import pandas as pd
+
+from backend.models import PlayerRaw
+from backend.player_table import PlayerTable
+
+# --- Configuration ---
+# Roughly the size of Sleeper's full player dump.
+N_PLAYERS = 11_000
+REPEATS = 5
+TEAMS = ["ARI", "BUF", "CIN", "DAL", "DET", "KC", "MIN", "PHI", "SF", "TB", None]
+POSITIONS = ["QB", "RB", "WR", "TE", "K", "DEF", None]
+
+
+def make_players(seed: int = 3) -> list[PlayerRaw]:
+    rng = random.Random(seed)
+    return [
+        PlayerRaw(
+            player_id=str(i),
+            first_name=f"First{i}",
+            last_name=f"Last{i}",
+            position=rng.choice(POSITIONS),
+            team=rng.choice(TEAMS),
+            status=rng.choice(["Active", "Inactive", None]),
+            depth_chart_order=rng.choice([1, 2, 3, None]),
+            search_rank=rng.randint(1, 9_999_999),
+            fantasy_data_tms_bye_week=rng.choice([5, 7, 9, 14, None]),
+        )
+        for i in range(N_PLAYERS)
+    ]
+
+
+def model_bytes(players: list[PlayerRaw]) -> int:
+    """Model instances plus their field values."""
+    total = 0
+    for player in players:
+        total += sys.getsizeof(player) + sys.getsizeof(player.__dict__)
+        total += sum(
+            sys.getsizeof(v) for v in player.__dict__.values() if v is not None
+        )
+    return total
+
+
+def best_of(func) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    print("--- PlayerTable: memory and conversion cost ---")
+    players = make_players()
+    records = [p.model_dump(by_alias=True) for p in players]
+    frame = pd.DataFrame(records)
+    table = PlayerTable.from_models(players)
+
+    # --- Correctness: lossless round trips ---
+    if table.to_records() != records:
+        print(
+            "FATAL: PlayerTable.to_records() differs from model_dump().",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+    if table.to_models() != players:
+        print(
+            "FATAL: PlayerTable.to_models() differs from the input models.",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+    # Flags: a plain bool column and a nullable one with missing values.
+    rookie = [rank % 2 == 0 for rank in frame["search_rank"]]
+    injured = ([True, None, False] * N_PLAYERS)[:N_PLAYERS]
+    flagged_table = PlayerTable.from_frame(
+        frame.assign(rookie=rookie, injured=pd.array(injured, dtype="boolean"))
+    )
+    decoded = flagged_table.to_frame()
+    flagged_records = flagged_table.to_records()
+    if (
+        decoded["rookie"].dtype != bool
+        or decoded["rookie"].tolist() != rookie
+        or decoded["injured"].tolist() != injured
+        or [r["rookie"] for r in flagged_records] != rookie
+        or [r["injured"] for r in flagged_records] != injured
+    ):
+        print("FATAL: bool columns do not round-trip as bools.", file=sys.stderr)
+        sys.exit(1)
+    # More teams than int8 codes can hold must not wrap around.
+    many_teams = [f"T{i % 300}" for i in range(N_PLAYERS)]
+    if (
+        PlayerTable.from_frame(frame.assign(team=many_teams)).teams.tolist()
+        != many_teams
+    ):
+        print("FATAL: team codes wrap past 127 labels.", file=sys.stderr)
+        sys.exit(1)
+    print(
+        f"Round trips through records, models and bool flags are lossless for {N_PLAYERS:,} players. ✔️\n"
+    )
+
+    print(f"{'representation':<28} {'bytes/player':>12}")
+    print(f"{'list[PlayerRaw]':<28} {model_bytes(players) / N_PLAYERS:>12.0f}")
+    print(
+        f"{'object DataFrame':<28} {frame.memory_usage(deep=True).sum() / N_PLAYERS:>12.0f}"
+    )
+    print(f"{'PlayerTable':<28} {table.nbytes / N_PLAYERS:>12.0f}")
+    numeric_only = table.nbytes - sum(
+        v.nbytes + sum(s.__sizeof__() for s in v if s is not None)
+        for v in table.strings.values()
+    )
+    print(f"{'  (codes + numeric arrays)':<28} {numeric_only / N_PLAYERS:>12.0f}")
+
+    print(f"\n{'conversion':<40} {'ms':>8}")
+    conversions = {
+        "models -> dicts -> DataFrame": lambda: pd.DataFrame(
+            [p.model_dump(by_alias=True) for p in players]
+        ),
+        "models -> PlayerTable": lambda: PlayerTable.from_models(players),
+        "PlayerTable -> DataFrame": table.to_frame,
+        "position mask (object frame)": lambda: frame["position"] == "WR",
+        "position mask (PlayerTable)": lambda: table.position_mask("WR"),
+    }
+    for name, func in conversions.items():
+        print(f"{name:<40} {best_of(func) * 1e3:>8.2f}")
+    print("\n--- Benchmark Complete ---")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from backend.transforms.scoring import blend_scores, score_players
+
+# --- Configuration ---
+N_PLAYERS = 600
+REPEATS = 200
+WEIGHT_GRID = np.linspace(0.0, 1.0, 101)
+# The columns the legacy chain computes; it has no projection floor.
+LEGACY_COLUMNS = ["z_proj", "z_hist", "scaled_hist", "scaled_proj", "score"]
+POSITIONS = ["QB", "RB", "WR", "TE", "K", "DEF"]
+
+
+def legacy_scoring(
+    df: pd.DataFrame, weight_projection: float, weight_last_year: float
+) -> pd.DataFrame:
+    """The pre-existing DataFrame chain from run_stats."""
+
+    def z(column):
+        return (
+            df.groupby("position")[column]
+            .transform(lambda x: (x - x.mean()) / x.std() if x.std() > 0 else 0.0)
+            .fillna(0.0)
+        )
+
+    df["z_proj"] = z("projected_ppg")
+    df["z_hist"] = z("top_n_avg")
+    max_z_hist = df["z_hist"].max()
+    df["scaled_hist"] = df["z_hist"] * (25.0 / max_z_hist if max_z_hist > 0 else 0)
+    max_z_proj = df["z_proj"].max()
+    df["scaled_proj"] = df["z_proj"] * (25.0 / max_z_proj if max_z_proj > 0 else 0)
+    is_vet = df["top_n_avg"].notna() & df["projected_ppg"].notna()
+    is_rookie = df["projected_ppg"].notna() & df["top_n_avg"].isna()
+    is_history_only = df["top_n_avg"].notna() & df["projected_ppg"].isna()
+    df["score"] = np.select(
+        [is_vet, is_rookie, is_history_only],
+        [
+            df["scaled_proj"] * weight_projection
+            + df["scaled_hist"] * weight_last_year,
+            df["scaled_proj"],
+            df["scaled_hist"],
+        ],
+        default=0.0,
+    )
+    return df
+
+
+def make_players(seed: int = 5) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(
+        {
+            "position": rng.choice(POSITIONS, size=N_PLAYERS),
+            "projected_ppg": rng.gamma(2.0, 4.0, size=N_PLAYERS),
+            "top_n_avg": rng.gamma(2.0, 5.0, size=N_PLAYERS),
+        }
+    )
+    df.loc[rng.random(N_PLAYERS) < 0.3, "projected_ppg"] = np.nan
+    df.loc[rng.random(N_PLAYERS) < 0.4, "top_n_avg"] = np.nan
+    # A position with a single player exercises the zero/undefined std branch.
+    df.loc[df.index[-1], "position"] = "FB"
+    return df
+
+
+def kernel(df: pd.DataFrame, codes, labels, weight_projection, weight_last_year):
+    return score_players(
+        df["projected_ppg"].to_numpy(),
+        df["top_n_avg"].to_numpy(),
+        codes,
+        len(labels),
+        weight_projection,
+        weight_last_year,
+    )
+
+
+def main():
+    print("--- Scoring Kernel: DataFrame chain vs fused arrays ---")
+    df = make_players()
+    codes, labels = pd.factorize(df["position"])
+
+    # --- Correctness ---
+    expected = legacy_scoring(df.copy(), 0.5, 0.5)
+    actual = kernel(df, codes, labels, 0.5, 0.5)
+    for column in LEGACY_COLUMNS:
+        values = getattr(actual, column)
+        if not np.allclose(expected[column].to_numpy(), values, rtol=1e-12, atol=1e-12):
+            print(
+                f"FATAL: '{column}' differs from the DataFrame chain.", file=sys.stderr
+            )
+            sys.exit(1)
+    print(f"All five columns match the DataFrame chain on {N_PLAYERS} players. ✔️\n")
+
+    # --- Throughput ---
+    start = time.perf_counter()
+    for _ in range(REPEATS // 10):
+        legacy_scoring(df.copy(), 0.5, 0.5)
+    legacy_rate = (REPEATS // 10) / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        kernel(df, codes, labels, 0.5, 0.5)
+    kernel_rate = REPEATS / (time.perf_counter() - start)
+
+    print(f"{'path':<24} {'calls/sec':>10}")
+    print(f"{'DataFrame chain':<24} {legacy_rate:>10,.0f}")
+    print(
+        f"{'score_players':<24} {kernel_rate:>10,.0f}  ({kernel_rate / legacy_rate:.0f}x)"
+    )
+
+    # Tuning: z-scores and scaling do not depend on the weights, so a weight
+    # grid is one broadcast blend.
+    scores = kernel(df, codes, labels, 0.5, 0.5)
+    has_proj = df["projected_ppg"].notna().to_numpy()
+    has_hist = df["top_n_avg"].notna().to_numpy()
+    start = time.perf_counter()
+    grid = blend_scores(
+        scores.scaled_proj,
+        scores.scaled_hist,
+        has_proj,
+        has_hist,
+        WEIGHT_GRID[:, None],
+        1.0 - WEIGHT_GRID[:, None],
+    )
+    elapsed = time.perf_counter() - start
+    print(
+        f"\nBlended {grid.shape[0]} weight settings x {grid.shape[1]} players in {elapsed * 1e3:.2f} ms."
+    )
+    print("\n--- Benchmark Complete ---")
+
+
+if __name__ == "__main__":
+    main()
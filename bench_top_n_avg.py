@@ -0,0 +1,90 @@
+import random
+import sys
+import time
+
+import numpy as np
+
+from backend.transforms.compute_ppg import WeeklyScoreMatrix
+
+# --- Configuration ---
+N_PLAYERS = 5_000
+WEEKS = 17
+SETTINGS_GRID = [
+    (top_n, min_score) for top_n in (4, 6, 8, 10) for min_score in (0, 3, 5)
+]
+
+
+def per_player_top_n_avg(scores, top_n, min_score):
+    """The pre-existing approach: filter, sort and slice one player at a time."""
+    if not scores:
+        return np.nan
+    filtered = sorted((s for s in scores if s >= min_score), reverse=True)
+    if not filtered:
+        return np.nan
+    top = filtered[:top_n]
+    return sum(top) / len(top)
+
+
+def make_scores(seed: int = 11) -> list[list[float | None] | None]:
+    rng = random.Random(seed)
+    players = []
+    for _ in range(N_PLAYERS):
+        if rng.random() < 0.2:
+            players.append(None)  # Rookie: no history at all.
+            continue
+        players.append(
+            [
+                None if rng.random() < 0.25 else round(rng.uniform(-2, 35), 1)
+                for _ in range(WEEKS)
+            ]
+        )
+    return players
+
+
+def main():
+    print("--- Top-N Historical Average: per-player vs weekly matrix ---")
+    players = make_scores()
+    played = [[s for s in p if s is not None] if p else None for p in players]
+
+    start = time.perf_counter()
+    matrix = WeeklyScoreMatrix.from_score_lists(players)
+    build = time.perf_counter() - start
+    print(
+        f"Built a {matrix.scores.shape[0]:,} x {matrix.scores.shape[1]} matrix in {build * 1e3:.1f} ms."
+    )
+
+    # --- Correctness: identical results for every setting in the grid ---
+    for top_n, min_score in SETTINGS_GRID:
+        expected = np.array([per_player_top_n_avg(p, top_n, min_score) for p in played])
+        actual = matrix.top_n_avg(top_n, min_score)
+        if not np.array_equal(expected, actual, equal_nan=True):
+            print(
+                f"FATAL: mismatch for top_n={top_n}, min_score={min_score}.",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+    print(
+        f"Matrix results match the per-player loop on {len(SETTINGS_GRID)} settings. ✔️\n"
+    )
+
+    # --- Throughput: re-evaluating the whole settings grid ---
+    start = time.perf_counter()
+    for top_n, min_score in SETTINGS_GRID:
+        [per_player_top_n_avg(p, top_n, min_score) for p in played]
+    per_player = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for top_n, min_score in SETTINGS_GRID:
+        matrix.top_n_avg(top_n, min_score)
+    vectorized = time.perf_counter() - start
+
+    print(f"{'settings':>9} {'per-player (ms)':>16} {'matrix (ms)':>12} {'speedup':>8}")
+    print(
+        f"{len(SETTINGS_GRID):>9} {per_player * 1e3:>16.1f} {vectorized * 1e3:>12.1f} "
+        f"{per_player / vectorized:>7.1f}x"
+    )
+    print("\n--- Benchmark Complete ---")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+import random
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from backend.transforms.compute_ppg import (
+    BOOM_QUANTILE,
+    BUST_QUANTILE,
+    WEEKLY_QUANTILES,
+    WeeklyScoreMatrix,
+)
+
+# --- Configuration ---
+N_PLAYERS = 5_000
+WEEKS = 17
+POSITIONS = ["QB", "RB", "WR", "TE", "K", "DEF"]
+
+
+def make_scores(seed: int = 11) -> tuple[list[list[float | None] | None], list[str]]:
+    rng = random.Random(seed)
+    players, positions = [], []
+    for _ in range(N_PLAYERS):
+        positions.append(rng.choice(POSITIONS))
+        if rng.random() < 0.2:
+            players.append(None)  # Rookie: no history at all.
+            continue
+        players.append(
+            [
+                None if rng.random() < 0.25 else round(rng.uniform(-2, 35), 1)
+                for _ in range(WEEKS)
+            ]
+        )
+    return players, positions
+
+
+def per_player_distribution(players, positions) -> dict[str, np.ndarray]:
+    """The same metrics with np.quantile and np.std, one player at a time."""
+    played = [np.array([s for s in p if s is not None]) if p else None for p in players]
+    pools = {
+        pos: np.concatenate(
+            [w for w, p in zip(played, positions) if p == pos and w is not None]
+        )
+        for pos in POSITIONS
+    }
+    boom_at = {pos: np.quantile(pool, BOOM_QUANTILE) for pos, pool in pools.items()}
+    bust_at = {pos: np.quantile(pool, BUST_QUANTILE) for pos, pool in pools.items()}
+    rows = []
+    for weeks, pos in zip(played, positions):
+        if weeks is None or not len(weeks):
+            rows.append([np.nan] * (len(WEEKLY_QUANTILES) + 3))
+            continue
+        rows.append(
+            [np.quantile(weeks, q) for q in WEEKLY_QUANTILES.values()]
+            + [
+                np.mean(weeks >= boom_at[pos]),
+                np.mean(weeks < bust_at[pos]),
+                np.std(weeks),
+            ]
+        )
+    names = [*WEEKLY_QUANTILES, "boom_rate", "bust_rate", "volatility"]
+    return dict(zip(names, np.array(rows).T))
+
+
+def main():
+    print("--- Weekly Floor/Ceiling Metrics: per-player vs weekly matrix ---")
+    players, positions = make_scores()
+    codes, labels = pd.factorize(pd.Series(positions))
+    matrix = WeeklyScoreMatrix.from_score_lists(players)
+
+    # --- Correctness: the same metrics as NumPy's per-player functions ---
+    start = time.perf_counter()
+    expected = per_player_distribution(players, positions)
+    per_player = time.perf_counter() - start
+    start = time.perf_counter()
+    actual = matrix.distribution(codes, len(labels))
+    vectorized = time.perf_counter() - start
+    for name, values in expected.items():
+        if not np.allclose(
+            actual[name], values, rtol=1e-12, atol=1e-12, equal_nan=True
+        ):
+            print(
+                f"FATAL: '{name}' differs from the per-player result.", file=sys.stderr
+            )
+            sys.exit(1)
+    print(f"All {len(expected)} metrics match np.quantile / np.std per player. ✔️\n")
+
+    # --- Throughput ---
+    print(f"{'approach':<22} {'players':>8} {'ms':>9}")
+    print(f"{'per-player NumPy':<22} {N_PLAYERS:>8,} {per_player * 1e3:>9.1f}")
+    print(f"{'weekly matrix':<22} {N_PLAYERS:>8,} {vectorized * 1e3:>9.1f}")
+    print(f"Speedup: {per_player / vectorized:.0f}x")
+    print("\n--- Benchmark Complete ---")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,82 +1,90 @@
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-# --- Configuration ---
-# The name of your final, ranked JSON file.
-INPUT_JSON_FILE = Path("public/champions.json")
+from backend.transforms.tiers import optimal_tiers
 
-# The threshold for creating a new tier. A larger number means fewer, bigger tiers.
-# This value represents a drop-off in VOR points. A good starting point is 1.5-2.0.
-VOR_TIER_DROP_THRESHOLD = 1.75
+# --- Configuration ---
+# Every league's final, ranked JSON file in this directory gets its own sheets.
+INPUT_DIR = Path("public")
 
 # The positions you want to generate tiered sheets for.
 POSITIONS_TO_TIER = ["QB", "RB", "WR", "TE"]
 
-# The directory where the cheat sheets will be saved.
+# The directory where the cheat sheets will be saved, one subdirectory per league.
 OUTPUT_DIR = Path("cheatsheets")
 
+# Define the columns we want in our cheat sheets for readability
+COLUMNS_TO_KEEP = ["id", "name", "position", "team", "vor", "adp", "bye", "ppg"]
 
-def generate_cheatsheets():
-    """
-    Reads the final player rankings and generates printable CSV cheat sheets,
-    including an overall big board and positional tiers.
-    """
-    print(f"--- Fantasy Football Cheat Sheet Generator ---")
 
-    # 1. Load the Data
-    if not INPUT_JSON_FILE.exists():
-        print(
-            f"ERROR: Input file not found! Make sure '{INPUT_JSON_FILE}' is in this directory."
-        )
-        return
-
-    print(f"Loading data from '{INPUT_JSON_FILE}'...")
-    df = pd.read_json(INPUT_JSON_FILE)
+def generate_league_sheets(input_file: Path) -> list[str]:
+    """
+    Writes one league's overall big board and positional tier sheets.
 
-    # Ensure the output directory exists
-    OUTPUT_DIR.mkdir(exist_ok=True)
-    print(f"Output will be saved in the '{OUTPUT_DIR}/' directory.")
+    Tiers are the optimal clustering of each position's VOR (see
+    backend/transforms/tiers.py), with the tier count chosen per position.
 
-    # Define the columns we want in our cheat sheets for readability
-    columns_to_keep = ["id", "name", "position", "team", "vor", "adp", "bye", "ppg"]
+    Returns:
+        The report lines for this league.
+    """
+    league = input_file.stem
+    df = pd.read_json(input_file)
+    league_dir = OUTPUT_DIR / league
+    league_dir.mkdir(parents=True, exist_ok=True)
+    report = [f"{league}: {len(df)} players -> '{league_dir}/'"]
 
-    # 2. Generate the Overall Big Board
-    print("Generating Overall Big Board...")
-    overall_df = df[columns_to_keep]
-    overall_output_path = OUTPUT_DIR / "cheatsheet_overall.csv"
-    overall_df.to_csv(overall_output_path, index=False)
-    print(f" -> Saved to '{overall_output_path}'")
+    # 1. Generate the Overall Big Board
+    overall_output_path = league_dir / "cheatsheet_overall.csv"
+    df[COLUMNS_TO_KEEP].to_csv(overall_output_path, index=False)
 
-    # 3. Generate Positional Tier Sheets
-    print("\nGenerating Positional Tiers...")
+    # 2. Generate Positional Tier Sheets
     for pos in POSITIONS_TO_TIER:
-        print(f"  -> Processing {pos}s...")
-
         # Filter for the current position and sort by VOR
         pos_df = df[df["position"] == pos].sort_values(by="vor", ascending=False).copy()
 
         if pos_df.empty:
-            print(f"     No players found for position {pos}. Skipping.")
+            report.append(f"  {pos}: no players found. Skipping.")
             continue
 
-        # Calculate the drop-off in VOR from the player above
-        pos_df["vor_drop"] = pos_df["vor"].diff().abs()
-
-        # A new tier starts where the drop-off exceeds our threshold
-        # We use cumsum() to create incrementing tier numbers
-        pos_df["Tier"] = (pos_df["vor_drop"] > VOR_TIER_DROP_THRESHOLD).cumsum() + 1
+        pos_df["Tier"] = optimal_tiers(pos_df["vor"].to_numpy())
 
         # Select and reorder columns for the final sheet
-        final_pos_df = pos_df[["Tier"] + columns_to_keep]
+        final_pos_df = pos_df[["Tier"] + COLUMNS_TO_KEEP]
 
         # Save the tiered sheet to its own CSV file
-        pos_output_path = OUTPUT_DIR / f"cheatsheet_{pos}.csv"
-        final_pos_df.to_csv(pos_output_path, index=False)
-        print(f"     Saved to '{pos_output_path}'")
+        final_pos_df.to_csv(league_dir / f"cheatsheet_{pos}.csv", index=False)
+        report.append(f"  {pos}: {len(pos_df)} players in {pos_df['Tier'].max()} tiers")
+    return report
+
+
+def generate_cheatsheets():
+    """
+    Reads every league's final player rankings and generates printable CSV
+    cheat sheets, including an overall big board and positional tiers. The
+    leagues are processed in parallel.
+    """
+    print("--- Fantasy Football Cheat Sheet Generator ---")
+
+    # 1. Find the Leagues
+    input_files = sorted(INPUT_DIR.glob("*.json"))
+    if not input_files:
+        print(
+            f"ERROR: No league files found! Make sure '{INPUT_DIR}/' holds the ranked JSON files."
+        )
+        return
+
+    print(f"Generating sheets for {len(input_files)} leagues from '{INPUT_DIR}/'...")
+    OUTPUT_DIR.mkdir(exist_ok=True)
+
+    # 2. Generate Every League's Sheets
+    with ProcessPoolExecutor() as executor:
+        for report in executor.map(generate_league_sheets, input_files):
+            print("\n".join(report))
 
     print("\n--- Generation Complete! ---")
     print(
-        "You can now open the CSV files in the 'cheatsheets' directory with any spreadsheet program."
+        f"You can now open the CSV files in the '{OUTPUT_DIR}' directory with any spreadsheet program."
     )
 
 
@@ -10,7 +10,8 @@ if str(backend_path) not in sys.path:
 
 try:
     # Now we can import the pipeline's own data source module
-    from data_sources.fantasypros import fetch_adp, slugify
+    from data_sources.fantasypros import fetch_adp
+    from backend.utils import slugify
 except ImportError as e:
     print(f"FATAL: Could not import the fantasypros module.")
     print(f"Please ensure this script is in the project root and the backend exists.")
@@ -0,0 +1,205 @@
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from backend.settings import settings
+from backend.transforms.adjustments import (
+    BOOST_TIERS,
+    BoostRules,
+    PlayerAdjustments,
+    load_boost_rules,
+    load_mimic_rules,
+)
+
+# --- Configuration ---
+N_PLAYERS = 11_000
+N_BOOSTS = 200
+N_MIMICS = 50
+REPEATS = 5
+POSITIONS = ["QB", "RB", "WR", "TE", "K", "DEF"]
+
+
+def expect_error(label: str, func, fragment: str) -> None:
+    """Fails unless func raises a ValueError whose message has the fragment."""
+    try:
+        func()
+    except ValueError as e:
+        if fragment not in str(e):
+            print(f"FATAL: {label}: unexpected message: {e}", file=sys.stderr)
+            sys.exit(1)
+    else:
+        print(f"FATAL: {label} was accepted.", file=sys.stderr)
+        sys.exit(1)
+
+
+def load_from_file(loader, content):
+    """Runs a loader on content written to a temporary JSON file."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "rules.json"
+        path.write_text(json.dumps(content))
+        return loader(path)
+
+
+def make_players(seed: int = 4) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "slug": [f"player-{i}" for i in range(N_PLAYERS)],
+            "position": rng.choice(POSITIONS, N_PLAYERS),
+            "score": rng.gamma(2.0, 5.0, N_PLAYERS),
+        }
+    )
+
+
+def per_rule_loop(df, cfg, boost_rules, mimic_rules):
+    """The same adjustments one rule at a time on the DataFrame."""
+    df = df.copy()
+    for json_key, config_field in BOOST_TIERS.values():
+        for slug in getattr(boost_rules, json_key):
+            df.loc[df["slug"] == slug, "score"] *= 1 + getattr(cfg, config_field)
+    values = df.set_index("slug")["score"]
+    for target, source in mimic_rules.items():
+        df.loc[df["slug"] == target, "score"] = values[source]
+    for position, penalty in cfg.positional_penalties.items():
+        df.loc[df["position"] == position, "score"] *= penalty
+    return df["score"].to_numpy()
+
+
+def main():
+    print("--- Player Adjustments: verification and benchmark ---")
+    cfg = settings.league_config
+    df = make_players()
+
+    # --- Correctness: the rule files are validated when loaded ---
+    chain = {"player-1": "player-2", "player-2": "player-3"}
+    if load_from_file(load_mimic_rules, chain) != chain:
+        print("FATAL: a mimic chain was not loaded.", file=sys.stderr)
+        sys.exit(1)
+    expect_error(
+        "a self-mimic",
+        lambda: load_from_file(load_mimic_rules, {"player-1": "player-1"}),
+        "points at itself",
+    )
+    expect_error(
+        "a mimic cycle",
+        lambda: load_from_file(
+            load_mimic_rules,
+            {"player-1": "player-2", "player-2": "player-3", "player-3": "player-1"},
+        ),
+        "form a cycle",
+    )
+    expect_error(
+        "a non-slug mimic",
+        lambda: load_from_file(load_mimic_rules, {"player-1": 7}),
+        "expected slug -> slug",
+    )
+    expect_error(
+        "an unknown boost tier",
+        lambda: load_from_file(load_boost_rules, {"huge_boost_slugs": ["player-1"]}),
+        "huge_boost_slugs",
+    )
+    print("Mimic chains load; self-rules, cycles and unknown boost keys fail. ✔️")
+
+    # --- Correctness: chains resolve to their root, boosts compound ---
+    boost_rules = BoostRules(
+        max_boost_slugs=["player-5", "nobody"], small_boost_slugs=["player-5"]
+    )
+    adjustments = PlayerAdjustments(df["slug"], df["position"], cfg, boost_rules, chain)
+    values = adjustments.apply_mimics(adjustments.apply_boosts(df["score"]))
+    boosted = df["score"].iloc[5] * (1 + cfg.boost_max) * (1 + cfg.boost_small)
+    if (
+        not np.isclose(values[5], boosted)
+        or values[1] != values[3]
+        or values[2] != values[3]
+        or adjustments.mimics != {"player-1": "player-3", "player-2": "player-3"}
+    ):
+        print("FATAL: boosts or chained mimics differ.", file=sys.stderr)
+        sys.exit(1)
+    if adjustments.unmatched != [
+        {
+            "rule": "boost",
+            "key": "nobody",
+            "reason": "no player with this slug (max_boost_slugs)",
+        }
+    ]:
+        print(f"FATAL: unmatched rules: {adjustments.unmatched}", file=sys.stderr)
+        sys.exit(1)
+    print("Boost tiers compound, chains copy their root and misses are reported. ✔️")
+
+    # --- Correctness: penalties only for roster positions, in (0, 1] ---
+    odd = cfg.model_copy(
+        update={"positional_penalties": {"RB": 0.8, "LB": 0.5, "TE": 1.5}}
+    )
+    adjustments = PlayerAdjustments(
+        df["slug"], df["position"], odd, apply_penalties=True
+    )
+    reported = {entry["key"] for entry in adjustments.unmatched}
+    expected = np.where(df["position"] == "RB", 0.8, 1.0)
+    if reported != {"LB", "TE"} or not np.array_equal(
+        adjustments.penalty_multiplier, expected
+    ):
+        print("FATAL: bad penalty positions were applied.", file=sys.stderr)
+        sys.exit(1)
+    zero = cfg.model_copy(update={"positional_penalties": {"RB": 0.0}})
+    expect_error(
+        "a zero penalty",
+        lambda: PlayerAdjustments(
+            df["slug"], df["position"], zero, apply_penalties=True
+        ),
+        "must be positive",
+    )
+    expect_error(
+        "a batch penalty for an unknown position",
+        lambda: adjustments.penalty_multipliers({"LB": np.array([0.5])}),
+        "not in the league roster",
+    )
+    expect_error(
+        "a batch penalty above 1",
+        lambda: adjustments.penalty_multipliers({"RB": np.array([0.5, 1.2])}),
+        "must be in (0, 1]",
+    )
+    print("Unknown positions and penalties above 1 are reported, not applied. ✔️\n")
+
+    # --- Throughput: every rule at once against one rule at a time ---
+    rng = np.random.default_rng(0)
+    picked = rng.choice(df["slug"].to_numpy(), N_BOOSTS + 2 * N_MIMICS, replace=False)
+    tiers = np.array_split(picked[:N_BOOSTS], len(BOOST_TIERS))
+    boost_rules = BoostRules(
+        **{key: list(slugs) for (key, _), slugs in zip(BOOST_TIERS.values(), tiers)}
+    )
+    mimic_rules = dict(
+        zip(picked[N_BOOSTS::2].tolist(), picked[N_BOOSTS + 1 :: 2].tolist())
+    )
+
+    def vectorized():
+        adjustments = PlayerAdjustments(
+            df["slug"], df["position"], cfg, boost_rules, mimic_rules, True
+        )
+        values = adjustments.apply_mimics(adjustments.apply_boosts(df["score"]))
+        return adjustments.apply_penalties(values)
+
+    if not np.allclose(vectorized(), per_rule_loop(df, cfg, boost_rules, mimic_rules)):
+        print("FATAL: compiled rules differ from the per-rule loop.", file=sys.stderr)
+        sys.exit(1)
+    print(f"{'approach':<20} {'rules':>6} {'players':>8} {'ms':>8}")
+    for label, func in [
+        ("per-rule loop", lambda: per_rule_loop(df, cfg, boost_rules, mimic_rules)),
+        ("compiled", vectorized),
+    ]:
+        timings = []
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        rules = N_BOOSTS + N_MIMICS + len(cfg.positional_penalties)
+        print(f"{label:<20} {rules:>6} {N_PLAYERS:>8,} {min(timings) * 1e3:>8.1f}")
+    print("\n--- Benchmark Complete ---")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+import json
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from backend.backtest import Backtest, load_backtest_season, run_backtest, season_path
+from backend.logging_config import log
+from backend.settings import LeagueConfig, settings
+from backend.transforms.adjustments import PlayerAdjustments
+from backend.transforms.compute_vor import compute_vor
+from backend.transforms.scoring import score_players
+
+# --- Configuration ---
+N_PLAYERS = 1_500
+WEEKS = 17
+RUNS = [("2023-08-27", 2023), ("2024-08-25", 2024)]
+CHECKED_SETTINGS = 12
+POSITIONS = ["QB", "RB", "WR", "TE", "K", "DEF"]
+TEAMS = ["ARI", "BUF", "CIN", "DAL", "DET", "KC", "MIN", "PHI", "SF", "TB"]
+
+
+def write_season(data_dir: Path, run_date: str, season: int, seed: int) -> None:
+    """
+    A preseason run and its realized season. Every player has a true weekly
+    scoring level; the projection, last season's weeks and the realized
+    season are noisy views of it.
+    """
+    rng = np.random.default_rng(seed)
+    level = rng.gamma(2.0, 4.0, N_PLAYERS)
+    positions = rng.choice(POSITIONS, N_PLAYERS)
+    slugs = [f"player-{seed}-{i}" for i in range(N_PLAYERS)]
+
+    def weeks(scale: float, played: float) -> list[list[float | None]]:
+        values = np.round(level[:, None] + rng.normal(0, scale, (N_PLAYERS, WEEKS)), 1)
+        mask = rng.random((N_PLAYERS, WEEKS)) < played
+        return [
+            [float(v) if m else None for v, m in zip(row, row_mask)]
+            for row, row_mask in zip(values, mask)
+        ]
+
+    has_history = rng.random(N_PLAYERS) < 0.7
+    last_season = [w if h else None for w, h in zip(weeks(6.0, 0.8), has_history)]
+    projected = level + rng.normal(0, 3.0, N_PLAYERS)
+    players = pd.DataFrame(
+        {
+            "player_id": [str(i) for i in range(N_PLAYERS)],
+            "slug": slugs,
+            "first_name": "Player",
+            "last_name": [s.removeprefix("player-") for s in slugs],
+            "position": positions,
+            "team": rng.choice(TEAMS, N_PLAYERS),
+            "adp": np.where(
+                rng.random(N_PLAYERS) < 0.6, rng.uniform(1, 250, N_PLAYERS), None
+            ),
+            "projected_ppg": np.where(rng.random(N_PLAYERS) < 0.85, projected, None),
+            "top_n_avg": None,
+        }
+    )
+    run_dir = data_dir / run_date
+    run_dir.mkdir(parents=True)
+    (run_dir / "players_with_ppg.json").write_text(players.to_json(orient="records"))
+    (run_dir / "weekly_scores.json").write_text(json.dumps(last_season))
+
+    actuals = [
+        {"slug": slug, "position": pos, "team": None, "scores": scores}
+        for slug, pos, scores in zip(slugs, positions, weeks(7.0, 0.75))
+    ]
+    season_path(season).parent.mkdir(parents=True, exist_ok=True)
+    season_path(season).write_text(json.dumps(actuals))
+
+
+def reference_metric(
+    season, cfg: LeagueConfig, wp: float, wl: float, top_n: int
+) -> float:
+    """One setting's Spearman through the stats and VOR phase code."""
+    df = season.players.copy()
+    df["top_n_avg"] = season.history.top_n_avg(top_n, cfg.min_historical_score)
+    df["top_n_avg"] = df["top_n_avg"].replace(0.0, np.nan)
+    codes, uniques = pd.factorize(df["position"])
+    df["expected_ppg"] = score_players(
+        df["projected_ppg"].astype(float), df["top_n_avg"], codes, len(uniques), wp, wl
+    ).score
+    df["vor"], _ = compute_vor(
+        df["expected_ppg"], df["position"], cfg.roster, cfg.teams
+    )
+    penalties = PlayerAdjustments(df["slug"], df["position"], cfg, apply_penalties=True)
+    df["vor"] = penalties.apply_penalties(df["vor"].to_numpy())
+    df["actual_vor"], _ = compute_vor(
+        season.actual_points / cfg.games_divisor, df["position"], cfg.roster, cfg.teams
+    )
+    board = df[df["adp"].notna()]
+    board_order = board.sort_values("vor", ascending=False, kind="stable").index
+    board_rank = pd.Series(np.arange(len(board), 0, -1), index=board_order)
+    return board_rank.corr(board["actual_vor"].rank(method="average"))
+
+
+def main():
+    print("--- Backtest Calibration: verification and benchmark ---")
+    log.setLevel(logging.ERROR)
+    with tempfile.TemporaryDirectory() as tmp:
+        settings.DATA_DIR = Path(tmp)
+        for seed, (run_date, season) in enumerate(RUNS):
+            write_season(settings.DATA_DIR, run_date, season, seed)
+        seasons = [load_backtest_season(date, season) for date, season in RUNS]
+        cfg = settings.league_config
+
+        # --- Correctness: the batch matches the per-setting code path ---
+        backtest = Backtest(seasons, cfg)
+        rng = np.random.default_rng(0)
+        wp, wl = rng.random(CHECKED_SETTINGS), rng.random(CHECKED_SETTINGS)
+        for top_n in (1, 4, 17):
+            batch = backtest.evaluate(wp, wl, top_n)["spearman"]
+            for i in range(CHECKED_SETTINGS):
+                expected = np.mean(
+                    [reference_metric(s, cfg, wp[i], wl[i], top_n) for s in seasons]
+                )
+                if not np.isclose(batch[i], expected, rtol=0, atol=1e-12):
+                    print(
+                        f"FATAL: setting {i} (top_n={top_n}) scores {batch[i]} != {expected}.",
+                        file=sys.stderr,
+                    )
+                    sys.exit(1)
+        print(
+            f"{3 * CHECKED_SETTINGS} batched evaluations match the per-setting pipeline. ✔️\n"
+        )
+
+        # --- A full calibration of every league config ---
+        start = time.perf_counter()
+        results = run_backtest(RUNS, metric="spearman")
+        elapsed = time.perf_counter() - start
+        for name, result in results.items():
+            if result["recommended"]["spearman"] < result["current"]["spearman"]:
+                print(f"FATAL: calibration made {name} worse.", file=sys.stderr)
+                sys.exit(1)
+        evaluations = sum(r["recommended"]["evaluations"] for r in results.values())
+        print(
+            f"\nCalibrated {len(results)} configs over {len(RUNS)} seasons: "
+            f"{evaluations:,} settings in {elapsed:.1f} s "
+            f"({evaluations * len(RUNS) / elapsed:,.0f} season evaluations/s). ✔️"
+        )
+    print("\n--- Benchmark Complete ---")
+
+
+if __name__ == "__main__":
+    main()
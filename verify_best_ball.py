@@ -0,0 +1,141 @@
+import itertools
+import sys
+import time
+
+import numpy as np
+
+from backend.best_ball import lineup_points, marginal_points
+from backend.constants import FLEX_POSITIONS
+from backend.settings import RosterSettings
+
+# --- Configuration ---
+N_PLAYERS = 3_000
+BOARD = 300
+WEEKS = 17
+ROUNDS = 15
+POSITIONS = ["QB", "RB", "WR", "TE", "K", "DEF"]
+ROSTERS = [
+    RosterSettings(QB=1, RB=2, WR=2, TE=1, FLEX=1, K=1, DEF=1),
+    RosterSettings(QB=1, RB=2, WR=3, TE=1, FLEX=2, K=0, DEF=0),
+    RosterSettings(QB=2, RB=4, WR=4, TE=1, FLEX=0, K=1, DEF=1),
+]
+
+
+def make_pool(seed: int, n: int) -> tuple[np.ndarray, np.ndarray]:
+    """Weekly scores with missed weeks, rookies and a few negative weeks."""
+    rng = np.random.default_rng(seed)
+    positions = rng.choice(POSITIONS, n, p=[0.12, 0.25, 0.33, 0.14, 0.06, 0.1])
+    weekly = np.round(rng.gamma(2.0, 4.0, (n, 1)) + rng.normal(0, 5, (n, WEEKS)), 1)
+    weekly[rng.random((n, WEEKS)) < 0.2] = np.nan
+    weekly[rng.random(n) < 0.1] = np.nan
+    return weekly, positions
+
+
+def exhaustive_week(scores, positions, roster: RosterSettings) -> float:
+    """
+    The best lineup by trying every set of FLEX starters: every slot that can
+    be filled is filled, and dedicated slots take a position's best remaining.
+    """
+    by_pos = {
+        pos: [s for s, p in zip(scores, positions) if p == pos] for pos in POSITIONS
+    }
+    spare = sum(
+        max(len(by_pos[pos]) - getattr(roster, pos), 0) for pos in FLEX_POSITIONS
+    )
+    n_flex = min(roster.FLEX, spare)
+    eligible = [i for i, p in enumerate(positions) if p in FLEX_POSITIONS]
+    best = -np.inf
+    for flex in itertools.combinations(eligible, n_flex):
+        total = sum(scores[i] for i in flex)
+        for pos in POSITIONS:
+            remaining = sorted(
+                (
+                    s
+                    for i, (s, p) in enumerate(zip(scores, positions))
+                    if p == pos and i not in flex
+                ),
+                reverse=True,
+            )
+            slots = getattr(roster, pos)
+            if pos in FLEX_POSITIONS and len(remaining) < min(slots, len(by_pos[pos])):
+                break  # The FLEX set emptied a dedicated slot it could have filled.
+            total += sum(remaining[:slots])
+        else:
+            best = max(best, total)
+    return best
+
+
+def exhaustive_lineup(weekly, positions, roster) -> np.ndarray:
+    weekly = np.nan_to_num(weekly, nan=0.0)
+    return np.array(
+        [
+            exhaustive_week(list(weekly[:, w]), list(positions), roster)
+            for w in range(WEEKS)
+        ]
+    )
+
+
+def main():
+    print("--- Best-Ball Marginal Value: verification and benchmark ---")
+
+    # --- Correctness: every candidate against an exhaustive lineup search ---
+    checked = 0
+    for seed in range(6):
+        weekly, positions = make_pool(seed, 60)
+        roster = ROSTERS[seed % len(ROSTERS)]
+        rng = np.random.default_rng(seed)
+        picks = rng.choice(60, rng.integers(0, 12), replace=False)
+        candidates = np.setdiff1d(np.arange(60), picks)
+        if not np.allclose(
+            lineup_points(weekly[picks], positions[picks], roster),
+            exhaustive_lineup(weekly[picks], positions[picks], roster),
+        ):
+            print(f"FATAL: lineup points differ for seed {seed}.", file=sys.stderr)
+            sys.exit(1)
+        base = exhaustive_lineup(weekly[picks], positions[picks], roster)
+        gain = marginal_points(weekly, positions, roster, picks, candidates)
+        for row, c in enumerate(candidates):
+            with_c = np.append(picks, c)
+            expected = (
+                exhaustive_lineup(weekly[with_c], positions[with_c], roster) - base
+            )
+            if not np.allclose(gain[row], expected):
+                print(
+                    f"FATAL: marginal points differ for seed {seed}, player {c}.",
+                    file=sys.stderr,
+                )
+                sys.exit(1)
+            checked += 1
+    print(f"{checked} candidates match an exhaustive lineup search week by week. ✔️\n")
+
+    # --- Throughput: re-evaluate the board after every pick of a draft ---
+    weekly, positions = make_pool(99, N_PLAYERS)
+    roster = ROSTERS[0]
+    board = np.arange(BOARD)
+    picks = np.array([], dtype=int)
+    vectorized = per_candidate = 0.0
+    for _ in range(ROUNDS):
+        candidates = np.setdiff1d(board, picks)
+        start = time.perf_counter()
+        gain = marginal_points(weekly, positions, roster, picks, candidates)
+        vectorized += time.perf_counter() - start
+        start = time.perf_counter()
+        base = lineup_points(weekly[picks], positions[picks], roster)
+        for c in candidates:
+            with_c = np.append(picks, c)
+            lineup_points(weekly[with_c], positions[with_c], roster) - base
+        per_candidate += time.perf_counter() - start
+        picks = np.append(picks, candidates[np.argmax(gain.sum(axis=1))])
+    print(f"{'approach':<26} {'board':>6} {'picks':>6} {'ms/pick':>9}")
+    print(
+        f"{'lineup per candidate':<26} {BOARD:>6} {ROUNDS:>6} {per_candidate / ROUNDS * 1e3:>9.2f}"
+    )
+    print(
+        f"{'all candidates at once':<26} {BOARD:>6} {ROUNDS:>6} {vectorized / ROUNDS * 1e3:>9.2f}"
+    )
+    print(f"Speedup: {per_candidate / vectorized:.0f}x")
+    print("\n--- Benchmark Complete ---")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+import json
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from backend.logging_config import log
+from backend.pipelines import bootstrap
+from backend.settings import settings
+from backend.transforms.adjustments import (
+    PlayerAdjustments,
+    load_boost_rules,
+    load_mimic_rules,
+)
+from backend.transforms.compute_ppg import WEEKLY_QUANTILES, WeeklyScoreMatrix
+from backend.transforms.scoring import score_players
+
+# --- Configuration ---
+# Roughly the size of players_with_ppg.json after the clean phase.
+N_PLAYERS = 3_000
+WEEKS = 17
+SAMPLES = 2_000
+DATE = "2025-08-20"
+POSITIONS = ["QB", "RB", "WR", "TE", "K", "DEF"]
+
+
+def write_run(data_dir: Path, constant_weeks: bool, seed: int = 3) -> None:
+    """players_with_ppg.json and weekly_scores.json scored as the stats phase would."""
+    rng = np.random.default_rng(seed)
+    level = rng.gamma(2.0, 4.0, N_PLAYERS)
+    spread = 0.0 if constant_weeks else 6.0
+    weeks = np.round(level[:, None] + rng.normal(0, spread, (N_PLAYERS, WEEKS)), 1)
+    weeks[rng.random((N_PLAYERS, WEEKS)) < 0.2] = np.nan
+    history = [
+        None if rookie else [None if np.isnan(w) else float(w) for w in row]
+        for row, rookie in zip(weeks, rng.random(N_PLAYERS) < 0.25)
+    ]
+    players = pd.DataFrame(
+        {
+            "slug": [f"player-{i}" for i in range(N_PLAYERS)],
+            "first_name": "Player",
+            "last_name": [str(i) for i in range(N_PLAYERS)],
+            "position": rng.choice(POSITIONS, N_PLAYERS),
+            "team": "KC",
+            "adp": np.where(
+                rng.random(N_PLAYERS) < 0.3, rng.uniform(1, 250, N_PLAYERS), np.nan
+            ),
+            "bye_week": 7,
+            "projected_ppg": np.where(
+                rng.random(N_PLAYERS) < 0.8, level + rng.normal(0, 2, N_PLAYERS), np.nan
+            ),
+        }
+    )
+    cfg = settings.league_config
+    matrix = WeeklyScoreMatrix.from_score_lists(history)
+    top_n_avg = matrix.top_n_avg(cfg.top_game_count, cfg.min_historical_score)
+    players["top_n_avg"] = np.where(top_n_avg == 0.0, np.nan, top_n_avg)
+    codes, uniques = pd.factorize(players["position"])
+    score = score_players(
+        players["projected_ppg"],
+        players["top_n_avg"],
+        codes,
+        len(uniques),
+        cfg.weight_projection,
+        cfg.weight_last_year,
+        matrix.quantile(WEEKLY_QUANTILES["p10"]),
+        cfg.weight_floor,
+    ).score
+    adjustments = PlayerAdjustments(
+        players["slug"],
+        players["position"],
+        cfg,
+        load_boost_rules(settings.BASE_DIR / "player_boost.json"),
+        load_mimic_rules(settings.BASE_DIR / "player_mimics.json"),
+    )
+    players["expected_ppg"] = adjustments.apply_mimics(adjustments.apply_boosts(score))
+    run_dir = data_dir / DATE
+    run_dir.mkdir(parents=True, exist_ok=True)
+    (run_dir / "players_with_ppg.json").write_text(players.to_json(orient="records"))
+    (run_dir / "weekly_scores.json").write_text(json.dumps(history))
+
+
+def main():
+    print("--- Bootstrap Intervals: verification and benchmark ---")
+    log.setLevel(logging.ERROR)
+    with tempfile.TemporaryDirectory() as tmp:
+        settings.DATA_DIR = Path(tmp)
+        output_path = settings.DATA_DIR / DATE / "players_bootstrap.json"
+
+        # --- Correctness: without any noise, every sample is the board itself ---
+        write_run(settings.DATA_DIR, constant_weeks=True)
+        noise, bootstrap.PROJECTION_NOISE = bootstrap.PROJECTION_NOISE, 0.0
+        bootstrap.run_bootstrap(DATE, samples=200)
+        bootstrap.PROJECTION_NOISE = noise
+        board = pd.DataFrame(json.loads(output_path.read_text()))
+        for column in ("vor_p05", "vor_p50", "vor_p95"):
+            if not np.array_equal(board[column], board["vor"]):
+                print(f"FATAL: {column} differs from the board's VOR.", file=sys.stderr)
+                sys.exit(1)
+        for column in ("rank_p05", "rank_p50", "rank_p95"):
+            if not np.array_equal(board[column], board["id"]):
+                print(
+                    f"FATAL: {column} differs from the board's rank.", file=sys.stderr
+                )
+                sys.exit(1)
+        print(
+            f"Noise-free samples reproduce all {len(board)} board VORs and ranks. ✔️\n"
+        )
+
+        # --- Throughput: the full pool with real noise ---
+        write_run(settings.DATA_DIR, constant_weeks=False)
+        start = time.perf_counter()
+        bootstrap.run_bootstrap(DATE, samples=SAMPLES)
+        elapsed = time.perf_counter() - start
+        board = pd.DataFrame(json.loads(output_path.read_text()))
+        top = board.head(50)
+        print(f"{'players':>8} {'board':>6} {'samples':>8} {'seconds':>8}")
+        print(f"{N_PLAYERS:>8,} {len(board):>6,} {SAMPLES:>8,} {elapsed:>8.2f}")
+        print(
+            f"Top-50 median 90% rank range: {(top['rank_p95'] - top['rank_p05']).median():.0f} "
+            f"places; median VOR interval width: {(top['vor_p95'] - top['vor_p05']).median():.2f}"
+        )
+    print("\n--- Benchmark Complete ---")
+
+
+if __name__ == "__main__":
+    main()
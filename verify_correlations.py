@@ -0,0 +1,152 @@
+import json
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from backend.correlations import (
+    MIN_SHARED_WEEKS,
+    MIN_WEEKS,
+    CorrelationMatrix,
+    pairwise_moments,
+    run_correlations,
+)
+from backend.logging_config import log
+from backend.settings import settings
+
+# --- Configuration ---
+N_PLAYERS = 3_000
+WEEKS = 17
+DATE = "2025-08-20"
+POSITIONS = ["QB", "RB", "WR", "TE", "K", "DEF"]
+TEAMS = ["KC", "BUF", "CIN", "PHI", "DAL", "SF", "MIA", "DET"]
+
+
+def make_weeks(seed: int) -> tuple[np.ndarray, np.ndarray]:
+    """Weekly scores with a shared team factor, missed weeks and rookies."""
+    rng = np.random.default_rng(seed)
+    teams = rng.choice(TEAMS, N_PLAYERS)
+    team_weeks = {team: rng.normal(0, 5, WEEKS) for team in TEAMS}
+    offense = np.stack([team_weeks[team] for team in teams])
+    weeks = np.round(
+        rng.gamma(2.0, 4.0, (N_PLAYERS, 1))
+        + offense
+        + rng.normal(0, 4, (N_PLAYERS, WEEKS)),
+        1,
+    )
+    weeks[rng.random((N_PLAYERS, WEEKS)) < 0.3] = np.nan
+    weeks[rng.random(N_PLAYERS) < 0.2] = np.nan
+    return weeks, teams
+
+
+def write_run(data_dir: Path, weeks: np.ndarray, teams: np.ndarray) -> None:
+    rng = np.random.default_rng(1)
+    players = pd.DataFrame(
+        {
+            "slug": [f"player-{i}" for i in range(N_PLAYERS)],
+            "first_name": "Player",
+            "last_name": [str(i) for i in range(N_PLAYERS)],
+            "position": rng.choice(POSITIONS, N_PLAYERS),
+            "team": teams,
+            "adp": np.where(
+                rng.random(N_PLAYERS) < 0.3, rng.uniform(1, 250, N_PLAYERS), np.nan
+            ),
+        }
+    )
+    history = [
+        None
+        if np.isnan(row).all()
+        else [None if np.isnan(w) else float(w) for w in row]
+        for row in weeks
+    ]
+    run_dir = data_dir / DATE
+    run_dir.mkdir(parents=True, exist_ok=True)
+    (run_dir / "players_with_ppg.json").write_text(players.to_json(orient="records"))
+    (run_dir / "weekly_scores.json").write_text(json.dumps(history))
+
+
+def main():
+    print("--- Weekly Correlation Matrix: verification and benchmark ---")
+    log.setLevel(logging.ERROR)
+    weeks, teams = make_weeks(5)
+
+    # --- Correctness: pandas' pairwise-complete corr() and cov() ---
+    sample = weeks[:400]
+    frame = pd.DataFrame(sample.T)
+    start = time.perf_counter()
+    expected_corr = frame.corr(min_periods=2).to_numpy()
+    expected_cov = frame.cov(min_periods=2).to_numpy()
+    pandas_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    moments = pairwise_moments(sample)
+    masked_seconds = time.perf_counter() - start
+    for name, expected in (("corr", expected_corr), ("cov", expected_cov)):
+        if not np.allclose(moments[name], expected, atol=1e-9, equal_nan=True):
+            print(f"FATAL: '{name}' differs from pandas.", file=sys.stderr)
+            sys.exit(1)
+    print(f"{len(sample)} players match pandas' pairwise corr() and cov(). ✔️")
+
+    # --- Correctness: the stored matrix and its queries ---
+    with tempfile.TemporaryDirectory() as tmp:
+        settings.DATA_DIR = Path(tmp)
+        write_run(settings.DATA_DIR, weeks, teams)
+        start = time.perf_counter()
+        path = run_correlations(DATE)
+        build_seconds = time.perf_counter() - start
+        matrix = CorrelationMatrix.load(DATE)
+        size_kb = path.stat().st_size / 1024
+
+    rows = np.array([int(slug.split("-")[1]) for slug in matrix.slug])
+    if ((~np.isnan(weeks[rows])).sum(axis=1) < MIN_WEEKS).any():
+        print("FATAL: a player with too few weeks is in the matrix.", file=sys.stderr)
+        sys.exit(1)
+    stored = pairwise_moments(weeks[rows])
+    thin = stored["shared"] < MIN_SHARED_WEEKS
+    for name, atol in (("corr", 1e-3), ("cov", 1e-4)):
+        expected = np.where(thin, np.nan, stored[name])
+        if not np.allclose(
+            getattr(matrix, name), expected, rtol=1e-6, atol=atol, equal_nan=True
+        ):
+            print(f"FATAL: stored '{name}' does not round-trip.", file=sys.stderr)
+            sys.exit(1)
+    stacks = matrix.most_correlated(matrix.slug[0], top=3)
+    if (
+        not (stacks["team"] == matrix.team[0]).all()
+        or not stacks["corr"].is_monotonic_decreasing
+    ):
+        print("FATAL: teammate query is not sorted by correlation.", file=sys.stderr)
+        sys.exit(1)
+    if (matrix.shared[~np.isnan(matrix.corr)] < MIN_SHARED_WEEKS).any():
+        print("FATAL: a thin pair kept its correlation.", file=sys.stderr)
+        sys.exit(1)
+    roster = matrix.roster_correlation(list(matrix.slug[:10]))
+    same_team = matrix.team[:, None] == matrix.team[None, :]
+    off_diagonal = ~np.eye(len(matrix.slug), dtype=bool)
+    print(
+        f"Stored matrix round-trips: {len(matrix.slug)} board players, {size_kb:,.0f} KB. ✔️\n"
+        f"Mean teammate correlation {np.nanmean(matrix.corr[same_team & off_diagonal]):.3f}, "
+        f"other teams {np.nanmean(matrix.corr[~same_team]):.3f}; "
+        f"10-player roster std {roster['combined_std']:.1f} vs "
+        f"{roster['independent_std']:.1f} independent.\n"
+    )
+
+    # --- Throughput ---
+    start = time.perf_counter()
+    pairwise_moments(weeks)
+    full_seconds = time.perf_counter() - start
+    print(f"{'approach':<28} {'players':>8} {'ms':>9}")
+    print(f"{'pandas corr + cov':<28} {len(sample):>8,} {pandas_seconds * 1e3:>9.1f}")
+    print(f"{'masked products':<28} {len(sample):>8,} {masked_seconds * 1e3:>9.1f}")
+    print(f"{'masked products':<28} {N_PLAYERS:>8,} {full_seconds * 1e3:>9.1f}")
+    print(
+        f"{'correlations phase (board)':<28} {len(matrix.slug):>8,} {build_seconds * 1e3:>9.1f}"
+    )
+    print("\n--- Benchmark Complete ---")
+
+
+if __name__ == "__main__":
+    main()
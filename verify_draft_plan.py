@@ -0,0 +1,145 @@
+import itertools
+import math
+import sys
+import time
+
+import numpy as np
+
+from backend.draft_plan import (
+    BENCH_WEIGHT,
+    _normal_cdf,
+    _RosterRules,
+    availability_from_adp,
+    expected_pick_values,
+    plan_draft,
+)
+from backend.draft_sim import DRAFT_POSITIONS, my_picks
+from backend.settings import RosterSettings
+
+# --- Configuration ---
+TEAMS = 12
+SLOT = 5
+ALTERNATES = 4
+SMALL_ROSTER = RosterSettings(QB=1, RB=2, WR=2, TE=1, FLEX=1, K=0, DEF=0)
+LEAGUE_ROSTER = RosterSettings(QB=1, RB=2, WR=3, TE=1, FLEX=1, K=1, DEF=1)
+ROUND_COUNTS = [10, 15, 18, 20]
+MONTE_CARLO_DRAWS = 200_000
+
+
+def make_board(seed: int, n: int = 400) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """A board whose VOR falls with ADP, with noise, at realistic position shares."""
+    rng = np.random.default_rng(seed)
+    positions = rng.choice(DRAFT_POSITIONS, n, p=[0.12, 0.28, 0.33, 0.13, 0.07, 0.07])
+    adp = np.sort(rng.uniform(1, 300, n))
+    vor = 120 * np.exp(-adp / 50) + rng.normal(0, 8, n) - 10
+    return adp, positions, vor
+
+
+def pick_values(adp, positions, vor, roster, rounds):
+    picks = my_picks(SLOT, TEAMS, rounds)
+    availability = availability_from_adp(adp, picks)
+    caps = _RosterRules(roster, rounds).caps
+    return [
+        expected_pick_values(
+            vor[positions == pos], availability[:, positions == pos], max(cap, 1)
+        )
+        for pos, cap in zip(DRAFT_POSITIONS, caps)
+    ]
+
+
+def exhaustive_plans(values, roster, rounds, keep):
+    """Every position sequence of the roster's positions, scored pick by pick."""
+    rules = _RosterRules(roster, rounds)
+    codes = [c for c, cap in enumerate(rules.caps) if cap > 0]
+    scored = []
+    for plan in itertools.product(codes, repeat=rounds):
+        counts, total, valid = [0] * len(DRAFT_POSITIONS), 0.0, True
+        for pick, code in enumerate(plan):
+            if counts[code] >= rules.caps[code]:
+                valid = False
+                break
+            value = values[code][pick, counts[code]]
+            if rules.role(tuple(counts), code) == "bench":
+                value *= BENCH_WEIGHT
+            total += value
+            counts[code] += 1
+        if valid and rules.unfilled(tuple(counts)) == 0:
+            scored.append((total, plan))
+    return sorted(scored, reverse=True)[:keep]
+
+
+def monte_carlo_order_statistic(vor, availability, c, rng):
+    """The (c + 1)-th best available player's VOR, by sampling availability."""
+    order = np.argsort(-vor)
+    draws = rng.random((MONTE_CARLO_DRAWS, len(vor))) < availability[order]
+    values = np.maximum(vor[order], 0.0)
+    rank = np.cumsum(draws, axis=1)
+    hit = draws & (rank == c + 1)
+    return (hit * values).sum(axis=1).mean()
+
+
+def main():
+    print("--- Draft Strategy Planner: verification and benchmark ---")
+
+    # --- Correctness: the vectorized normal CDF against math.erfc ---
+    x = np.linspace(-10.0, 10.0, 20_001)
+    exact = np.array([0.5 * math.erfc(-v / math.sqrt(2.0)) for v in x])
+    if not np.allclose(_normal_cdf(x), exact, rtol=1.2e-7, atol=0.0):
+        print("FATAL: the normal CDF differs from math.erfc.", file=sys.stderr)
+        sys.exit(1)
+    print("The normal CDF matches math.erfc to 1.2e-7 relative error. ✔️")
+
+    # --- Correctness: order statistics against sampling ---
+    adp, positions, vor = make_board(0)
+    rng = np.random.default_rng(1)
+    picks = my_picks(SLOT, TEAMS, 8)
+    availability = availability_from_adp(adp, picks)
+    rb = positions == "RB"
+    expected = expected_pick_values(vor[rb], availability[:, rb], 3)
+    for k in (0, 3, 7):
+        for c in range(3):
+            sampled = monte_carlo_order_statistic(vor[rb], availability[k, rb], c, rng)
+            if not np.isclose(expected[k, c], sampled, rtol=0.02, atol=0.05):
+                print(
+                    f"FATAL: pick {k}, depth {c}: {expected[k, c]:.3f} "
+                    f"vs sampled {sampled:.3f}.",
+                    file=sys.stderr,
+                )
+                sys.exit(1)
+    print("Expected best-available VOR matches sampled availability. ✔️")
+
+    # --- Correctness: the best plans against every position sequence ---
+    for seed in range(3):
+        adp, positions, vor = make_board(seed)
+        for rounds in (7, 8):
+            values = pick_values(adp, positions, vor, SMALL_ROSTER, rounds)
+            planned = plan_draft(values, SMALL_ROSTER, rounds, ALTERNATES)
+            exhaustive = exhaustive_plans(values, SMALL_ROSTER, rounds, ALTERNATES + 1)
+            if not np.allclose(
+                [v for v, _ in planned], [v for v, _ in exhaustive], atol=1e-9
+            ):
+                print(
+                    f"FATAL: plans differ for seed {seed}, {rounds} rounds.",
+                    file=sys.stderr,
+                )
+                sys.exit(1)
+    print(f"The top {ALTERNATES + 1} plans match exhaustive search over 6 boards. ✔️\n")
+
+    # --- Throughput ---
+    adp, positions, vor = make_board(7)
+    print(f"{'rounds':>6} {'sequences':>12} {'plan ms':>8}  best plan")
+    for rounds in ROUND_COUNTS:
+        values = pick_values(adp, positions, vor, LEAGUE_ROSTER, rounds)
+        start = time.perf_counter()
+        best = plan_draft(values, LEAGUE_ROSTER, rounds, ALTERNATES)
+        elapsed = time.perf_counter() - start
+        plan = "-".join(DRAFT_POSITIONS[code] for code in best[0][1])
+        print(
+            f"{rounds:>6} {len(DRAFT_POSITIONS) ** rounds:>12.1e} "
+            f"{elapsed * 1e3:>8.1f}  {plan}"
+        )
+    print("\n--- Benchmark Complete ---")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+import sys
+import time
+
+import numpy as np
+
+from backend import draft_sim
+from backend.constants import FLEX_POSITIONS
+from backend.settings import RosterSettings
+
+# --- Configuration ---
+N_PLAYERS = 330
+TEAMS = 12
+SLOT = 5
+SIMULATIONS = 20_000
+REFERENCE_DRAFTS = 200
+ROSTERS = [
+    RosterSettings(QB=2, RB=4, WR=4, TE=1, FLEX=0, K=1, DEF=1),
+    RosterSettings(QB=1, RB=2, WR=3, TE=1, FLEX=2, K=1, DEF=1),
+]
+
+
+def make_board(seed: int) -> tuple[np.ndarray, np.ndarray]:
+    """A board in VOR order with ADPs that roughly follow it."""
+    rng = np.random.default_rng(seed)
+    positions = rng.choice(
+        draft_sim.DRAFT_POSITIONS, N_PLAYERS, p=[0.12, 0.27, 0.33, 0.13, 0.07, 0.08]
+    )
+    adp = np.round(np.arange(1, N_PLAYERS + 1) * rng.uniform(0.7, 1.3, N_PLAYERS), 1)
+    return adp, positions
+
+
+def reference_availability(adp, positions, roster, rounds, simulations):
+    """The same drafts, one pick of one draft at a time with dictionaries."""
+    starters = {pos: getattr(roster, pos) for pos in draft_sim.DRAFT_POSITIONS}
+    order = draft_sim.snake_order(TEAMS, rounds)
+    rng = np.random.default_rng(0)
+    spread = np.maximum(draft_sim.ADP_SPREAD * adp, draft_sim.ADP_MIN_SD).astype(
+        np.float32
+    )
+    seen = np.zeros((int((order == SLOT - 1).sum()), len(adp)))
+
+    def penalty(counts, pos, picks_made):
+        surplus = {p: max(counts[p] - starters[p], 0) for p in starters}
+        flex_open = max(roster.FLEX - sum(surplus[p] for p in FLEX_POSITIONS), 0)
+        open_slots = max(starters[pos] - counts[pos], 0) + (
+            flex_open if pos in FLEX_POSITIONS else 0
+        )
+        unfilled = sum(max(starters[p] - counts[p], 0) for p in starters) + flex_open
+        if open_slots > 0:
+            return 0.0
+        if rounds - picks_made <= unfilled or pos in draft_sim.NO_BENCH_POSITIONS:
+            return np.inf
+        return TEAMS * (surplus[pos] + 1.0)
+
+    for start in range(0, simulations, draft_sim.BATCH_SIZE):
+        size = min(draft_sim.BATCH_SIZE, simulations - start)
+        drawn = adp.astype(np.float32) + spread * rng.standard_normal(
+            (size, len(adp)), dtype=np.float32
+        )
+        for d in range(size):
+            taken = set()
+            counts = [dict.fromkeys(starters, 0) for _ in range(TEAMS)]
+            my_pick = 0
+            for pick, team in enumerate(order):
+                if team == SLOT - 1:
+                    for p in range(len(adp)):
+                        seen[my_pick, p] += p not in taken
+                    my_pick += 1
+                    preference = np.arange(len(adp), dtype=np.float32)
+                else:
+                    preference = drawn[d]
+                penalties = {
+                    pos: penalty(counts[team], pos, pick // TEAMS) for pos in starters
+                }
+                scores = [
+                    np.inf
+                    if p in taken
+                    else float(preference[p]) + penalties[positions[p]]
+                    for p in range(len(adp))
+                ]
+                choice = int(np.argmin(scores))
+                if np.isinf(scores[choice]):
+                    choice = min(
+                        (p for p in range(len(adp)) if p not in taken),
+                        key=lambda p: preference[p],
+                    )
+                taken.add(choice)
+                counts[team][positions[choice]] += 1
+    return seen / simulations
+
+
+def main():
+    print("--- Draft Simulator: verification and benchmark ---")
+
+    # --- Correctness: the batched drafts against one-pick-at-a-time drafts ---
+    batch, draft_sim.BATCH_SIZE = draft_sim.BATCH_SIZE, 50
+    for seed, roster in enumerate(ROSTERS):
+        adp, positions = make_board(seed)
+        rounds = sum(roster.model_dump().values())
+        start = time.perf_counter()
+        expected = reference_availability(
+            adp, positions, roster, rounds, REFERENCE_DRAFTS
+        )
+        loop = (time.perf_counter() - start) / REFERENCE_DRAFTS
+        actual = draft_sim.simulate_availability(
+            adp, positions, roster, TEAMS, SLOT, rounds, REFERENCE_DRAFTS
+        )
+        if not np.array_equal(actual, expected):
+            print(f"FATAL: availability differs for roster {seed}.", file=sys.stderr)
+            sys.exit(1)
+    draft_sim.BATCH_SIZE = batch
+    print(
+        f"{REFERENCE_DRAFTS} drafts per roster match one-pick-at-a-time drafts exactly. ✔️"
+    )
+
+    adp, positions = make_board(7)
+    roster = ROSTERS[0]
+    rounds = sum(roster.model_dump().values())
+    first = draft_sim.simulate_availability(
+        adp, positions, roster, TEAMS, 1, rounds, 500
+    )
+    if not (first[0] == 1.0).all() or (np.diff(first, axis=0) > 0).any():
+        print("FATAL: availability is not 1 at pick 1 or rises later.", file=sys.stderr)
+        sys.exit(1)
+    try:
+        draft_sim.simulate_availability(
+            adp[: TEAMS * rounds - 1], positions, roster, TEAMS, 1, rounds, 10
+        )
+    except ValueError:
+        pass
+    else:
+        print("FATAL: a board too small for the draft was accepted.", file=sys.stderr)
+        sys.exit(1)
+    print(
+        "Everyone is available at pick 1, availability never rises and a short "
+        "board is refused. ✔️\n"
+    )
+
+    # --- Throughput ---
+    start = time.perf_counter()
+    availability = draft_sim.simulate_availability(
+        adp, positions, roster, TEAMS, SLOT, rounds, SIMULATIONS
+    )
+    batched = time.perf_counter() - start
+    print(f"{'approach':<24} {'drafts':>8} {'seconds':>8} {'ms/draft':>9}")
+    print(
+        f"{'one pick at a time':<24} {REFERENCE_DRAFTS:>8,} {loop * REFERENCE_DRAFTS:>8.2f} {loop * 1e3:>9.2f}"
+    )
+    print(
+        f"{'batched':<24} {SIMULATIONS:>8,} {batched:>8.2f} {batched / SIMULATIONS * 1e3:>9.3f}"
+    )
+    print(f"Speedup per draft: {loop / (batched / SIMULATIONS):.0f}x")
+    picks = draft_sim.my_picks(SLOT, TEAMS, rounds)
+    print(
+        f"Slot {SLOT}: players ADP 14-20 available at pick {picks[1]}: "
+        + ", ".join(f"{p:.2f}" for p in availability[1, (adp >= 14) & (adp <= 20)][:5])
+    )
+    print("\n--- Benchmark Complete ---")
+
+
+if __name__ == "__main__":
+    main()
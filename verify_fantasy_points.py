@@ -0,0 +1,220 @@
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from backend.data_sources.fantasypros import rescore_projections
+from backend.data_sources.historical import WEEKS, _parse_table, rescore_weekly_records
+from backend.pipelines.enrich import save_projection_stats
+from backend.storage.file_store import load_json
+from backend.transforms.fantasy_points import (
+    LOCAL_POSITIONS,
+    SCORING_PRESETS,
+    STATS,
+    fantasy_points,
+    scoring_weights,
+    source_stats,
+)
+
+# --- Configuration ---
+N_PLAYERS = 3_000
+POSITIONS = ["QB", "RB", "WR", "TE", "K", "DEF"]
+RULE_SETS = {
+    "STD": ("STD", {}),
+    "HALF": ("HALF", {}),
+    "PPR": ("PPR", {}),
+    "6pt pass TD, TE premium": ("PPR", {"pass_td": 6, "TE:rec": 1.5}),
+}
+
+
+def stats_table(seed: int) -> tuple[pd.DataFrame, dict[str, float]]:
+    """A weekly RB table shaped like FantasyPros' two header rows."""
+    rng = np.random.default_rng(seed)
+    n = 40
+    lines = {
+        ("RUSHING", "ATT"): rng.integers(0, 25, n),
+        ("RUSHING", "YDS"): rng.integers(-5, 180, n),
+        ("RUSHING", "TD"): rng.integers(0, 3, n),
+        ("RECEIVING", "REC"): rng.integers(0, 9, n),
+        ("RECEIVING", "TGT"): rng.integers(0, 12, n),
+        ("RECEIVING", "YDS"): rng.integers(0, 120, n),
+        ("RECEIVING", "TD"): rng.integers(0, 2, n),
+        ("MISC", "FL"): rng.integers(0, 2, n),
+    }
+    table = pd.DataFrame(
+        {
+            ("Unnamed: 0_level_0", "Rank"): np.arange(1, n + 1),
+            ("Unnamed: 1_level_0", "Player"): [
+                f"Runner Number{i} (KC)" for i in range(n)
+            ],
+            **lines,
+            ("MISC", "FPTS"): np.zeros(n),
+        }
+    )
+    table.columns = pd.MultiIndex.from_tuples(table.columns)
+    expected = (
+        0.1 * lines[("RUSHING", "YDS")]
+        + 6 * lines[("RUSHING", "TD")]
+        + 0.5 * lines[("RECEIVING", "REC")]
+        + 0.1 * lines[("RECEIVING", "YDS")]
+        + 6 * lines[("RECEIVING", "TD")]
+        - 2 * lines[("MISC", "FL")]
+    )
+    return table, dict(zip(clean_slugs(n), expected))
+
+
+def clean_slugs(n: int) -> list[str]:
+    return [f"runner-number{i}" for i in range(n)]
+
+
+def make_records(seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    positions = rng.choice(POSITIONS, N_PLAYERS)
+    stats = rng.integers(0, 120, (N_PLAYERS, len(WEEKS), len(STATS))).astype(float)
+    played = rng.random((N_PLAYERS, len(WEEKS))) > 0.2
+    return pd.DataFrame(
+        {
+            "slug": [f"player-{i}" for i in range(N_PLAYERS)],
+            "position": positions,
+            "team": "KC",
+            "scores": [
+                [round(float(rng.uniform(0, 20)), 1) if p else None for p in row]
+                for row in played
+            ],
+            "stats": [
+                [line.tolist() if p else None for line, p in zip(lines, row)]
+                for lines, row in zip(stats, played)
+            ],
+        }
+    )
+
+
+def make_projections(seed: int) -> pd.DataFrame:
+    """fetch_all_projections' shape; kickers and defenses have no stat line."""
+    rng = np.random.default_rng(seed)
+    positions = rng.choice(POSITIONS, N_PLAYERS)
+    stats = rng.integers(0, 400, (N_PLAYERS, len(STATS))).astype(float)
+    stats[~np.isin(positions, LOCAL_POSITIONS)] = np.nan
+    projections = pd.DataFrame(stats, columns=STATS)
+    projections.insert(0, "player_slug", [f"player-{i}" for i in range(N_PLAYERS)])
+    projections.insert(
+        1, "projection_fpts", np.round(rng.uniform(0, 300, N_PLAYERS), 1)
+    )
+    projections.insert(2, "team", "KC")
+    projections.insert(3, "position", positions)
+    return projections
+
+
+def per_player_points(records: pd.DataFrame, scoring: str, rules: dict) -> list:
+    """The same scores, one stat line at a time with the rule dictionaries."""
+    preset = SCORING_PRESETS[scoring]
+    scored = []
+    for position, scores, lines in zip(
+        records["position"], records["scores"], records["stats"]
+    ):
+        weights = {
+            **preset,
+            **{k: v for k, v in rules.items() if ":" not in k},
+            **{
+                k.split(":")[1]: v
+                for k, v in rules.items()
+                if k.split(":")[0] == position
+            },
+        }
+        row = []
+        for score, line in zip(scores, lines):
+            if line is None or position not in LOCAL_POSITIONS:
+                row.append(score)
+            else:
+                row.append(
+                    round(sum(weights.get(s, 0.0) * v for s, v in zip(STATS, line)), 2)
+                )
+        scored.append(row)
+    return scored
+
+
+def main():
+    print("--- Local Scoring Engine: verification and benchmark ---")
+
+    # --- Correctness: a FantasyPros-shaped table scores as HALF by hand ---
+    table, expected = stats_table(0)
+    stats = source_stats(table)
+    points = fantasy_points(
+        stats, np.full(len(table), "RB", dtype=object), scoring_weights("HALF")
+    )
+    if not np.allclose(points, list(expected.values())):
+        print("FATAL: HALF points of the stats table differ.", file=sys.stderr)
+        sys.exit(1)
+    parsed = _parse_table(table)
+    if [line for _, _, line in parsed.values()] != stats.tolist():
+        print("FATAL: the parsed table lost its stat lines.", file=sys.stderr)
+        sys.exit(1)
+    print("A two-row-header RB table scores exactly as HALF by hand. ✔️")
+
+    # --- Correctness: every rule set against per-player scoring ---
+    records = make_records(1)
+    timings = []
+    for label, (scoring, rules) in RULE_SETS.items():
+        start = time.perf_counter()
+        expected = per_player_points(records, scoring, rules)
+        loop = time.perf_counter() - start
+        start = time.perf_counter()
+        actual = rescore_weekly_records(records, scoring_weights(scoring, rules))
+        vectorized = time.perf_counter() - start
+        if actual != expected:
+            print(f"FATAL: '{label}' scores differ.", file=sys.stderr)
+            sys.exit(1)
+        timings.append((label, loop, vectorized))
+
+    # Saved projection stat lines rescore like one-week history.
+    with tempfile.TemporaryDirectory() as tmp:
+        save_projection_stats(Path(tmp), make_projections(2))
+        saved = pd.DataFrame(load_json(Path(tmp) / "projection_stats.json"))
+    as_weeks = saved.assign(
+        scores=[[fpts] for fpts in saved["projection_fpts"]],
+        stats=[[line] for line in saved["stats"]],
+    )
+    for label, (scoring, rules) in RULE_SETS.items():
+        expected = [row[0] for row in per_player_points(as_weeks, scoring, rules)]
+        actual = rescore_projections(saved, scoring_weights(scoring, rules))
+        if actual.tolist() != expected:
+            print(f"FATAL: '{label}' projections differ.", file=sys.stderr)
+            sys.exit(1)
+    try:
+        scoring_weights("HALF", {"K:fg": 3})
+    except ValueError:
+        pass
+    else:
+        print("FATAL: a rule for an unscored position was accepted.", file=sys.stderr)
+        sys.exit(1)
+    print(
+        f"{len(RULE_SETS)} rule sets match per-player scoring, saved projections "
+        "included; bad rules fail. ✔️\n"
+    )
+
+    # --- Throughput: one scrape, every rule set ---
+    print(
+        f"{'rule set':<26} {'player-weeks':>12} {'per-line ms':>12} {'rescore ms':>10}"
+    )
+    for label, loop, vectorized in timings:
+        print(
+            f"{label:<26} {N_PLAYERS * len(WEEKS):>12,} "
+            f"{loop * 1e3:>12.1f} {vectorized * 1e3:>10.1f}"
+        )
+    stats = np.random.default_rng(2).random((N_PLAYERS, len(WEEKS), len(STATS)))
+    positions = np.random.default_rng(2).choice(LOCAL_POSITIONS, N_PLAYERS)
+    weights = scoring_weights("PPR")
+    start = time.perf_counter()
+    fantasy_points(stats, positions, weights)
+    kernel = time.perf_counter() - start
+    print(
+        f"Scoring kernel alone: {kernel * 1e3:.1f} ms for {stats.size:,} stat values."
+    )
+    print("\n--- Benchmark Complete ---")
+
+
+if __name__ == "__main__":
+    main()
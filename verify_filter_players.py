@@ -0,0 +1,134 @@
+import random
+import sys
+import time
+
+from backend.logging_config import quiet_logs
+from backend.models import PlayerRaw
+from backend.settings import RelevanceSettings
+from backend.transforms.filter_players import prune_irrelevant_players
+
+# --- Configuration ---
+N_PLAYERS = 11_000
+REPEATS = 5
+POSITIONS = ["QB", "RB", "WR", "TE", "K", "DEF"]
+
+
+def player(player_id, first, last, position="WR", **fields) -> PlayerRaw:
+    return PlayerRaw(
+        player_id=player_id,
+        first_name=first,
+        last_name=last,
+        position=position,
+        team="KC",
+        **fields,
+    )
+
+
+# (player, expected reason or None when kept)
+CASES = [
+    (player("1", "Deep", "Backup", depth_chart_order=4), "depth_chart_order"),
+    (player("2", "Third", "String", depth_chart_order=3), None),
+    (player("3", "No", "Depth"), None),
+    (player("4", "Cut", "Candidate", status="Inactive"), "status:Inactive"),
+    (player("5", "Squad", "Member", status="Practice Squad"), "status:Practice Squad"),
+    (player("6", "Far", "Down", search_rank=1501), "search_rank"),
+    (player("7", "Edge", "Rank", search_rank=1500), None),
+    (player("8", "Team", "Defense", "DEF", search_rank=9_999_999), None),
+    (player("9", "Deep", "Defense", "DEF", depth_chart_order=9), None),
+    (player("10", "Idle", "Defense", "DEF", status="Inactive"), "status:Inactive"),
+    (player("11", "Kept", "ByName", depth_chart_order=5), None),
+    (player("12", "Kept", "ById", search_rank=9_999_999), None),
+]
+ALWAYS_KEEP = {"kept-byname", "12"}
+
+
+def make_players(seed: int = 6) -> list[PlayerRaw]:
+    rng = random.Random(seed)
+    return [
+        PlayerRaw(
+            player_id=str(i),
+            first_name=f"First{i}",
+            last_name=f"Last{i}",
+            position=rng.choice(POSITIONS),
+            team="KC",
+            status=rng.choice(["Active", "Active", "Inactive", "Practice Squad"]),
+            depth_chart_order=rng.choice([1, 2, 3, 4, 5, None]),
+            search_rank=rng.choice([rng.randint(1, 3_000), 9_999_999, None]),
+        )
+        for i in range(N_PLAYERS)
+    ]
+
+
+def main():
+    print("--- Relevance Pruning: verification and benchmark ---")
+    relevance = RelevanceSettings()
+    players = [p for p, _ in CASES]
+
+    # --- Correctness: every rule, its exemptions and the removal report ---
+    with quiet_logs():
+        kept, removed = prune_irrelevant_players(players, relevance, ALWAYS_KEEP)
+    reasons = {row["player_id"]: row["reason"] for row in removed}
+    for p, expected in CASES:
+        actual = reasons.get(p.player_id)
+        if actual != expected or (expected is None) != (p in kept):
+            print(
+                f"FATAL: {p.first_name} {p.last_name}: pruned for {actual}, "
+                f"expected {expected}.",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+    if [p.player_id for p in kept] != [p.player_id for p, r in CASES if r is None]:
+        print("FATAL: the kept players lost their order.", file=sys.stderr)
+        sys.exit(1)
+    if removed[0] != {
+        "player_id": "1",
+        "name": "Deep Backup",
+        "position": "WR",
+        "team": "KC",
+        "status": None,
+        "depth_chart_order": 4,
+        "search_rank": None,
+        "reason": "depth_chart_order",
+    }:
+        print(f"FATAL: unexpected report row: {removed[0]}", file=sys.stderr)
+        sys.exit(1)
+    print(
+        f"{len(CASES)} players: depth chart, status, search rank, the DEF "
+        "exemption and always_keep by slug and id prune as configured. ✔️"
+    )
+
+    # --- Correctness: disabled or unset limits keep players ---
+    with quiet_logs():
+        kept, removed = prune_irrelevant_players(
+            players, RelevanceSettings(enabled=False), set()
+        )
+    if kept != players or removed:
+        print("FATAL: disabled pruning changed the players.", file=sys.stderr)
+        sys.exit(1)
+    unlimited = RelevanceSettings(
+        max_depth_chart_order=None, max_search_rank=None, excluded_statuses=[]
+    )
+    with quiet_logs():
+        kept, removed = prune_irrelevant_players(players, unlimited, set())
+    if kept != players or removed:
+        print("FATAL: unset limits still pruned players.", file=sys.stderr)
+        sys.exit(1)
+    print("Disabled pruning and unset limits return the input unchanged. ✔️\n")
+
+    # --- Throughput: Sleeper's full dump ---
+    pool = make_players()
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        with quiet_logs():
+            kept, removed = prune_irrelevant_players(pool, relevance, set())
+        timings.append(time.perf_counter() - start)
+    print(f"{'players':>8} {'kept':>7} {'removed':>8} {'ms':>7}")
+    print(
+        f"{len(pool):>8,} {len(kept):>7,} {len(removed):>8,} {min(timings) * 1e3:>7.1f}"
+    )
+    print("\n--- Benchmark Complete ---")
+
+
+if __name__ == "__main__":
+    main()
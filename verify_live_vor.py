@@ -0,0 +1,164 @@
+import sys
+import time
+
+import numpy as np
+
+from backend.constants import FLEX_POSITIONS
+from backend.live_vor import LiveVor
+from backend.settings import RosterSettings
+from backend.transforms.compute_vor import compute_vor
+
+# --- Configuration ---
+TEAMS = 12
+ROSTERS = {
+    "1 FLEX": RosterSettings(QB=1, RB=2, WR=2, TE=1, FLEX=1, K=1, DEF=1),
+    "2 QB, no FLEX": RosterSettings(QB=2, RB=4, WR=4, TE=1, FLEX=0, K=1, DEF=1),
+    "3 FLEX, no K": RosterSettings(QB=1, RB=2, WR=3, TE=1, FLEX=3, K=0, DEF=1),
+}
+PENALTIES = {"RB": 0.85, "TE": 0.85, "DEF": 0.18}
+POSITIONS = ["QB", "RB", "WR", "TE", "K", "DEF"]
+CHECKED_OPERATIONS = 400
+BOARD_TOP = 25
+SIZES = [600, 2_000, 10_000]
+ROUNDS = 16
+
+
+def make_pool(seed: int, n: int):
+    """Players with tied and missing points, some without an ADP."""
+    rng = np.random.default_rng(seed)
+    positions = rng.choice(POSITIONS, n, p=[0.12, 0.25, 0.33, 0.14, 0.08, 0.08])
+    points = np.round(rng.gamma(2.0, 4.0, n), 1)
+    points[rng.random(n) < 0.02] = np.nan
+    listed = rng.random(n) < 0.7
+    return points, positions, listed
+
+
+def reference(points, positions, roster, remaining, penalties):
+    """The live levels and VOR by sorting the remaining players from scratch."""
+    drafted = {pos: int(np.sum(~remaining & (positions == pos))) for pos in POSITIONS}
+    levels, leftovers, surplus = {}, [], 0
+    for pos in POSITIONS:
+        slots = TEAMS * getattr(roster, pos)
+        left = points[remaining & (positions == pos)]
+        ordered = left[np.argsort(-left, kind="stable")]
+        open_slots = max(slots - drafted[pos], 0)
+        k = max(open_slots, 1)
+        levels[pos] = 0.0 if slots == 0 or k > len(ordered) else ordered[k - 1]
+        if pos in FLEX_POSITIONS:
+            leftovers.append(ordered[open_slots:])
+            surplus += max(drafted[pos] - slots, 0)
+    flex_slots = TEAMS * roster.FLEX
+    open_flex = flex_slots - min(surplus, flex_slots)
+    pool = np.concatenate(leftovers)
+    pool = pool[np.argsort(-pool, kind="stable")]
+    levels["FLEX"] = pool[open_flex - 1] if 0 < open_flex <= len(pool) else 0.0
+
+    vor = points - np.array([levels[pos] for pos in positions])
+    if open_flex > 0:
+        flex_vor = points - levels["FLEX"]
+        is_flex = np.isin(positions, FLEX_POSITIONS)
+        vor = np.where(is_flex & (flex_vor > vor), flex_vor, vor)
+    vor = vor * np.array([penalties.get(pos, 1.0) for pos in positions])
+    return levels, np.where(remaining, vor, np.nan)
+
+
+def check(engine, points, positions, roster, label):
+    levels, vor = reference(points, positions, roster, engine.remaining, PENALTIES)
+    actual = engine.levels
+    same_levels = all(
+        np.array_equal(actual[pos], levels[pos], equal_nan=True) for pos in levels
+    )
+    if not same_levels or not np.array_equal(engine.vor(), vor, equal_nan=True):
+        print(f"FATAL: {label}: levels or VOR differ from a re-rank.", file=sys.stderr)
+        sys.exit(1)
+    listed = np.flatnonzero(engine.remaining & engine.listed)
+    key = np.where(np.isnan(vor[listed]), np.inf, -vor[listed])
+    expected = listed[np.argsort(key, kind="stable")][:BOARD_TOP]
+    board = [i for i, _ in engine.best_available(BOARD_TOP)]
+    if board != expected.tolist():
+        print(f"FATAL: {label}: the board order differs.", file=sys.stderr)
+        sys.exit(1)
+
+
+def draft_order(points, seed):
+    """Roughly best-first picks, with noise."""
+    rng = np.random.default_rng(seed)
+    noisy = np.nan_to_num(points, nan=0.0) + rng.normal(0, 3, len(points))
+    return np.argsort(-noisy)
+
+
+def main():
+    print("--- Live-Draft VOR: verification and benchmark ---")
+
+    # --- Correctness: an empty draft is the preseason VOR ---
+    for label, roster in ROSTERS.items():
+        points, positions, listed = make_pool(0, 600)
+        engine = LiveVor(points, positions, roster, TEAMS, PENALTIES, listed)
+        vor, levels = compute_vor(points, positions, roster, TEAMS)
+        multiplier = np.array([PENALTIES.get(pos, 1.0) for pos in positions])
+        if not np.array_equal(engine.vor(), vor * multiplier, equal_nan=True) or any(
+            engine.levels[pos] != float(level) for pos, level in levels.items()
+        ):
+            print(f"FATAL: {label}: the empty draft differs.", file=sys.stderr)
+            sys.exit(1)
+    print(f"An empty draft matches compute_vor for {len(ROSTERS)} rosters. ✔️")
+
+    # --- Correctness: picks and undos against a re-rank after every step ---
+    for seed, (label, roster) in enumerate(ROSTERS.items()):
+        points, positions, listed = make_pool(seed + 1, 600)
+        engine = LiveVor(points, positions, roster, TEAMS, PENALTIES, listed)
+        rng = np.random.default_rng(seed)
+        order = iter(draft_order(points, seed))
+        for step in range(CHECKED_OPERATIONS):
+            if engine.history and rng.random() < 0.15:
+                undone = engine.undo()
+                order = iter([undone, *order])
+            else:
+                engine.pick(int(next(order)))
+            check(engine, points, positions, roster, f"{label}, step {step}")
+        while engine.history:
+            engine.undo()
+        check(engine, points, positions, roster, f"{label}, all undone")
+    print(
+        f"{CHECKED_OPERATIONS} picks and undos per roster match a full re-rank, "
+        "board order included. ✔️\n"
+    )
+
+    # --- Throughput: one whole draft ---
+    roster = ROSTERS["1 FLEX"]
+    picks = TEAMS * ROUNDS
+    print(
+        f"{'players':>8} {'picks':>6} {'re-rank us/pick':>16} "
+        f"{'live us/pick':>13} {'+ top 25 us':>12}"
+    )
+    for n in SIZES:
+        points, positions, listed = make_pool(9, n)
+        order = draft_order(points, 9)[:picks]
+        remaining = np.ones(n, dtype=bool)
+        start = time.perf_counter()
+        for i in order:
+            remaining[i] = False
+            reference(points, positions, roster, remaining, PENALTIES)
+        rerank = time.perf_counter() - start
+
+        engine = LiveVor(points, positions, roster, TEAMS, PENALTIES, listed)
+        start = time.perf_counter()
+        for i in order:
+            engine.pick(int(i))
+        live = time.perf_counter() - start
+        while engine.history:
+            engine.undo()
+        start = time.perf_counter()
+        for i in order:
+            engine.pick(int(i))
+            engine.best_available(BOARD_TOP)
+        board = time.perf_counter() - start
+        print(
+            f"{n:>8,} {picks:>6} {rerank / picks * 1e6:>16.0f} "
+            f"{live / picks * 1e6:>13.1f} {board / picks * 1e6:>12.0f}"
+        )
+    print("\n--- Benchmark Complete ---")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+import sys
+import time
+
+import pandas as pd
+
+from backend.logging_config import quiet_logs
+from backend.match_harness import build_synthetic_pool, load_ground_truth
+from backend.transforms.resolve_identity import UNRESOLVED, PlayerIdentityResolver
+
+# --- Configuration ---
+POOL_SIZES = [1_000, 5_000, 10_000]
+REPEATS = 3
+
+ROSTER = pd.DataFrame(
+    [
+        {"slug": "mike-williams", "position": "WR", "team": "NYJ", "search_rank": 90},
+        {"slug": "josh-allen", "position": "QB", "team": "BUF", "search_rank": 1},
+        {"slug": "taysom-hill", "position": "TE", "team": "NO", "search_rank": 300},
+        {"slug": "david-johnson", "position": "RB", "team": "NO", "search_rank": 500},
+        {"slug": "david-johnson", "position": "TE", "team": "LV", "search_rank": 400},
+    ]
+)
+ALIASES = {"taysom-hill-qb": "taysom-hill"}
+
+# (label, source slug, team, position, expected canonical row or UNRESOLVED)
+CASES = [
+    ("KC RB namesake of the Jets WR", "mike-williams", "KC", "RB", UNRESOLVED),
+    ("JAX DEF namesake of the Bills QB", "josh-allen", "JAX", "DST", UNRESOLVED),
+    ("same position, new team", "mike-williams", "PIT", "WR", 0),
+    ("same team, other position", "josh-allen", "BUF", "TE", 1),
+    ("no position or team", "josh-allen", None, None, 1),
+    ("explicit alias across positions", "taysom-hill-qb", "FA", "QB", 2),
+    ("shared slug, by position", "david-johnson", None, "RB", 3),
+    ("shared slug, by team", "david-johnson", "LV", None, 4),
+    ("name key, other partition", "josh-allen-jr", "JAX", "DST", UNRESOLVED),
+]
+
+
+def main():
+    print("--- Player Identity Resolver: verification and benchmark ---")
+
+    # --- Correctness: exact hits must share the record's position or team ---
+    # One record per batch, so no other record's claim can mask a wrong hit.
+    resolver = PlayerIdentityResolver(ROSTER, alias_map=ALIASES)
+    for label, slug, team, position, wanted in CASES:
+        with quiet_logs():
+            actual = int(resolver.resolve([slug], [team], [position], "verify")[0])
+        if actual != wanted:
+            print(
+                f"FATAL: {label}: resolved to {actual}, expected {wanted}.",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+    print(
+        f"{len(CASES)} slug, alias and name-key cases resolve only within the "
+        "record's position or team. ✔️\n"
+    )
+
+    # --- Throughput and accuracy on synthetic pools ---
+    truth = load_ground_truth()
+    print(f"{'players':>8} {'records':>8} {'precision':>10} {'recall':>8} {'ms':>8}")
+    for size in POOL_SIZES:
+        canonical, source, wanted = build_synthetic_pool(truth, size)
+        timings = []
+        for _ in range(REPEATS):
+            resolver = PlayerIdentityResolver(canonical)
+            start = time.perf_counter()
+            with quiet_logs():
+                ids = resolver.resolve(
+                    source["slug"].tolist(),
+                    source["team"].tolist(),
+                    source["position"].tolist(),
+                    "verify",
+                )
+            timings.append(time.perf_counter() - start)
+        found = [resolver.slugs[i] if i != UNRESOLVED else None for i in ids]
+        predicted = [i for i, slug in enumerate(found) if slug is not None]
+        correct = sum(found[i] == wanted[i] for i in predicted)
+        positives = sum(slug is not None for slug in wanted.values())
+        print(
+            f"{len(canonical):>8,} {len(source):>8,} "
+            f"{correct / max(len(predicted), 1):>10.3f} "
+            f"{correct / max(positives, 1):>8.3f} {min(timings) * 1e3:>8.1f}"
+        )
+    print("\n--- Benchmark Complete ---")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+import logging
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from backend.logging_config import log
+from backend.settings import settings
+from backend.sweep import ScoreSweep, build_settings
+from backend.transforms.adjustments import (
+    PlayerAdjustments,
+    load_boost_rules,
+    load_mimic_rules,
+)
+from backend.transforms.compute_vor import compute_vor
+from backend.transforms.scoring import score_players
+
+# --- Configuration ---
+# Roughly the size of players_with_ppg.json after the clean phase.
+N_PLAYERS = 3_000
+CHECKED_SETTINGS = 25
+BENCH_SETTINGS = 10_000
+POSITIONS = ["QB", "RB", "WR", "TE", "K", "DEF"]
+GRIDS = {
+    "weight_projection": np.array([0.4, 1.0]),
+    "boost_small": np.array([0.0, 0.3]),
+    "boost_medium": np.array([0.0, 0.5]),
+    "boost_large": np.array([0.0, 0.8]),
+    "boost_max": np.array([0.0, 2.0]),
+    "penalty_K": np.array([0.05, 1.0]),
+    "penalty_DEF": np.array([0.05, 1.0]),
+    "penalty_TE": np.array([0.5, 1.0]),
+}
+
+
+def make_players(boost_rules, mimic_rules, seed: int = 5) -> pd.DataFrame:
+    """A players_with_ppg frame whose first rows carry the boosted and mimic slugs."""
+    rng = np.random.default_rng(seed)
+    named = sorted(
+        {s for slugs in boost_rules.model_dump().values() for s in slugs}
+        | set(mimic_rules)
+        | set(mimic_rules.values())
+    )
+    slugs = named + [f"player-{i}" for i in range(N_PLAYERS - len(named))]
+    projected = rng.uniform(2, 25, N_PLAYERS)
+    history = rng.uniform(2, 25, N_PLAYERS)
+    return pd.DataFrame(
+        {
+            "slug": slugs,
+            "first_name": [s.split("-")[0] for s in slugs],
+            "last_name": [s.split("-", 1)[-1] for s in slugs],
+            "position": rng.choice(POSITIONS, N_PLAYERS),
+            "adp": np.where(
+                rng.random(N_PLAYERS) < 0.6, rng.uniform(1, 300, N_PLAYERS), np.nan
+            ),
+            "projected_ppg": np.where(rng.random(N_PLAYERS) < 0.8, projected, np.nan),
+            "top_n_avg": np.where(rng.random(N_PLAYERS) < 0.6, history, np.nan),
+        }
+    )
+
+
+def reference_order(players, cfg, boost_rules, mimic_rules) -> list[str]:
+    """One setting through the stats and VOR phase code, one player frame at a time."""
+    df = players.copy()
+    codes, uniques = pd.factorize(df["position"])
+    df["score"] = score_players(
+        df["projected_ppg"],
+        df["top_n_avg"],
+        codes,
+        len(uniques),
+        cfg.weight_projection,
+        cfg.weight_last_year,
+    ).score
+    adjustments = PlayerAdjustments(
+        df["slug"], df["position"], cfg, boost_rules, mimic_rules
+    )
+    df["expected_ppg"] = adjustments.apply_mimics(adjustments.apply_boosts(df["score"]))
+    df["vor"], _ = compute_vor(
+        df["expected_ppg"], df["position"], cfg.roster, cfg.teams
+    )
+    penalties = PlayerAdjustments(df["slug"], df["position"], cfg, apply_penalties=True)
+    df["vor"] = penalties.apply_penalties(df["vor"].to_numpy())
+    df = df.dropna(subset=["adp"]).sort_values(by="vor", ascending=False, kind="stable")
+    return df["slug"].tolist()
+
+
+def main():
+    print("--- Score Sweep: verification and benchmark ---")
+    log.setLevel(logging.ERROR)
+    cfg = settings.league_config
+    boost_rules = load_boost_rules(settings.BASE_DIR / "player_boost.json")
+    mimic_rules = load_mimic_rules(settings.BASE_DIR / "player_mimics.json")
+    players = make_players(boost_rules, mimic_rules)
+    sweep = ScoreSweep(players, cfg, boost_rules, mimic_rules)
+    ranked_slugs = players.loc[sweep.has_adp, "slug"].to_numpy()
+
+    # --- Correctness: every batched ranking equals the per-setting pipeline ---
+    table = build_settings(GRIDS, samples=CHECKED_SETTINGS, seed=1)
+    orders = sweep.orders(table)
+    for i in range(CHECKED_SETTINGS):
+        values = {name: float(column[i]) for name, column in table.items()}
+        penalties = {
+            **cfg.positional_penalties,
+            **{
+                k.removeprefix("penalty_"): v
+                for k, v in values.items()
+                if k.startswith("penalty_")
+            },
+        }
+        setting_cfg = cfg.model_copy(
+            update={
+                **{k: v for k, v in values.items() if not k.startswith("penalty_")},
+                "positional_penalties": penalties,
+            }
+        )
+        expected = reference_order(players, setting_cfg, boost_rules, mimic_rules)
+        if ranked_slugs[orders[i]].tolist() != expected:
+            print(
+                f"FATAL: setting {values} ranks players differently.", file=sys.stderr
+            )
+            sys.exit(1)
+    print(f"{CHECKED_SETTINGS} random settings rank exactly as the pipeline does. ✔️\n")
+
+    # --- Throughput ---
+    table = build_settings(GRIDS, samples=BENCH_SETTINGS, seed=2)
+    start = time.perf_counter()
+    result = sweep.run(table)
+    elapsed = time.perf_counter() - start
+    print(f"{'settings':>9} {'players':>8} {'seconds':>8} {'settings/s':>11}")
+    print(
+        f"{BENCH_SETTINGS:>9,} {N_PLAYERS:>8,} {elapsed:>8.2f} {BENCH_SETTINGS / elapsed:>11,.0f}"
+    )
+    print(f"Median Spearman vs. baseline: {np.median(result.spearman):.4f}")
+    print("\n--- Benchmark Complete ---")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from pydantic import ValidationError
+
+from backend.settings import LeagueConfig
+from backend.transforms.compute_vor import compute_vor
+
+# --- Configuration ---
+LEAGUE_CONFIG_FILES = sorted(Path("backend").glob("league_config*.json"))
+# Roughly the size of players_with_ppg.json after the clean phase.
+PLAYER_COUNT = 600
+BENCH_SCALE = 10
+SCENARIOS = 1_000
+REPEATS = 5
+POSITION_WEIGHTS = {
+    "QB": 0.12,
+    "RB": 0.25,
+    "WR": 0.33,
+    "TE": 0.14,
+    "K": 0.08,
+    "DEF": 0.08,
+}
+
+
+def legacy_calculate_vor(
+    df: pd.DataFrame, cfg: LeagueConfig
+) -> tuple[pd.DataFrame, dict]:
+    """The pre-existing calculate_vor, verbatim apart from taking cfg as an argument."""
+    roster = cfg.roster
+    replacement_levels = {}
+    for pos, starters in roster.model_dump().items():
+        if pos == "FLEX":
+            continue
+        pos_df = df[df["position"] == pos].sort_values("expected_ppg", ascending=False)
+        replacement_idx = cfg.teams * starters
+        if 0 < replacement_idx <= len(pos_df):
+            replacement_levels[pos] = pos_df.iloc[replacement_idx - 1]["expected_ppg"]
+        else:
+            replacement_levels[pos] = 0.0
+    if roster.FLEX > 0:
+        flex_pool = pd.concat(
+            [
+                df[df["position"] == "RB"].iloc[cfg.teams * roster.RB :],
+                df[df["position"] == "WR"].iloc[cfg.teams * roster.WR :],
+                df[df["position"] == "TE"].iloc[cfg.teams * roster.TE :],
+            ]
+        ).sort_values("expected_ppg", ascending=False)
+        flex_replacement_idx = cfg.teams * roster.FLEX
+        if 0 < flex_replacement_idx <= len(flex_pool):
+            replacement_levels["FLEX"] = flex_pool.iloc[flex_replacement_idx - 1][
+                "expected_ppg"
+            ]
+        else:
+            replacement_levels["FLEX"] = 0.0
+    else:
+        replacement_levels["FLEX"] = 0.0
+
+    def get_player_vor(row):
+        pos_vor = row["expected_ppg"] - replacement_levels.get(row["position"], 0.0)
+        if row["position"] in ["RB", "WR", "TE"] and cfg.roster.FLEX > 0:
+            flex_vor = row["expected_ppg"] - replacement_levels.get("FLEX", 0.0)
+            return max(pos_vor, flex_vor)
+        return pos_vor
+
+    df["vor"] = df.apply(get_player_vor, axis=1)
+    return df, replacement_levels
+
+
+def make_players(n_players: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    positions = rng.choice(
+        list(POSITION_WEIGHTS), size=n_players, p=list(POSITION_WEIGHTS.values())
+    )
+    # Rounded so ties are common, as they are after the boost tiers.
+    points = np.round(rng.gamma(2.0, 4.0, size=n_players), 1)
+    points[rng.random(n_players) < 0.01] = np.nan
+    return pd.DataFrame({"position": positions, "expected_ppg": points})
+
+
+def engine_vor(df: pd.DataFrame, cfg: LeagueConfig):
+    return compute_vor(
+        df["expected_ppg"].to_numpy(dtype=np.float64),
+        df["position"].to_numpy(dtype=object),
+        cfg.roster,
+        cfg.teams,
+    )
+
+
+def best_of(func) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    print("--- VOR Engine Verification: legacy calculate_vor vs compute_vor ---")
+    configs = {}
+    for path in LEAGUE_CONFIG_FILES:
+        try:
+            configs[path.name] = LeagueConfig(**json.loads(path.read_text()))
+        except ValidationError as e:
+            print(f"  Skipping {path.name}: {e.error_count()} validation error(s).")
+    # None of the shipped leagues use FLEX yet; cover it with variants.
+    for name, cfg in list(configs.items()):
+        if cfg.roster.FLEX == 0:
+            flex_roster = cfg.roster.model_copy(update={"FLEX": 2})
+            configs[f"{name} (+2 FLEX)"] = cfg.model_copy(
+                update={"roster": flex_roster}
+            )
+
+    # --- Correctness ---
+    # The legacy FLEX pool slices unsorted per-position frames, so it is only
+    # correct when its input is already sorted by expected_ppg; compare there.
+    # On unsorted input only the positional levels must agree.
+    for name, cfg in configs.items():
+        for seed in range(5):
+            players = make_players(PLAYER_COUNT, seed)
+            presorted = players.sort_values(
+                "expected_ppg", ascending=False
+            ).reset_index(drop=True)
+
+            legacy_df, legacy_levels = legacy_calculate_vor(presorted.copy(), cfg)
+            vor, levels = engine_vor(presorted, cfg)
+            same_levels = all(
+                np.array_equal(legacy_levels[pos], levels[pos], equal_nan=True)
+                for pos in legacy_levels
+            )
+            if not same_levels or not np.array_equal(
+                legacy_df["vor"].to_numpy(), vor, equal_nan=True
+            ):
+                print(
+                    f"FATAL: mismatch on sorted input for {name} (seed {seed}).",
+                    file=sys.stderr,
+                )
+                sys.exit(1)
+
+            _, unsorted_levels = legacy_calculate_vor(players.copy(), cfg)
+            _, levels = engine_vor(players, cfg)
+            for pos, level in unsorted_levels.items():
+                if pos != "FLEX" and not np.array_equal(
+                    level, levels[pos], equal_nan=True
+                ):
+                    print(
+                        f"FATAL: {pos} level mismatch for {name} (seed {seed}).",
+                        file=sys.stderr,
+                    )
+                    sys.exit(1)
+            if cfg.roster.FLEX > 0 and seed == 0:
+                print(
+                    f"  {name}: FLEX level on unsorted input, legacy {unsorted_levels['FLEX']:.1f} "
+                    f"vs engine {float(levels['FLEX']):.1f} (legacy slices unsorted frames)"
+                )
+    print(
+        f"compute_vor matches legacy calculate_vor on {len(configs)} league configs. ✔️\n"
+    )
+
+    # --- Benchmark at 10x the player count ---
+    cfg = configs.get("league_config.json", next(iter(configs.values())))
+    players = make_players(PLAYER_COUNT * BENCH_SCALE, seed=42)
+    legacy = best_of(lambda: legacy_calculate_vor(players.copy(), cfg))
+    engine = best_of(lambda: engine_vor(players, cfg))
+    print(f"{'players':>8} {'legacy (ms)':>12} {'engine (ms)':>12} {'speedup':>8}")
+    print(
+        f"{len(players):>8,} {legacy * 1e3:>12.1f} {engine * 1e3:>12.2f} {legacy / engine:>7.0f}x"
+    )
+
+    # The engine also evaluates many point estimates in one call.
+    rng = np.random.default_rng(0)
+    base = players["expected_ppg"].to_numpy()
+    scenarios = base * rng.normal(1.0, 0.1, size=(SCENARIOS, len(base)))
+    positions = players["position"].to_numpy(dtype=object)
+    batched = best_of(lambda: compute_vor(scenarios, positions, cfg.roster, cfg.teams))
+    print(
+        f"\n{SCENARIOS:,} scenarios x {len(base):,} players in one call: {batched * 1e3:.1f} ms "
+        f"({batched / SCENARIOS * 1e6:.0f} µs per scenario)"
+    )
+    print("\n--- Verification Complete ---")
+
+
+if __name__ == "__main__":
+    main()